@@ -0,0 +1,7 @@
+"""Benchmarks of hiargparse (not installed with the package).
+
+Run the suite on a synthetic provider tree with `python -m benchmarks`
+and the slotted access comparison with `python -m benchmarks.slotted_access`;
+config_formats.py and value_dump.py are standalone scripts.
+The thread-safety stress check is tests/test_thread_safety.py.
+"""
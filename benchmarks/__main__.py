@@ -0,0 +1,86 @@
+"""Run the benchmark suite on a synthetic provider tree.
+
+usage: python -m benchmarks [--depth 3] [--fan-out 3] [--args-per-node 10]
+                            [--propagation-density 0.1] [--distinct-children]
+                            [--repeat 5] [--output result.json] [--baseline old.json]
+                            [--memory-budget total=1000000 ...]
+
+Exits with 1 if any memory budget (in bytes, per category of MemoryReport or total)
+is exceeded.
+"""
+import argparse
+import json
+import platform
+import sys
+from typing import Dict, Any
+
+import hiargparse
+
+from .suite import run_suite
+from .synthetic_trees import TreeShape
+
+
+def print_timings(result: Dict[str, Any], baseline: Dict[str, Any] = None) -> None:
+    base_timings = baseline['timings'] if baseline is not None else dict()
+    print('{:>20} {:>12} {:>12} {:>10}'.format('operation', 'best [ms]', 'median [ms]',
+                                                'vs base'))
+    for name, timing in result['timings'].items():
+        ratio = ''
+        if name in base_timings:
+            ratio = '{:.2f}x'.format(timing['best'] / base_timings[name]['best'])
+        print('{:>20} {:>12.3f} {:>12.3f} {:>10}'.format(
+            name, timing['best'] * 1e3, timing['median'] * 1e3, ratio))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    defaults = TreeShape()
+    parser.add_argument('--depth', type=int, default=defaults.depth)
+    parser.add_argument('--fan-out', type=int, default=defaults.fan_out)
+    parser.add_argument('--args-per-node', type=int, default=defaults.args_per_node)
+    parser.add_argument('--propagation-density', type=float,
+                        default=defaults.propagation_density)
+    parser.add_argument('--distinct-children', action='store_true',
+                        help='make every node a distinct provider instead of duplicated classes')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='write the results as json to this path')
+    parser.add_argument('--baseline', help='compare with the json results of another run')
+    parser.add_argument('--memory-budget', nargs='+', default=[], metavar='CATEGORY=BYTES',
+                        help='fail if the retained memory exceeds the budget')
+    params = parser.parse_args()
+    memory_budgets = dict()
+    for budget in params.memory_budget:
+        category, size = budget.split('=')
+        memory_budgets[category] = int(size)
+
+    shape = TreeShape(depth=params.depth, fan_out=params.fan_out,
+                      args_per_node=params.args_per_node,
+                      propagation_density=params.propagation_density,
+                      duplicate_children=not params.distinct_children)
+    result = run_suite(shape, repeat=params.repeat, memory_budgets=memory_budgets)
+    result['environment'] = dict(python=sys.version, platform=platform.platform(),
+                                 hiargparse=hiargparse.__version__)
+
+    baseline = None
+    if params.baseline is not None:
+        with open(params.baseline) as f:
+            baseline = json.load(f)
+    print(json.dumps(result['sizes']))
+    for name, reason in result['skipped_formats'].items():
+        print('skipped {}: {}'.format(name, reason))
+    print_timings(result, baseline)
+    print('retained memory [KiB]: ' + ', '.join(
+        '{}={:.1f}'.format(category, size / 1024)
+        for category, size in result['memory']['totals'].items()))
+    if params.output is not None:
+        with open(params.output, 'w') as f:
+            json.dump(result, f, indent=2)
+    for message in result['memory']['exceeded_budgets']:
+        print(message)
+    if result['memory']['exceeded_budgets']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Compare load time of the same configure file among all ConfigureFileTypes.
+
+usage: python benchmarks/config_formats.py [--keys 10000] [--repeat 5]
+"""
+import argparse
+import json
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Dict, Any, Callable
+
+import toml
+import yaml
+
+from hiargparse import ConfigureFileType
+from hiargparse.file_protocols import binary_format
+
+
+_DUMPERS: Dict[ConfigureFileType, Callable[[Dict[str, Any]], bytes]] = {
+    ConfigureFileType.toml: lambda contents: toml.dumps(contents).encode('utf-8'),
+    ConfigureFileType.yaml: lambda contents: yaml.safe_dump(contents).encode('utf-8'),
+    ConfigureFileType.json: lambda contents: json.dumps(contents).encode('utf-8'),
+    ConfigureFileType.binary: binary_format.dumps,
+}
+
+
+def make_contents(num_keys: int, keys_per_section: int = 100) -> Dict[str, Any]:
+    """Make a nested config with num_keys leaves of mixed value types."""
+    contents: Dict[str, Any] = dict()
+    for i in range(num_keys):
+        section = contents.setdefault('section{}'.format(i // keys_per_section), dict())
+        if i % 3 == 0:
+            value: Any = i
+        elif i % 3 == 1:
+            value = i * 0.5
+        else:
+            value = 'value-{}'.format(i)
+        section['key{}'.format(i)] = value
+    return contents
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--keys', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    params = parser.parse_args()
+
+    contents = make_contents(params.keys)
+    with tempfile.TemporaryDirectory() as directory:
+        print('{:>8} {:>12} {:>12}'.format('format', 'size [B]', 'load [ms]'))
+        for file_type in ConfigureFileType:
+            path = Path(directory) / 'config.{}'.format(file_type.name)
+            path.write_bytes(_DUMPERS[file_type](contents))
+            reader = file_type.get_reader()
+            assert len(reader.read_normalized_dict(path)) == params.keys
+            best = min(timeit.repeat(lambda: reader.read_normalized_dict(path),
+                                     number=1, repeat=params.repeat))
+            print('{:>8} {:>12} {:>12.2f}'.format(file_type.name, path.stat().st_size, best * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Compare reading deep parameters from a Namespace and from the slotted classes.
+
+usage: python -m benchmarks.slotted_access [--depth 3] [--number 1000000]
+"""
+import argparse
+import timeit
+
+from hiargparse import ArgumentParser
+
+from .synthetic_trees import TreeShape, make_provider
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--number', type=int, default=1000000)
+    params = parser.parse_args()
+
+    provider = make_provider(TreeShape(depth=params.depth, fan_out=2, args_per_node=5))
+    hiargparse_parser = ArgumentParser()
+    provider.add_arguments_to_parser(hiargparse_parser)
+    namespace = hiargparse_parser.parse_args([])
+    Params = provider.make_params_class()
+    slotted = Params.from_namespace(namespace)
+
+    # the deepest argument like params.node0.node0.node0.arg0
+    path = '.'.join(['node0'] * params.depth + ['arg0'])
+    scope = dict(namespace=namespace, slotted=slotted, Params=Params)
+    conversion = timeit.timeit('Params.from_namespace(namespace)', globals=scope, number=1000)
+    print('conversion: {:.1f} us'.format(conversion / 1000 * 1e6))
+    for name in ('namespace', 'slotted'):
+        seconds = timeit.timeit('{}.{}'.format(name, path), globals=scope, number=params.number)
+        print('{}.{}: {:.1f} ns'.format(name, path, seconds / params.number * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Time the main operations of hiargparse on a synthetic provider tree."""
+import io
+import statistics
+import time
+from typing import Callable, Dict, Any, List, TypeVar
+
+from hiargparse import ArgumentParser, ConfigureFileType, measure_memory
+from hiargparse.miscs import DirtyAccessToArgparse
+
+from .synthetic_trees import TreeShape, make_provider, make_argv
+
+
+StateT = TypeVar('StateT')
+
+
+def measure(
+        operation: Callable[[StateT], Any],
+        setup: Callable[[], StateT],
+        repeat: int
+) -> Dict[str, Any]:
+    """Run setup and then time operation, repeat times.
+
+    Returns the best and the median in seconds.
+    """
+    timings: List[float] = []
+    for _ in range(repeat):
+        state = setup()
+        begin = time.perf_counter()
+        operation(state)
+        timings.append(time.perf_counter() - begin)
+    return dict(best=min(timings), median=statistics.median(timings), repeat=repeat)
+
+
+def run_suite(
+        shape: TreeShape,
+        repeat: int = 5,
+        memory_budgets: Dict[str, int] = None
+) -> Dict[str, Any]:
+    """Run all the benchmarks on a tree of the shape.
+
+    Returns a JSON-serializable dict with the shape, the sizes of the tree,
+    the timings keyed by the operation names
+    and the retained memory of a parser and its namespace (see measure_memory)
+    with the memory_budgets (see MemoryReport.exceeded_budgets) exceeded.
+    """
+    # the same instance is reused, so disable the template cache to measure rendering
+    def make_uncached_provider() -> Any:
+        provider = make_provider(shape)
+        provider.template_cache = None
+        return provider
+
+    def make_parser() -> Any:
+        provider = make_uncached_provider()
+        parser = ArgumentParser()
+        provider.add_arguments_to_parser(parser)
+        return provider, parser
+
+    provider, parser = make_parser()
+    actions = [action for action in DirtyAccessToArgparse.get_actions(parser)
+               if action.dest != 'help']
+    dests = [action.dest for action in actions]
+    argv = make_argv([action.option_strings[0] for action in actions])
+    namespace = parser.parse_args(argv)
+    sizes = dict(nodes=shape.num_nodes, actions=len(actions),
+                 propagations=len(provider._propagate_attributes), argv_tokens=len(argv))
+
+    def make_namespace() -> Any:
+        return namespace._copy()
+
+    timings: Dict[str, Dict[str, Any]] = dict()
+    timings['registration'] = measure(
+        lambda provider: provider.add_arguments_to_parser(ArgumentParser()),
+        make_uncached_provider, repeat)
+    timings['parse_args'] = measure(
+        lambda parser: parser.parse_args(argv), lambda: parser, repeat)
+    timings['apply_propagations'] = measure(
+        provider.apply_propagations, make_namespace, repeat)
+    timings['namespace_get'] = measure(
+        lambda namespace: [namespace[dest] for dest in dests], make_namespace, repeat)
+    timings['namespace_set'] = measure(
+        lambda namespace: [namespace.__setitem__(dest, 0) for dest in dests],
+        make_namespace, repeat)
+    timings['namespace_copy'] = measure(lambda namespace: namespace._copy(),
+                                        make_namespace, repeat)
+    timings['namespace_asdict'] = measure(lambda namespace: namespace._asdict(),
+                                          make_namespace, repeat)
+
+    skipped_formats: Dict[str, str] = dict()
+    for file_type in ConfigureFileType:
+        try:
+            file_type.get_reader()
+        except ImportError as exc:
+            skipped_formats[file_type.name] = str(exc)
+            continue
+        # write the parsed values so that reading converts and parses every value
+        document = io.BytesIO()
+        provider.write_configure_file(document, file_type.get_writer(), namespace=namespace)
+        data = document.getvalue()
+
+        timings['write_{}'.format(file_type.name)] = measure(
+            lambda provider: provider.write_configure_file(io.BytesIO(),
+                                                           file_type.get_writer()),
+            make_uncached_provider, repeat)
+        timings['read_{}'.format(file_type.name)] = measure(
+            lambda provider: provider.read_configure_file(io.BytesIO(data),
+                                                          file_type.get_reader()),
+            make_uncached_provider, repeat)
+
+    memory = measure_memory(make_provider(shape), argv)
+    return dict(
+        shape=shape._asdict(),
+        sizes=sizes,
+        skipped_formats=skipped_formats,
+        timings=timings,
+        memory=dict(total=memory.total(),
+                    totals={category: memory.total(category) for category in memory.CATEGORIES},
+                    by_path=memory.as_dict(),
+                    exceeded_budgets=memory.exceeded_budgets(memory_budgets or dict())),
+    )
@@ -0,0 +1,91 @@
+"""Synthetic ArgsProvider trees for the benchmarks."""
+from typing import NamedTuple, List, Any, Type
+
+from hiargparse import ArgsProvider, Arg, ChildProvider
+
+
+class TreeShape(NamedTuple):
+    """Parameters of a synthetic provider tree.
+
+    Args:
+        depth: levels of child providers below the root (0 for the root only).
+        fan_out: child providers per node.
+        args_per_node: Args per node.
+        propagation_density: fraction of the root Args propagated to all the descendants.
+        duplicate_children: if True, the siblings are the same class with different names
+                            (like several tires of a car); otherwise each node is distinct.
+    """
+    depth: int = 3
+    fan_out: int = 3
+    args_per_node: int = 10
+    propagation_density: float = 0.1
+    duplicate_children: bool = True
+
+    @property
+    def num_nodes(self) -> int:
+        return sum(self.fan_out ** level for level in range(self.depth + 1))
+
+    @property
+    def num_propagated_args(self) -> int:
+        return int(round(self.args_per_node * self.propagation_density))
+
+
+def _arg_default(index: int) -> Any:
+    if index % 3 == 0:
+        return index
+    elif index % 3 == 1:
+        return index * 0.5
+    return 'value-{}'.format(index)
+
+
+def _make_args(shape: TreeShape, is_root: bool) -> List[Arg]:
+    args = list()
+    for index in range(shape.args_per_node):
+        name = 'arg{}'.format(index)
+        if index < shape.num_propagated_args:
+            # propagated from the root to the descendants
+            propagate = True if is_root else None
+        else:
+            # the same names among the nodes are different arguments
+            propagate = False
+        args.append(Arg(name, _arg_default(index), propagate=propagate,
+                        help='synthetic argument {}. %(default-text)s'.format(index)))
+    return args
+
+
+def _make_node_class(shape: TreeShape, level: int) -> Type[Any]:
+    """Make a class whose children are fan_out instances of the same class."""
+    child_class = _make_node_class(shape, level + 1) if level < shape.depth else None
+
+    def get_args_provider(cls: Any) -> ArgsProvider:
+        children = list()
+        if child_class is not None:
+            children = [ChildProvider(child_class, name='node{}'.format(index))
+                        for index in range(shape.fan_out)]
+        return ArgsProvider(args=_make_args(shape, level == 0), child_providers=children)
+
+    return type('Level{}'.format(level), (), dict(get_args_provider=classmethod(get_args_provider)))
+
+
+def _make_distinct_node(shape: TreeShape, level: int) -> ArgsProvider:
+    children = list()
+    if level < shape.depth:
+        children = [ChildProvider(provider=_make_distinct_node(shape, level + 1),
+                                  name='node{}'.format(index))
+                    for index in range(shape.fan_out)]
+    return ArgsProvider(args=_make_args(shape, level == 0), child_providers=children)
+
+
+def make_provider(shape: TreeShape) -> ArgsProvider:
+    """Make the root provider of the tree."""
+    if shape.duplicate_children:
+        return _make_node_class(shape, 0).get_args_provider()
+    return _make_distinct_node(shape, 0)
+
+
+def make_argv(option_strings: List[str], every: int = 10) -> List[str]:
+    """Give a value to every n-th option (of the ones which take one value)."""
+    argv = list()
+    for option_string in option_strings[::every]:
+        argv += [option_string, '1']
+    return argv
@@ -0,0 +1,63 @@
+"""Compare dumping actual Namespace values by the dict writers with yaml.dump.
+
+usage: python benchmarks/value_dump.py [--sections 100] [--args 100] [--repeat 5]
+"""
+import argparse
+import io
+import timeit
+
+import yaml
+
+from hiargparse import ArgsProvider, Arg, ChildProvider, ConfigureFileType
+
+
+def make_provider(num_sections: int, args_per_section: int) -> ArgsProvider:
+    """Make a provider with num_sections children which have args of mixed types."""
+    def make_args(section: int):
+        args = list()
+        for i in range(args_per_section):
+            if i % 3 == 0:
+                default = i  # type: object
+            elif i % 3 == 1:
+                default = i * 0.5
+            else:
+                default = 'value-{}-{}'.format(section, i)
+            args.append(Arg('key{}'.format(i), default))
+        return args
+
+    children = list()
+    for section in range(num_sections):
+        child_class = type('Section{}'.format(section), (), dict(
+            get_args_provider=staticmethod(
+                lambda section=section: ArgsProvider(args=make_args(section)))))
+        children.append(ChildProvider(child_class))
+    return ArgsProvider(child_providers=children)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sections', type=int, default=100)
+    parser.add_argument('--args', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    params = parser.parse_args()
+
+    provider = make_provider(params.sections, params.args)
+    namespace = provider.resolve([]).namespace
+    cases = [
+        ('yaml.dump', lambda: yaml.dump(namespace._asdict())),
+        ('yaml.safe_dump', lambda: yaml.safe_dump(namespace._asdict())),
+    ]
+    for file_type in (ConfigureFileType.yaml, ConfigureFileType.toml, ConfigureFileType.json):
+        cases.append((
+            '{} writer'.format(file_type.name),
+            lambda file_type=file_type: provider.write_configure_arguments_to(
+                io.StringIO(), file_type.get_writer(), namespace)))
+
+    print('{:>16} {:>12}'.format('method', 'dump [ms]'))
+    for name, dump in cases:
+        best = min(timeit.repeat(dump, number=1, repeat=params.repeat))
+        print('{:>16} {:>12.2f}'.format(name, best * 1e3))
+
+
+if __name__ == '__main__':
+    main()
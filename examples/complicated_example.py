@@ -60,7 +60,8 @@ class Car:
                     help='%(default-text)s This arg is for its tires. '),
 
                 # Complicated type, nargs, metavars are OK
-                Arg('numbers-you-like', type=complicated_type,
+                # a pure (and slow) type can memoize its conversions by type_cache_size
+                Arg('numbers-you-like', type=complicated_type, type_cache_size=256,
                     nargs=3, metavar=('Hop', 'Step', 'Jump'))
 
                 # if you have some name-conflicted arguments, hiargparse will warn it.
@@ -0,0 +1,38 @@
+from hiargparse import ArgsProvider, Arg, ChildProvider
+from hiargparse import FileSource, MappingSource, EnvironSource, ArgvSource, ConfigureFileType
+
+# just same as example.py
+from example import Son
+
+from pathlib import Path
+
+
+if __name__ == '__main__':
+    args_provider = ArgsProvider(
+        args=[
+            Arg('config', type=Path, nargs='*', default=[],
+                help='%(default-text)s Configure files (yaml) to read in order. ')
+        ],
+        child_providers=[ChildProvider(Son)]
+    )
+
+    # sources are given from the lowest priority to the highest one;
+    # values are merged into one table and argparse runs only once
+    # (note that propagated args like Son/GrandSon/huga cannot be given)
+    argv_source = ArgvSource()
+    config_paths = args_provider.resolve([argv_source]).namespace.config
+    resolution = args_provider.resolve(
+        [MappingSource({'Son': {'hoge': 0}}, name='application defaults')]
+        + [FileSource(path, ConfigureFileType.yaml) for path in config_paths]
+        # environment variables like EXAMPLE_SON_HOGE=3
+        + [EnvironSource(prefix='EXAMPLE_')]
+        + [argv_source]
+    )
+    params = resolution.namespace
+
+    # you can see where each value came from
+    # try to execute with --config FILE_PATH [FILE_PATH ...] --Son-piyo 0.5
+    for option, source_name in resolution.provenance.items():
+        print('{} is given by {}'.format(option, source_name))
+    son = Son(params.Son)
+    son.print_()
@@ -34,8 +34,8 @@ if __name__ == '__main__':
     if params.write_to is not None:
         path_w: Path = params.write_to
         # write configure arguments to the given file as the given type
-        with path_w.open('w') as f:
-            f.write(args_provider.write_out_configure_arguments(file_type.get_writer()))
+        # (write_out_configure_arguments is also available if you want a str)
+        args_provider.write_configure_file(path_w, file_type.get_writer())
         # When you want to write out a configure file,
         # usually you want to stop this program, fill in
         # your brand-new configure file, and then restart it.
@@ -44,8 +44,8 @@ if __name__ == '__main__':
     if params.read_from is not None:
         path_r: Path = params.read_from
         # read configure arguments from the given file
-        with path_r.open('r') as f:
-            read_params = args_provider.read_configure_arguments(f.read(), file_type.get_reader())
+        # (read_configure_arguments is also available if you already have the document as str)
+        read_params = args_provider.read_configure_file(path_r, file_type.get_reader())
 
         # Usually you want to overwrite the parameters from the file
         # with the parameters from program arguments.
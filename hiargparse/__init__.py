@@ -1,14 +1,22 @@
 from hiargparse.alternatives import Namespace, ArgumentParser
+from hiargparse.miscs import instrument, InstrumentationReport, MemoizedType, type_cache_info
 from hiargparse.file_protocols import ConfigureFileType
-from hiargparse.args_providers import ArgsProvider, Arg, ChildProvider
+from hiargparse.sources import FileSource, MappingSource, ArgvSource, EnvironSource, ConfigWatcher
+from hiargparse.args_providers import ArgsProvider, Arg, ChildProvider, Resolution, TemplateCache
+from hiargparse.args_providers import ConfigureBatch, MemoryReport, measure_memory, CompiledSpec
+from hiargparse.args_providers import CompletionIndex, completion_script, SlottedParams
 from hiargparse.args_providers import ArgumentError, ConflictWarning, PropagationError, ConflictError
 
 from hiargparse._version import __version__
 
 __all__ = [
     'Namespace', 'ArgumentParser',
+    'instrument', 'InstrumentationReport', 'MemoizedType', 'type_cache_info',
     'ConfigureFileType',
-    'ArgsProvider', 'Arg', 'ChildProvider',
+    'FileSource', 'MappingSource', 'ArgvSource', 'EnvironSource', 'ConfigWatcher',
+    'ArgsProvider', 'Arg', 'ChildProvider', 'Resolution', 'TemplateCache', 'ConfigureBatch',
+    'MemoryReport', 'measure_memory', 'CompiledSpec',
+    'CompletionIndex', 'completion_script', 'SlottedParams',
     'ArgumentError', 'ConflictWarning', 'PropagationError', 'ConflictError',
     '__version__'
 ]
@@ -1,6 +1,11 @@
-from typing import Any, Sequence, Tuple, List, Callable, cast, TYPE_CHECKING
+import sys
+import time
+from typing import Any, Sequence, Tuple, List, Callable, FrozenSet, Optional, cast, TYPE_CHECKING
 from argparse import ArgumentParser as OriginalAP
 from argparse import Namespace as OriginalNS
+from argparse import Action
+from hiargparse.hierarchy import long_key_to_parents_and_key
+from hiargparse.miscs import instrumentation, SuggestionIndex, DirtyAccessToArgparse
 from .namespace import Namespace
 
 if TYPE_CHECKING:
@@ -17,6 +22,8 @@ class ArgumentParser(OriginalAP):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._defer_actions: List[Callable[[Namespace], None]] = list()
+        # the options when the index was made, and the index
+        self._suggestion_index: Optional[Tuple[FrozenSet[str], SuggestionIndex]] = None
 
     def parse_known_args(
             self,
@@ -31,7 +38,9 @@ class ArgumentParser(OriginalAP):
             target_space = Namespace()
         else:
             target_space = Namespace(namespace)
-        params, remains = super().parse_known_args(args, target_space)
+        with instrumentation.phase('parsing') as timing:
+            timing.count('tokens', len(args if args is not None else sys.argv[1:]))
+            params, remains = super().parse_known_args(args, target_space)
         # I know this params has type hiargparse.Namespace instead of argparse.Namespace
         # typeshed lacks some important features
         params = cast(Namespace, params)
@@ -43,10 +52,13 @@ class ArgumentParser(OriginalAP):
             args: Sequence[str] = None,
             namespace: OriginalNS = None
     ) -> Namespace:
-        """Wrapper method to return hiargparse.Namespace."""
-        params = super().parse_args(args, namespace)
-        # I know this params has type hiargparse.Namespace instead of argparse.Namespace
-        params = cast(Namespace, params)
+        """Wrapper method to return hiargparse.Namespace.
+
+        Unrecognized options are reported with the similar options.
+        """
+        params, remains = self.parse_known_args(args, namespace)
+        if remains:
+            self.error(self.get_suggestion_index().format_unrecognized(remains))
         return params
 
     def add_arguments_from_provider(
@@ -63,6 +75,17 @@ class ArgumentParser(OriginalAP):
         """Register an action to do after its parsing."""
         self._defer_actions.append(action)
 
+    def get_suggestion_index(self) -> SuggestionIndex:
+        """Get the index to suggest options for misspelled ones.
+
+        It is made at the first call, and again after the options are changed.
+        """
+        option_strings = frozenset(DirtyAccessToArgparse.get_option_string_actions(self))
+        cached = self._suggestion_index
+        if cached is None or cached[0] != option_strings:
+            cached = self._suggestion_index = (option_strings, SuggestionIndex(option_strings))
+        return cached[1]
+
     def get_default_parameters(self) -> Namespace:
         """Get defaults by passing no arguments to the parser."""
         return self.parse_args(args=[])
@@ -70,5 +93,21 @@ class ArgumentParser(OriginalAP):
     # protected
 
     def _do_deferred_actions(self, params: Namespace) -> None:
-        for action in self._defer_actions:
-            action(params)
+        with instrumentation.phase('deferred_actions') as timing:
+            for action in self._defer_actions:
+                action(params)
+            timing.count('deferred_actions', len(self._defer_actions))
+
+    def _get_value(self, action: Action, arg_string: str) -> Any:
+        # overrides the private method of argparse.ArgumentParser
+        # which converts a token with the type of the action
+        report = instrumentation.current_report()
+        if report is None:
+            return DirtyAccessToArgparse.get_value(self, action, arg_string)
+        begin = time.perf_counter()
+        try:
+            return DirtyAccessToArgparse.get_value(self, action, arg_string)
+        finally:
+            parents, _ = long_key_to_parents_and_key(action.dest)
+            report.add('type_conversion', '.'.join(parents), time.perf_counter() - begin,
+                       dict(values=1))
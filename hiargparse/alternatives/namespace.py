@@ -1,5 +1,7 @@
 from argparse import Namespace as OriginalNS
+from functools import partial, lru_cache
 from typing import Any, Dict, TypeVar, Mapping, Union, List, Generator, ClassVar, ItemsView
+from typing import Tuple
 from hiargparse.hierarchy import parents_and_key_to_long_key, pop_highest_parent_name, iter_parents
 
 
@@ -81,13 +83,18 @@ class Namespace(OriginalNS):
         """
         for key, value in self._sequential_data.items():
             yield value
-        raise StopIteration()
 
     # useful conversion methods
     # referring to collections.namedtuple
 
     def _copy(self: SpaceT) -> SpaceT:
-        """Copy self and return it."""
+        """Copy self and return it.
+
+        The accessors and setters (see _accessor and _setter) made from self
+        stay bound to self: they read and write self, not the copy,
+        so the copy does not see their writes and vice versa.
+        Make new ones for the copy by accessor.rebind(copied).
+        """
         return type(self)(copy_from=self)
 
     def _update(
@@ -115,6 +122,57 @@ class Namespace(OriginalNS):
             ret_dict[key] = val
         return ret_dict
 
+    def _accessor(self, path: str) -> 'NamespaceAccessor':
+        """Return a getter of the value at the dotted path like 'front_tire.value'.
+
+        The path is resolved once, and the getter reads the storage of the child directly,
+        so calling it is as cheap as a dict lookup.
+        It is bound to this Namespace (it keeps reading self after _copy);
+        use accessor.rebind(copied) for the copies.
+        AttributeError is raised if the path does not exist.
+        """
+        parents, key = _split_path(path)
+        target = self
+        try:
+            for parent in parents:
+                target = target._hierarchical_data[parent]
+            data = target._hierarchical_data
+            data[key]
+        except (KeyError, TypeError, AttributeError):
+            raise AttributeError('\'{}\' object has no attribute \'{}\''
+                                 .format(type(self), path)) from None
+        accessor = NamespaceAccessor(data.__getitem__, key)
+        accessor.path = path
+        accessor.namespace = self
+        return accessor
+
+    def _setter(self, path: str) -> 'NamespaceSetter':
+        """Return a setter of the value at the dotted path like 'front_tire.value'.
+
+        The same as self[long key] = value, with the path resolved once;
+        the child Namespaces on the path must exist.
+        It is bound to this Namespace (it keeps writing self after _copy);
+        use setter.rebind(copied) for the copies.
+        """
+        parents, key = _split_path(path)
+        # the sequential data of self and the children, and the hierarchical data of the last
+        targets: List[Tuple[Dict[str, Any], str]] = list()
+        target = self
+        try:
+            for depth, parent in enumerate(parents):
+                targets.append((target._sequential_data,
+                                parents_and_key_to_long_key(parents[depth:], key)))
+                target = target._hierarchical_data[parent]
+            targets.append((target._sequential_data, key))
+            targets.append((target._hierarchical_data, key))
+        except (KeyError, TypeError, AttributeError):
+            raise AttributeError('\'{}\' object has no attribute \'{}\''
+                                 .format(type(self), '.'.join(parents))) from None
+        if isinstance(target._hierarchical_data.get(key), Namespace):
+            raise TypeError('{} is a Namespace and cannot be replaced with a value. '
+                            .format(path))
+        return NamespaceSetter(self, path, targets)
+
     def __str__(self) -> str:
         type_name = type(self).__name__
         arg_strings: List[str] = list()
@@ -159,10 +217,12 @@ class Namespace(OriginalNS):
         if child_name is None:
             self._hierarchical_data[remain_key] = val
         else:
-            if child_name not in self:
-                self._hierarchical_data[child_name] = type(self)()  # initialize with Namespace
-            assert isinstance(self[child_name], Namespace)
-            self[child_name][remain_key] = val  # recursively registering
+            hierarchical_data = self._hierarchical_data
+            if child_name not in hierarchical_data:
+                hierarchical_data[child_name] = type(self)()  # initialize with Namespace
+            child = hierarchical_data[child_name]
+            assert isinstance(child, Namespace)
+            child[remain_key] = val  # recursively registering
 
     def __getattr_with_hierarchical_name(self, hierarchical_name: str) -> Any:
         """Get attribute.
@@ -237,3 +297,47 @@ class Namespace(OriginalNS):
             else:
                 new_key = parents_and_key_to_long_key(parents, key)
                 self[new_key] = val
+
+
+class NamespaceAccessor(partial):
+    """A getter made by Namespace._accessor; call it without arguments."""
+
+    path: str
+    namespace: Namespace
+
+    def rebind(self, namespace: Namespace) -> 'NamespaceAccessor':
+        """Return the getter of the same path in another (say, copied) Namespace."""
+        return namespace._accessor(self.path)
+
+
+class NamespaceSetter:
+    """A setter made by Namespace._setter; call it with the value."""
+
+    __slots__ = ('path', 'namespace', '_targets')
+
+    def __init__(
+            self,
+            namespace: Namespace,
+            path: str,
+            targets: List[Tuple[Dict[str, Any], str]]
+    ) -> None:
+        self.namespace = namespace
+        self.path = path
+        self._targets = targets
+
+    def __call__(self, value: Any) -> None:
+        if isinstance(value, OriginalNS):
+            raise TypeError('value {} must not be Namespace, yours is {}'
+                            .format(value, type(value)))
+        for data, key in self._targets:
+            data[key] = value
+
+    def rebind(self, namespace: Namespace) -> 'NamespaceSetter':
+        """Return the setter of the same path in another (say, copied) Namespace."""
+        return namespace._setter(self.path)
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[Tuple[str, ...], str]:
+    names = path.split('.')
+    return tuple(names[:-1]), names[-1]
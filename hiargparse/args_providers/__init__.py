@@ -1,4 +1,10 @@
 from .exceptions import ArgumentError, ConflictWarning, PropagationError, ConflictError
 from .child_provider import ChildProvider
 from .argument import Arg
-from .args_provider import ArgsProvider
+from .args_provider import ArgsProvider, Resolution
+from .template_cache import TemplateCache
+from .configure_batch import ConfigureBatch
+from .memory_report import MemoryReport, measure_memory
+from .compiled_spec import CompiledSpec, CompiledOption
+from .completion_index import CompletionIndex, completion_script
+from .slotted_params import SlottedParams
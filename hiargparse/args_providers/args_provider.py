@@ -1,12 +1,28 @@
+import hashlib
+import sys
+import io
+import py_compile
+from pathlib import Path
+from types import ModuleType
 from argparse import ArgumentParser as OriginalAP
-from typing import Iterable, AbstractSet, Dict, Set, List, NamedTuple
+from typing import Iterable, AbstractSet, Dict, Set, List, NamedTuple, Tuple, Any, Optional, Sequence, TextIO
+from typing import Union, Callable, Type
 from hiargparse import ArgumentParser, Namespace
 from hiargparse.hierarchy import format_parent_names, format_parent_names_and_key
+from hiargparse.hierarchy import parents_and_key_to_long_key
 from hiargparse.file_protocols import dict_writers, dict_readers
-from hiargparse.miscs import if_none_then
+from hiargparse.miscs import if_none_then, stable_repr, instrumentation, DirtyAccessToArgparse
+from hiargparse.sources import AbstractSource, FileSource, OptionTable, normalized_items_to_args
+from hiargparse.sources import load_items_concurrently, load_items_asynchronously
 from .exceptions import ConflictError, ArgumentError
 from .child_provider import ChildProvider
 from .argument import Arg, PropagateState
+from .template_cache import TemplateCache
+from .configure_batch import ConfigureBatch
+from .compiled_spec import CompiledSpec
+from .completion_index import CompletionIndex
+from .slotted_params import SlottedParams, make_params_class
+from hiargparse._version import __version__
 
 
 class _PropagateAttribute(NamedTuple):
@@ -15,6 +31,17 @@ class _PropagateAttribute(NamedTuple):
     target: str
 
 
+class Resolution(NamedTuple):
+    """Result of ArgsProvider.resolve.
+
+    provenance maps the canonical option strings (like '--Son-hoge')
+    to the name of the source that gave the value.
+    Options not in provenance have their default values.
+    """
+    namespace: Namespace
+    provenance: Dict[str, str]
+
+
 class ArgsProvider:
     """A class that provides values to Args.
 
@@ -25,8 +52,15 @@ class ArgsProvider:
         args: arguments you want to register.
         child_providers: providers you want to register as its children.
         propagate_args: syntax sugar for args with propagate=True.
+
+    The rendered templates (writing without a namespace) can be cached
+    by setting a TemplateCache to template_cache (of a provider, or of ArgsProvider
+    to share it among all providers); TemplateCache(directory) shares them among processes.
+    The caching is off (None) by default.
     """
 
+    template_cache: Optional[TemplateCache] = None
+
     def __init__(
             self,
             args: Iterable[Arg] = None,
@@ -42,7 +76,8 @@ class ArgsProvider:
                 arg._pr_to_propagatable()
             self._args += propagate_args
         self._child_providers = child_providers
-        self._propagate_attributes: List[_PropagateAttribute] = []
+        # replaced (not mutated) by each registration; see add_arguments_to_parser
+        self._propagate_attributes: Tuple[_PropagateAttribute, ...] = ()
         arg_dests = [arg.dest for arg in self._args]
         arg_dests += [provider.dest for provider in self._child_providers]
         if len(arg_dests) != len(set(arg_dests)):
@@ -60,25 +95,273 @@ class ArgsProvider:
 
     def add_arguments_to_parser(
             self,
-            parser: OriginalAP
+            parser: OriginalAP,
+            writer: dict_writers.AbstractDictWriter = None
     ) -> None:
-        """Add its arguments to the given parser hierarchically."""
-        self._add_arguments_recursively(root=self, parser=parser,
-                                        writer=dict_writers.NullWriter(),
-                                        parent_names=[''], parent_dists=[], argument_prefixes=[],
-                                        propagate_data=dict(), prohibited_args=dict(),
-                                        no_provides=set())
+        """Add its arguments to the given parser hierarchically.
+
+        The writer (if given) is fed with the arguments at the same time.
+
+        Once registered, the parser and this provider are only read while parsing,
+        so that one parser can be shared by many threads calling parse_args concurrently
+        (as long as nothing is added to it at the same time).
+        """
+        writer = if_none_then(writer, dict_writers.NullWriter())
+        self._register_arguments(parser, writer)
         if isinstance(parser, ArgumentParser):
             parser.register_deferring_action(self.apply_propagations)
 
     def write_out_configure_arguments(
             self,
-            writer: dict_writers.AbstractDictWriter
+            writer: dict_writers.AbstractDictWriter,
+            namespace: Namespace = None,
+            sparse: bool = False
     ) -> str:
-        """Return a string that represents its all arguments as given style."""
+        """Return a string that represents its all arguments as given style.
+
+        If namespace is given, its actual values are written instead of the metavars
+        in the same layout, so that they can be read back by the matching reader.
+        If sparse, only the values which differ from the defaults are written;
+        reading the result back fills in the rest from the defaults.
+        Binary writers are not accepted; use write_configure_file for them.
+        """
+        self._check_text_writer(writer)
+        if namespace is None:
+            template = self._render_template(writer)
+            assert isinstance(template, str)
+            return template
+        writer = dict_writers.ValuesWriter(writer, namespace, sparse)
         self._add_arguments_to_writer(writer)
         return writer.write_out()
 
+    def write_configure_arguments_to(
+            self,
+            file: TextIO,
+            writer: dict_writers.AbstractDictWriter,
+            namespace: Namespace = None,
+            sparse: bool = False
+    ) -> None:
+        """Write its all arguments as given style to the text file object.
+
+        The output is streamed to the file with buffered writes
+        instead of being made as one str.
+        See write_out_configure_arguments for namespace and sparse.
+        Binary writers are not accepted; use write_configure_file for them.
+        """
+        self._check_text_writer(writer)
+        if namespace is None and self._template_cache_key(writer) is not None:
+            template = self._render_template(writer)
+            assert isinstance(template, str)
+            file.write(template)
+            return
+        if namespace is not None:
+            writer = dict_writers.ValuesWriter(writer, namespace, sparse)
+        writer.stream_to(file)
+        self._add_arguments_to_writer(writer)
+        writer.finish()
+
+    def write_configure_file(
+            self,
+            target: dict_writers.WritableTarget,
+            writer: dict_writers.AbstractDictWriter,
+            namespace: Namespace = None,
+            sparse: bool = False
+    ) -> None:
+        """Write its all arguments as given style to a path or a binary file object.
+
+        Unlike write_out_configure_arguments, binary styles are also supported.
+        See write_out_configure_arguments for namespace and sparse.
+        """
+        with dict_writers.open_binary_target(target) as f:
+            if writer.binary:
+                if namespace is None:
+                    template = self._render_template(writer)
+                    assert isinstance(template, bytes)
+                    f.write(template)
+                    return
+                writer = dict_writers.ValuesWriter(writer, namespace, sparse)
+                self._add_arguments_to_writer(writer)
+                f.write(writer.write_out_bytes())
+                return
+            text_file = io.TextIOWrapper(f, encoding='utf-8')
+            self.write_configure_arguments_to(text_file, writer, namespace, sparse)
+            text_file.flush()
+            # do not close the given file
+            text_file.detach()
+
+    def write_configure_batch(
+            self,
+            target: dict_writers.WritableTarget,
+            namespaces: Iterable[Namespace],
+            writer_factory: Callable[[], dict_writers.AbstractDictWriter],
+            sparse: bool = False
+    ) -> List[int]:
+        """Write the values of the namespaces into one multi-document file.
+
+        The namespaces are written one by one as they are iterated,
+        each with a new writer from writer_factory, e.g.
+        YAMLWriter (documents separated by '---') or
+        functools.partial(JSONWriter, indent_size=None) (JSON Lines).
+        The arguments are registered only once,
+        so all the documents have the same key ordering.
+        Returns the byte offsets where the documents begin
+        (see read_configure_batch).
+        """
+        recorder = dict_writers.RecordingWriter()
+        self._add_arguments_to_writer(recorder)
+        offsets: List[int] = []
+        position = 0
+        with dict_writers.open_binary_target(target) as f:
+            for namespace in namespaces:
+                writer = dict_writers.ValuesWriter(writer_factory(), namespace, sparse)
+                recorder.replay(writer)
+                document = writer.write_out_bytes()
+                f.write(document)
+                offsets.append(position)
+                position += len(document)
+        return offsets
+
+    def read_configure_batch(
+            self,
+            path: Union[str, Path],
+            reader: dict_readers.AbstractDictReader,
+            parser: OriginalAP = None,
+            offsets: Sequence[int] = None
+    ) -> ConfigureBatch:
+        """Open a multi-document file written by write_configure_batch.
+
+        The returned ConfigureBatch reads the namespaces lazily.
+        If offsets (returned by write_configure_batch) are given,
+        the documents are not scanned, and any format (even binary) can be read.
+        """
+        parser = if_none_then(parser, ArgumentParser())
+        table = self._add_arguments_and_make_table(parser)
+        return ConfigureBatch(self, path, reader, parser, table, offsets)
+
+    def compile(self) -> CompiledSpec:
+        """Compile the provider tree into a picklable CompiledSpec.
+
+        The types of the arguments must be importable (module-level) classes or functions,
+        and only the usual actions (store, store_const/true/false, append, append_const
+        and count) are supported; otherwise TypeError is raised.
+        """
+        parser = ArgumentParser()
+        indexer = dict_writers.KeyIndexWriter()
+        self.add_arguments_to_parser(parser, indexer)
+        propagations = [(attribute.source, attribute.target)
+                        for attribute in self._propagate_attributes]
+        return CompiledSpec.from_actions(DirtyAccessToArgparse.get_actions(parser),
+                                         propagations, indexer.index, self.fingerprint())
+
+    def write_parser_module(self, path: Union[str, Path]) -> None:
+        """Generate a python module (and its bytecode) which parses like this provider tree.
+
+        The module is loadable with one import, without the providers
+        (see CompiledSpec.to_module_source), and its parse_args returns the same Namespace
+        as ArgumentParser.parse_args after the registration.
+        Check it by is_stale_parser_module whenever the providers may have changed.
+        """
+        source = self.compile().to_module_source()
+        path = Path(path)
+        temporary_path = path.with_name(path.name + '.tmp')
+        temporary_path.write_text(source, encoding='utf-8')
+        temporary_path.replace(path)
+        # compile it ahead too, since compiling a large module dominates its first import
+        py_compile.compile(str(path), doraise=True)
+
+    def is_stale_parser_module(self, module: ModuleType) -> bool:
+        """Return True if the generated module is not made from the current provider tree."""
+        return getattr(module, 'FINGERPRINT', None) != self.fingerprint()
+
+    def write_completion_index(self, path: Union[str, Path]) -> None:
+        """Write the shell completion index of the options (see CompletionIndex).
+
+        Source completion_script(prog, path) in the shell to use it.
+        """
+        parser = ArgumentParser()
+        self.add_arguments_to_parser(parser)
+        index = CompletionIndex.from_actions(DirtyAccessToArgparse.get_actions(parser),
+                                             self.fingerprint())
+        index.write(path)
+
+    def is_stale_completion_index(self, path: Union[str, Path]) -> bool:
+        """Return True if the index file is missing or not made from the current provider tree."""
+        return CompletionIndex.read_fingerprint(path) != self.fingerprint()
+
+    def make_params_class(self, name: str = 'Params') -> Type[SlottedParams]:
+        """Make nested classes with __slots__ which mirror the provider tree.
+
+        Convert a parsed Namespace by Params.from_namespace(params)
+        to read its values at the speed of plain attributes (in hot loops and so on).
+        The arguments and child providers must have identifiers as their names.
+        """
+        parser = ArgumentParser()
+        self.add_arguments_to_parser(parser)
+        propagations = [(attribute.source, attribute.target)
+                        for attribute in self._propagate_attributes]
+        return make_params_class(DirtyAccessToArgparse.get_actions(parser), propagations, name)
+
+    def parse_subtree(
+            self,
+            path: str,
+            args: Sequence[str] = None,
+            contents: Iterable[Tuple[str, Any]] = None
+    ) -> Namespace:
+        """Parse the arguments of only one child provider and its descendants.
+
+        The path is the dotted dests of the child providers like 'Car.front_tire'.
+        Only the arguments in the subtree, and those of its ancestors propagated into it,
+        are registered, so the other options in args (default: sys.argv[1:])
+        and the other keys in the normalized configure items (contents) are skipped
+        without validation (abbreviated options are not accepted).
+        The values of args override those of contents.
+        Returns a Namespace holding only the subtree and the propagated sources,
+        like params.Car.front_tire.value.
+        """
+        scope = path.split('.') if path else []
+        parser = ArgumentParser(allow_abbrev=False)
+        indexer = dict_writers.KeyIndexWriter()
+        propagations: List[_PropagateAttribute] = []
+        self._add_arguments_recursively(propagations=propagations, parser=parser, writer=indexer,
+                                        parent_names=[''], parent_dists=[], argument_prefixes=[],
+                                        propagate_data=dict(), prohibited_args=dict(),
+                                        no_provides=set(), scope=scope)
+        tokens: List[str] = []
+        if contents is not None:
+            table = OptionTable.from_parser(parser, key_index=indexer.index)
+            known_items = ((table.canonical_key(key), val) for key, val in contents)
+            tokens += normalized_items_to_args(((key, val) for key, val in known_items
+                                                if key is not None), table.repetitions)
+        tokens += sys.argv[1:] if args is None else args
+        parsed, _ = parser.parse_known_args(tokens)
+
+        prefix = parents_and_key_to_long_key(scope, '')
+        sources = set()
+        for attribute in propagations:
+            if attribute.target.startswith(prefix):
+                parsed[attribute.target] = parsed[attribute.source]
+                sources.add(attribute.source)
+        result = Namespace()
+        for key, value in parsed._sequential_data.items():
+            if key.startswith(prefix) or key in sources:
+                result[key] = value
+        return result
+
+    def fingerprint(self) -> str:
+        """Return a digest of the whole provider tree.
+
+        It changes if anything written about the arguments changes,
+        and is the same among processes as long as the arguments are.
+        It is made from stable_repr of the arguments, so it is a best effort:
+        functions are identified by their names and code, not by the values
+        captured in their closures (two closures of one function collide),
+        and objects without stable reprs (e.g. with their addresses in the reprs)
+        differ among processes.
+        """
+        digest = hashlib.sha1(__version__.encode('utf-8'))
+        self._update_fingerprint(digest)
+        return digest.hexdigest()
+
     def read_configure_arguments(
             self,
             document: str,
@@ -86,49 +369,219 @@ class ArgsProvider:
             parser: OriginalAP = None
     ) -> Namespace:
         """Read the given document as given style and return the parameters."""
-        parser = if_none_then(parser, ArgumentParser())
         contents = reader.to_normalized_dict(document)
-        args: List[str] = []
-        for key, val in contents.items():
-            if val is None:
-                continue
-            args.append(key)
-            if val is True or val is False:
-                # maybe nargs = 0
-                pass
-            elif isinstance(val, (list, tuple)):
-                for v in val:
-                    args.append(str(v))
-            else:
-                args.append(str(val))
-        self.add_arguments_to_parser(parser)
-        name_space = parser.parse_args(args)
-        return Namespace(name_space)
+        return self._parse_normalized_items(contents.items(), parser)
+
+    def read_configure_file(
+            self,
+            source: dict_readers.ReadableSource,
+            reader: dict_readers.AbstractDictReader,
+            parser: OriginalAP = None
+    ) -> Namespace:
+        """Read the given file as given style and return the parameters.
+
+        The source is a path or a binary file object.
+        It is memory-mapped if possible and parsed as a stream,
+        so that no full copy of the document is made.
+        """
+        contents = reader.iter_normalized_items(source)
+        return self._parse_normalized_items(contents, parser)
+
+    def resolve(
+            self,
+            sources: Iterable[AbstractSource],
+            parser: OriginalAP = None,
+            max_workers: int = None
+    ) -> Resolution:
+        """Merge the given sources and parse them at once.
+
+        Sources are given from the lowest priority to the highest one,
+        e.g. [FileSource(base, ...), FileSource(local, ...), ArgvSource()].
+        All the values are merged into one table in one pass (the last one wins),
+        and then argparse, its validation and the propagation run only once.
+        If max_workers is given, the sources are read and parsed concurrently
+        on a thread pool of that size; the merge order is kept anyway.
+        """
+        sources = list(sources)
+        parser = if_none_then(parser, ArgumentParser())
+        table = self._add_arguments_and_make_table(parser)
+        loaded_items: Iterable[Iterable[Tuple[str, Any]]]
+        if max_workers is None:
+            loaded_items = (source.iter_items(table) for source in sources)
+        else:
+            loaded_items = load_items_concurrently(sources, table, max_workers)
+        return self._merge_and_parse(sources, loaded_items, table, parser)
+
+    async def resolve_async(
+            self,
+            sources: Iterable[AbstractSource],
+            parser: OriginalAP = None,
+            max_workers: int = None
+    ) -> Resolution:
+        """An asyncio variant of resolve.
+
+        The sources are read and parsed on a thread pool
+        without blocking the event loop.
+        """
+        sources = list(sources)
+        parser = if_none_then(parser, ArgumentParser())
+        table = self._add_arguments_and_make_table(parser)
+        loaded_items = await load_items_asynchronously(sources, table, max_workers)
+        return self._merge_and_parse(sources, loaded_items, table, parser)
+
+    def read_configure_files(
+            self,
+            sources: Iterable[dict_readers.ReadableSource],
+            reader: dict_readers.AbstractDictReader,
+            parser: OriginalAP = None,
+            max_workers: int = None
+    ) -> Namespace:
+        """Read the given files concurrently and return the merged parameters.
+
+        Latter files overwrite former ones.
+        Files included from several files are parsed only once.
+        """
+        include_cache = dict_readers.IncludeCache()
+        file_sources = [FileSource(source, reader, include_cache=include_cache)
+                        for source in sources]
+        return self.resolve(file_sources, parser, max_workers=max_workers).namespace
 
-    def apply_propagations(self, namespace: Namespace) -> None:
+    def apply_propagations(
+            self,
+            namespace: Namespace,
+            only_from: AbstractSet[str] = None
+    ) -> List[str]:
         """Applying arguments propagation.
 
         Be sure to call this method after parser.parse_args().
+        If only_from is given, only the values of those dests are propagated.
+        Returns the dests that the values are propagated to.
         """
-        for attribute in self._propagate_attributes:
-            source = attribute.source
-            target = attribute.target
-            namespace[target] = namespace[source]
+        targets: List[str] = []
+        with instrumentation.phase('propagation') as timing:
+            for attribute in self._propagate_attributes:
+                source = attribute.source
+                target = attribute.target
+                if only_from is not None and source not in only_from:
+                    continue
+                namespace[target] = namespace[source]
+                targets.append(target)
+            timing.count('propagations', len(targets))
+        return targets
 
     # protected methods
 
+    def _parse_normalized_items(
+            self,
+            contents: Iterable[Tuple[str, Any]],
+            parser: Optional[OriginalAP]
+    ) -> Namespace:
+        parser = if_none_then(parser, ArgumentParser())
+        table = self._add_arguments_and_make_table(parser)
+        return self._parse_with_table(contents, table, parser)
+
+    def _parse_with_table(
+            self,
+            contents: Iterable[Tuple[str, Any]],
+            table: OptionTable,
+            parser: OriginalAP
+    ) -> Namespace:
+        # unknown keys are left for argparse to report
+        args = normalized_items_to_args(((if_none_then(table.canonical_key(key), key), val)
+                                         for key, val in contents), table.repetitions)
+        name_space = parser.parse_args(args)
+        return Namespace(name_space)
+
+    def _add_arguments_and_make_table(self, parser: OriginalAP) -> OptionTable:
+        indexer = dict_writers.KeyIndexWriter()
+        self.add_arguments_to_parser(parser, indexer)
+        return OptionTable.from_parser(parser, key_index=indexer.index)
+
+    def _merge_and_parse(
+            self,
+            sources: Sequence[AbstractSource],
+            loaded_items: Iterable[Iterable[Tuple[str, Any]]],
+            table: OptionTable,
+            parser: OriginalAP
+    ) -> Resolution:
+        contents: Dict[str, Any] = dict()
+        provenance: Dict[str, str] = dict()
+        unknown_contents: List[Tuple[str, Any]] = []
+        for source, items in zip(sources, loaded_items):
+            for key, val in items:
+                if val is None:
+                    continue
+                canonical_key = table.canonical_key(key)
+                if canonical_key is None:
+                    # leave it to argparse to report
+                    unknown_contents.append((key, val))
+                    continue
+                contents[canonical_key] = val
+                provenance[canonical_key] = source.name
+        args = normalized_items_to_args(contents.items(), table.repetitions)
+        args += normalized_items_to_args(unknown_contents)
+        name_space = parser.parse_args(args)
+        return Resolution(namespace=Namespace(name_space), provenance=provenance)
+
     def _add_arguments_to_writer(
             self,
             writer: dict_writers.AbstractDictWriter
     ) -> None:
-        self._add_arguments_recursively(root=self, parser=ArgumentParser(), writer=writer,
+        self._register_arguments(ArgumentParser(), writer)
+
+    def _register_arguments(
+            self,
+            parser: OriginalAP,
+            writer: dict_writers.AbstractDictWriter
+    ) -> None:
+        propagations: List[_PropagateAttribute] = []
+        self._add_arguments_recursively(propagations=propagations, parser=parser, writer=writer,
                                         parent_names=[''], parent_dists=[], argument_prefixes=[],
                                         propagate_data=dict(), prohibited_args=dict(),
                                         no_provides=set())
+        # the same tree always gives the same propagations;
+        # swap them at once so that concurrent apply_propagations see a complete tuple
+        self._propagate_attributes = tuple(propagations)
+
+    @staticmethod
+    def _check_text_writer(writer: dict_writers.AbstractDictWriter) -> None:
+        if writer.binary:
+            raise TypeError('{} writes bytes; use write_configure_file with a binary file. '
+                            .format(type(writer).__name__))
+
+    def _template_cache_key(self, writer: dict_writers.AbstractDictWriter) -> Optional[Tuple[Any, ...]]:
+        if self.template_cache is None:
+            return None
+        return writer.template_key()
+
+    def _render_template(self, writer: dict_writers.AbstractDictWriter) -> Union[str, bytes]:
+        """Render the template of the writer, or read it from template_cache."""
+        writer_key = self._template_cache_key(writer)
+        if writer_key is None:
+            self._add_arguments_to_writer(writer)
+            return writer.write_out_bytes() if writer.binary else writer.write_out()
+        assert self.template_cache is not None
+        fingerprint = self.fingerprint()
+        template = self.template_cache.get(fingerprint, writer_key, writer.binary)
+        if template is None:
+            self._add_arguments_to_writer(writer)
+            template = writer.write_out_bytes() if writer.binary else writer.write_out()
+            self.template_cache.put(fingerprint, writer_key, template)
+        return template
+
+    def _update_fingerprint(self, digest: Any) -> None:
+        for arg in self._args:
+            digest.update(arg._pr_fingerprint().encode('utf-8'))
+        for child_provider in self._child_providers:
+            header = stable_repr((child_provider.name, child_provider.dest,
+                                  child_provider.prefix, child_provider.no_provides))
+            digest.update('child {} begin'.format(header).encode('utf-8'))
+            child_provider.get_args_provider()._update_fingerprint(digest)
+            digest.update(b'child end')
 
     def _add_arguments_recursively(
             self,
-            root: 'ArgsProvider',
+            propagations: List[_PropagateAttribute],
             parser: OriginalAP,
             writer: dict_writers.AbstractDictWriter,
             parent_names: List[str],
@@ -136,53 +589,75 @@ class ArgsProvider:
             argument_prefixes: List[str],
             propagate_data: Dict[str, str],
             prohibited_args: Dict[str, str],
-            no_provides: AbstractSet[str]
+            no_provides: AbstractSet[str],
+            scope: Sequence[str] = ()
     ) -> None:
-        """Recursively collect informations and call arg._pr_add_argument."""
+        """Recursively collect informations and call arg._pr_add_argument.
+
+        If scope (dests of child providers) is given, only the child provider on it
+        is visited, and only the propagating arguments are added outside of it.
+        """
         new_propagate_data: Dict[str, str] = dict()
         new_prohibited_args: Dict[str, str] = dict()
         group_name = format_parent_names(parent_names)
-        argument_group = parser.add_argument_group(group_name)
-        for arg in self._args:
-            if arg.main_name in no_provides:
-                continue
-            returns = arg._pr_add_argument(argument_target=argument_group,
-                                           writer=writer,
-                                           parent_names=parent_names,
-                                           parent_dists=parent_dists,
-                                           argument_prefixes=argument_prefixes,
-                                           propagate_data=propagate_data,
-                                           prohibited_args=prohibited_args)
-            state = returns.state
-            if state is PropagateState.ForPropagate:
-                # ready for propagate
-                for target in returns.targets:
-                    new_propagate_data[target] = returns.dest
-            elif state is PropagateState.Prohibit:
-                # ready for prohibit
-                for target in returns.targets:
-                    new_prohibited_args[target] = format_parent_names_and_key(parent_names, target)
-            elif state is PropagateState.Propagated:
-                # set to propagate the value
-                assert returns.propagated_from is not None
-                attribute = _PropagateAttribute(source=returns.propagated_from,
-                                                target=returns.dest)
-                root._propagate_attributes.append(attribute)
+        path = '.'.join(parent_dists)
+        with instrumentation.phase('registration', path) as timing:
+            argument_group = parser.add_argument_group(group_name)
+            for arg in self._args:
+                if arg.main_name in no_provides:
+                    continue
+                if scope and not arg._pr_is_propagating():
+                    continue
+                returns = arg._pr_add_argument(argument_target=argument_group,
+                                               writer=writer,
+                                               parent_names=parent_names,
+                                               parent_dists=parent_dists,
+                                               argument_prefixes=argument_prefixes,
+                                               propagate_data=propagate_data,
+                                               prohibited_args=prohibited_args)
+                timing.count('args')
+                state = returns.state
+                if state is PropagateState.ForPropagate:
+                    # ready for propagate
+                    for target in returns.targets:
+                        new_propagate_data[target] = returns.dest
+                elif state is PropagateState.Prohibit:
+                    # ready for prohibit
+                    for target in returns.targets:
+                        new_prohibited_args[target] = format_parent_names_and_key(parent_names,
+                                                                                  target)
+                elif state is PropagateState.Propagated:
+                    # set to propagate the value
+                    assert returns.propagated_from is not None
+                    attribute = _PropagateAttribute(source=returns.propagated_from,
+                                                    target=returns.dest)
+                    propagations.append(attribute)
         new_propagate_data.update(propagate_data)
         new_prohibited_args.update(prohibited_args)
-        for child_provider in self._child_providers:
-            provider = child_provider.get_args_provider()
+        child_providers = self._child_providers
+        if scope:
+            child_providers = [child for child in child_providers if child.dest == scope[0]]
+            if not child_providers:
+                raise ArgumentError('no child provider {} in {}. '
+                                    .format(scope[0], '.'.join(parent_dists) or 'the root'))
+        for child_provider in child_providers:
             new_parent_dists = parent_dists + [child_provider.dest]
+            with instrumentation.phase('provider_resolution',
+                                       '.'.join(new_parent_dists)) as timing:
+                provider = child_provider.get_args_provider()
+                timing.count('child_providers')
             if child_provider.prefix == '':
                 new_argument_prefixes = argument_prefixes
             else:
                 new_argument_prefixes = argument_prefixes + [child_provider.prefix]
             new_parent_names = parent_names + [child_provider.name]
             with writer.make_section(child_provider.name):
-                provider._add_arguments_recursively(root=root, parser=parser, writer=writer,
+                provider._add_arguments_recursively(propagations=propagations,
+                                                    parser=parser, writer=writer,
                                                     parent_names=new_parent_names,
                                                     parent_dists=new_parent_dists,
                                                     argument_prefixes=new_argument_prefixes,
                                                     propagate_data=new_propagate_data,
                                                     prohibited_args=new_prohibited_args,
-                                                    no_provides=child_provider.no_provides)
+                                                    no_provides=child_provider.no_provides,
+                                                    scope=scope[1:])
@@ -5,7 +5,7 @@ from typing import Union, Sequence, Collection, Optional, Callable, TypeVar, Nam
 from typing import Dict, List, Any, Type
 from hiargparse.hierarchy import parents_and_key_to_long_key, format_parent_names_and_key
 from hiargparse.file_protocols.dict_writers import AbstractDictWriter
-from hiargparse.miscs import DirtyAccessToArgparse
+from hiargparse.miscs import DirtyAccessToArgparse, stable_repr, MemoizedType, unwrap_type
 from .exceptions import ArgumentError, ConflictWarning, PropagationError
 
 
@@ -42,6 +42,8 @@ class Arg:
                    is treated as a totally different Arg.
         propagate_targets: names that used in checking whether the target is
                    the same (occur propagation) or not.
+        type_cache_size: If given, declare that the type is pure and memoize its
+                   conversions by an LRU of this size (see miscs.MemoizedType).
 
     methods started with _pr_ is used in other classes in this module,
     but invisible from outside of this module.
@@ -58,6 +60,7 @@ class Arg:
             metavar: Union[str, Sequence[str]] = None,
             propagate: bool = None,
             propagate_targets: Collection[str] = None,
+            type_cache_size: int = None,
             **kwargs: Any
     ) -> None:
         # names
@@ -74,6 +77,11 @@ class Arg:
         # default, type
         if type is None and default is not None:
             type = default.__class__
+        parser_type = type
+        if type_cache_size is not None:
+            if type is None:
+                raise ArgumentError('type_cache_size needs a type or a default value. ')
+            parser_type = MemoizedType(type, type_cache_size)
         # dest
         if dest is None:
             dest = main_name.replace('-', '_')
@@ -91,6 +99,7 @@ class Arg:
         self._names = names
         self._default = default
         self._type = type
+        self._parser_type = parser_type
         self._dest = dest
         self._metavar = metavar
         self._propagate = propagate
@@ -132,8 +141,8 @@ class Arg:
         # keyword arguments for parser
         parser_kwargs = {key: val for key, val in self._kwargs.items()}
         parser_kwargs.update(dest=dest, metavar=self._metavar)
-        if self._type is not None:
-            parser_kwargs['type'] = self._type
+        if self._parser_type is not None:
+            parser_kwargs['type'] = self._parser_type
         if self._default is not None:
             parser_kwargs['default'] = self._default
 
@@ -185,7 +194,7 @@ class Arg:
             if len(self._names) >= 2:
                 default_help_text += '(a.k.a. {}) '.format(', '.join(self._names[1:]))
             # if type is easy-to-understand one, then show it
-            if action.type in [bool, int, float, complex, str]:
+            if unwrap_type(action.type) in [bool, int, float, complex, str]:
                 default_help_text += 'type: %(type)s. '
             # default
             if action.default is not None:
@@ -220,6 +229,18 @@ class Arg:
         return _AddArgumentReturn(state=propagate_state, targets=self._propagate_targets,
                                   dest=dest, propagated_from=propagated_from)
 
+    def _pr_fingerprint(self) -> str:
+        """Return a str which changes if anything written about the argument changes."""
+        # names and so on are strs, whose reprs are stable and fast
+        return '{!r} {!r} {!r} {!r} {!r} {!r} {} {} {}'.format(
+            list(self._names), self._main_name, self._dest, self._metavar, self._propagate,
+            self._propagate_targets, stable_repr(self._default), stable_repr(self._type),
+            stable_repr(self._kwargs) if self._kwargs else '')
+
+    def _pr_is_propagating(self) -> bool:
+        """Whether its value may be propagated to child Args."""
+        return bool(self._propagate)
+
     def _pr_to_propagatable(self) -> None:
         """Turn on its propagate property"""
         if self._propagate is not None and not self._propagate:
@@ -0,0 +1,369 @@
+import argparse
+import ast
+import bisect
+import importlib
+import pickle
+import re
+from typing import NamedTuple, Tuple, Optional, Any, Union, Dict, List, Sequence, Iterable
+from typing import Callable
+from hiargparse import Namespace
+from hiargparse.miscs import unwrap_type, SuggestionIndex
+from hiargparse.sources import normalized_items_to_args, Repetition
+from hiargparse.sources import normalized_args
+
+# the kinds of argparse actions that a compiled spec supports
+STORE = 'store'
+STORE_CONST = 'store_const'
+APPEND = 'append'
+APPEND_CONST = 'append_const'
+COUNT = 'count'
+
+_ACTION_KINDS = {
+    argparse._StoreAction: STORE,  # type: ignore
+    argparse._StoreConstAction: STORE_CONST,  # type: ignore
+    argparse._StoreTrueAction: STORE_CONST,  # type: ignore
+    argparse._StoreFalseAction: STORE_CONST,  # type: ignore
+    argparse._AppendAction: APPEND,  # type: ignore
+    argparse._AppendConstAction: APPEND_CONST,  # type: ignore
+    argparse._CountAction: COUNT,  # type: ignore
+}
+
+_REPETITION_KINDS = {APPEND: normalized_args.APPEND, COUNT: normalized_args.COUNT}
+
+_negative_number = re.compile(r'^-\d+$|^-\d*\.\d+$')
+
+
+class CompiledOption(NamedTuple):
+    """One option of a compiled provider tree (a picklable argparse action)."""
+    option_strings: Tuple[str, ...]
+    dest: str
+    kind: str
+    nargs: Union[None, int, str]
+    default: Any
+    const: Any
+    # 'module:qualname' of the type, or None
+    type_path: Optional[str]
+    choices: Optional[Tuple[Any, ...]]
+    required: bool
+
+
+def type_to_path(type_: Callable[[str], Any]) -> str:
+    """Return 'module:qualname' of an importable class or function."""
+    module = getattr(type_, '__module__', None)
+    qualname = getattr(type_, '__qualname__', None)
+    if module is None or qualname is None or '<' in qualname:
+        raise TypeError('type {!r} cannot be referenced by an import path; '
+                        'use a module-level class or function. '.format(type_))
+    path = '{}:{}'.format(module, qualname)
+    if resolve_type_path(path) is not type_:
+        raise TypeError('type {!r} is not importable as {}. '.format(type_, path))
+    return path
+
+
+_resolved_types: Dict[str, Callable[[str], Any]] = dict()
+
+
+def resolve_type_path(path: str) -> Callable[[str], Any]:
+    """Import the type referenced by 'module:qualname' (cached)."""
+    try:
+        return _resolved_types[path]
+    except KeyError:
+        pass
+    module_name, qualname = path.split(':')
+    target: Any = importlib.import_module(module_name)
+    for name in qualname.split('.'):
+        target = getattr(target, name)
+    _resolved_types[path] = target
+    return target
+
+
+_MODULE_TEMPLATE = """\
+# generated by hiargparse {version}; do not edit.
+# regenerate it when ArgsProvider.is_stale_parser_module(this module) is True.
+import pickle
+from hiargparse.args_providers.compiled_spec import CompiledSpec, CompiledOption
+
+FINGERPRINT = {fingerprint!r}
+
+OPTIONS = (
+{options})
+
+PROPAGATIONS = {propagations!r}
+
+CONFIG_KEYS = {config_keys!r}
+
+SPEC = CompiledSpec(OPTIONS, PROPAGATIONS, CONFIG_KEYS, FINGERPRINT)
+parse_args = SPEC.parse_args
+parse_normalized_items = SPEC.parse_normalized_items
+"""
+
+
+def _value_source(value: Any) -> str:
+    # a literal if possible, or else a pickle (which imports the classes of the value)
+    source = repr(value)
+    try:
+        if ast.literal_eval(source) == value:
+            return source
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        pass
+    return 'pickle.loads({!r})'.format(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class CompiledSpec:
+    """A compact and picklable form of a registered provider tree.
+
+    Make it by ArgsProvider.compile().
+    It holds the options (option strings, dests, defaults, choices,
+    and the types by their import paths), the propagations,
+    and the normalized configure keys, but neither providers nor argparse objects,
+    so it is cheap to pickle and to send to worker processes.
+    parse_args parses the tokens like ArgumentParser.parse_args of the original tree
+    (only optional arguments of the usual actions are supported)
+    and raises argparse.ArgumentError instead of exiting.
+    """
+
+    __slots__ = ('options', 'propagations', 'config_keys', 'fingerprint',
+                 '_option_index', '_sorted_option_strings', '_dest_index', '_suggestion_index',
+                 '_repetitions')
+
+    def __init__(
+            self,
+            options: Sequence[CompiledOption],
+            propagations: Sequence[Tuple[str, str]],
+            config_keys: Dict[str, str],
+            fingerprint: str
+    ) -> None:
+        self.options = tuple(options)
+        self.propagations = tuple(propagations)
+        self.config_keys = config_keys
+        self.fingerprint = fingerprint
+        self._option_index: Dict[str, CompiledOption] = {
+            option_string: option
+            for option in self.options for option_string in option.option_strings}
+        self._sorted_option_strings = sorted(self._option_index)
+        self._dest_index = {option.dest: option for option in self.options}
+        self._repetitions = {
+            option.option_strings[0]: Repetition(_REPETITION_KINDS[option.kind], option.default)
+            for option in self.options if option.kind in _REPETITION_KINDS}
+        self._suggestion_index: Optional[SuggestionIndex] = None
+
+    @classmethod
+    def from_actions(
+            cls,
+            actions: Iterable[argparse.Action],
+            propagations: Sequence[Tuple[str, str]],
+            config_keys: Dict[str, str],
+            fingerprint: str
+    ) -> 'CompiledSpec':
+        options = list()
+        for action in actions:
+            if isinstance(action, argparse._HelpAction):  # type: ignore
+                continue
+            kind = _ACTION_KINDS.get(type(action))
+            if kind is None or not action.option_strings:
+                raise TypeError('argument {} ({}) cannot be compiled. '
+                                .format(action.dest, type(action).__name__))
+            type_ = unwrap_type(action.type)
+            type_path = None if type_ is None else type_to_path(type_)
+            choices = None if action.choices is None else tuple(action.choices)
+            options.append(CompiledOption(
+                option_strings=tuple(action.option_strings), dest=action.dest, kind=kind,
+                nargs=action.nargs, default=action.default, const=action.const,
+                type_path=type_path, choices=choices, required=action.required))
+        return cls(options, propagations, config_keys, fingerprint)
+
+    # pickling; the indices are rebuilt on loading
+
+    def __reduce__(self) -> Any:
+        return (type(self), (self.options, self.propagations, self.config_keys,
+                             self.fingerprint))
+
+    def dumps(self) -> bytes:
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def loads(data: bytes) -> 'CompiledSpec':
+        spec = pickle.loads(data)
+        if not isinstance(spec, CompiledSpec):
+            raise TypeError('not a CompiledSpec: {}'.format(type(spec)))
+        return spec
+
+    def to_module_source(self) -> str:
+        """Generate the source of a python module which rebuilds this spec.
+
+        The module defines FINGERPRINT, SPEC, parse_args and parse_normalized_items,
+        and needs neither the providers nor pickled options except for
+        the defaults and choices which are not python literals.
+        """
+        from hiargparse._version import __version__
+        options = ''.join(
+            '    CompiledOption({}),\n'.format(', '.join(
+                '{}={}'.format(field, _value_source(getattr(option, field)))
+                for field in CompiledOption._fields))
+            for option in self.options)
+        return _MODULE_TEMPLATE.format(
+            version=__version__, fingerprint=self.fingerprint, options=options,
+            propagations=self.propagations, config_keys=self.config_keys)
+
+    # parsing
+
+    def parse_args(self, args: Sequence[str]) -> Namespace:
+        """Parse the tokens and apply the propagations."""
+        values: Dict[str, Any] = {option.dest: option.default for option in self.options}
+        seen: Dict[str, bool] = dict()
+        index = 0
+        while index < len(args):
+            token = args[index]
+            index += 1
+            if token == '--':
+                # the rest are positional arguments, which nobody takes
+                raise argparse.ArgumentError(None, self.suggestion_index()
+                                             .format_unrecognized(list(args[index - 1:])))
+            explicit_value: Optional[str] = None
+            if token.startswith('--') and '=' in token:
+                token, explicit_value = token.split('=', 1)
+            if not self._is_option(token):
+                raise argparse.ArgumentError(
+                    None, self.suggestion_index().format_unrecognized([token]))
+            option = self._find_option(token)
+            if explicit_value is not None:
+                strings = [explicit_value]
+            else:
+                end = index
+                while end < len(args) and not self._is_option(args[end]):
+                    end += 1
+                strings = list(args[index:end])
+            used = self._take_strings(option, strings, explicit_value is not None)
+            if explicit_value is None:
+                index += used
+            self._apply(option, strings[:used], values)
+            seen[option.dest] = True
+
+        for option in self.options:
+            if option.dest in seen:
+                continue
+            if option.required:
+                raise argparse.ArgumentError(
+                    None, 'the following arguments are required: {}'
+                    .format('/'.join(option.option_strings)))
+            # argparse converts str defaults with the type
+            if isinstance(option.default, str) and option.type_path is not None:
+                values[option.dest] = self._convert(option, option.default)
+
+        namespace = Namespace()
+        for dest, value in values.items():
+            namespace[dest] = value
+        for source, target in self.propagations:
+            namespace[target] = namespace[source]
+        return namespace
+
+    def parse_normalized_items(self, contents: Iterable[Tuple[str, Any]]) -> Namespace:
+        """Parse the items of a normalized configure dict (see dict_readers)."""
+        items = list()
+        for key, value in contents:
+            dest = self.config_keys.get(key)
+            if dest is not None:
+                key = self._dest_index[dest].option_strings[0]
+            items.append((key, value))
+        return self.parse_args(normalized_items_to_args(items, self._repetitions))
+
+    def suggestion_index(self) -> SuggestionIndex:
+        """Get the index to suggest options for misspelled ones (made at the first call)."""
+        if self._suggestion_index is None:
+            self._suggestion_index = SuggestionIndex(self._option_index)
+        return self._suggestion_index
+
+    # protected
+
+    @staticmethod
+    def _is_option(token: str) -> bool:
+        # the same rules as argparse (no option looks like a negative number)
+        if not token.startswith('-') or token == '-':
+            return False
+        if _negative_number.match(token):
+            return False
+        return ' ' not in token
+
+    def _find_option(self, token: str) -> CompiledOption:
+        option = self._option_index.get(token)
+        if option is not None:
+            return option
+        # unique prefix like argparse's allow_abbrev
+        position = bisect.bisect_left(self._sorted_option_strings, token)
+        candidates: List[str] = []
+        for option_string in self._sorted_option_strings[position:]:
+            if not option_string.startswith(token):
+                break
+            candidates.append(option_string)
+        if len(candidates) == 1:
+            return self._option_index[candidates[0]]
+        if candidates:
+            raise argparse.ArgumentError(None, 'ambiguous option: {} could match {}'
+                                         .format(token, ', '.join(candidates)))
+        raise argparse.ArgumentError(None, self.suggestion_index().format_unrecognized([token]))
+
+    @staticmethod
+    def _take_strings(option: CompiledOption, strings: List[str], explicit: bool) -> int:
+        nargs = option.nargs
+        if option.kind in (STORE_CONST, APPEND_CONST, COUNT):
+            if explicit:
+                raise argparse.ArgumentError(None, 'argument {}: ignored explicit argument {!r}'
+                                             .format(option.option_strings[0], strings[0]))
+            return 0
+        if nargs is None:
+            needed = 1
+        elif nargs == '?':
+            return min(len(strings), 1)
+        elif nargs == '*':
+            return len(strings)
+        elif nargs == '+':
+            needed = max(len(strings), 1)
+        else:
+            assert isinstance(nargs, int)
+            needed = nargs
+        if len(strings) < needed:
+            raise argparse.ArgumentError(None, 'argument {}: expected {} argument(s)'
+                                         .format(option.option_strings[0], needed))
+        return needed
+
+    def _convert(self, option: CompiledOption, string: str) -> Any:
+        if option.type_path is None:
+            return string
+        type_ = resolve_type_path(option.type_path)
+        try:
+            return type_(string)
+        except (TypeError, ValueError):
+            type_name = getattr(type_, '__name__', repr(type_))
+            raise argparse.ArgumentError(None, 'argument {}: invalid {} value: {!r}'
+                                         .format(option.option_strings[0], type_name, string))
+
+    def _apply(self, option: CompiledOption, strings: List[str], values: Dict[str, Any]) -> None:
+        kind = option.kind
+        if kind == STORE_CONST:
+            values[option.dest] = option.const
+            return
+        if kind == APPEND_CONST:
+            values[option.dest] = list(values[option.dest] or []) + [option.const]
+            return
+        if kind == COUNT:
+            values[option.dest] = (values[option.dest] or 0) + 1
+            return
+        converted = [self._convert(option, string) for string in strings]
+        if option.choices is not None:
+            for value in converted:
+                if value not in option.choices:
+                    raise argparse.ArgumentError(
+                        None, 'argument {}: invalid choice: {!r} (choose from {})'
+                        .format(option.option_strings[0], value,
+                                ', '.join(map(repr, option.choices))))
+        value: Any
+        if option.nargs is None:
+            value = converted[0]
+        elif option.nargs == '?':
+            value = converted[0] if converted else option.const
+        else:
+            value = converted
+        if kind == APPEND:
+            values[option.dest] = list(values[option.dest] or []) + [value]
+        else:
+            values[option.dest] = value
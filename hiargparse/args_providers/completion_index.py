@@ -0,0 +1,207 @@
+import argparse
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Optional, Sequence, Tuple, Union
+from .compiled_spec import CompiledSpec, STORE, APPEND
+
+_HEADER = '#hiargparse-completion'
+_VALUE_MARK = '='
+
+# the completion function reads the index by one pass of awk:
+# the children of the longest trie node which is a prefix of the current word,
+# or the choices if the previous word is an option taking a value (exit status 3)
+_AWK_PROGRAM = r'''
+$1 == "=" prev { value = 1; choices = $2; exit }
+substr($1, 1, 1) != "=" && ($1 == "" || index(cur, $1) == 1) && length($1) >= length(best) {
+    best = $1; children = $2
+}
+END {
+    if (value) { words = choices } else { words = children }
+    n = split(words, candidates, " ")
+    for (i = 1; i <= n; i++) if (index(candidates[i], cur) == 1) print candidates[i]
+    if (value) exit 3
+}
+'''
+
+_BASH_TEMPLATE = r'''# completion of {prog} generated by hiargparse; do not edit.
+# regenerate {index} when ArgsProvider.is_stale_completion_index says so.
+{preamble}_hiargparse_complete_{function}() {{
+    local cur="${{COMP_WORDS[COMP_CWORD]}}" prev="${{COMP_WORDS[COMP_CWORD-1]}}" status
+    COMPREPLY=($(awk -F '\t' -v cur="$cur" -v prev="$prev" '{awk}' '{index}'))
+    status=$?
+    type compopt >/dev/null 2>&1 || return 0
+    if [[ $status == 3 && ${{#COMPREPLY[@]}} == 0 ]]; then
+        # a value without choices; complete the file names
+        compopt -o default
+    elif [[ ${{#COMPREPLY[@]}} == 1 && "${{COMPREPLY[*]}}" == *- ]]; then
+        # an inner node of the trie; continue to complete it
+        compopt -o nospace
+    fi
+}}
+complete -F _hiargparse_complete_{function} {prog}
+'''
+
+_ZSH_PREAMBLE = 'autoload -U +X bashcompinit && bashcompinit\n'
+
+
+class CompletionIndex:
+    """A precomputed index for the shell completion of the options.
+
+    The option strings are organized as a prefix trie whose nodes are
+    the hierarchical prefixes like '--Car-' and '--Car-ftire-'
+    (the root is ''; chains of nodes with only one child are compressed),
+    and the choices are recorded for the options taking values.
+    The index is a text file, one node or option per line, which the script
+    made by completion_script reads without python.
+    """
+
+    def __init__(
+            self,
+            fingerprint: str,
+            children: Dict[str, List[str]],
+            values: Dict[str, List[str]]
+    ) -> None:
+        self.fingerprint = fingerprint
+        self.children = children
+        self.values = values
+
+    @classmethod
+    def from_actions(
+            cls,
+            actions: Iterable[argparse.Action],
+            fingerprint: str
+    ) -> 'CompletionIndex':
+        """Make the index from the actions registered to a parser.
+
+        Only the option strings, nargs and choices are used (not the types).
+        """
+        return cls._from_options(fingerprint, (
+            (action.option_strings, action.nargs != 0, action.choices)
+            for action in actions))
+
+    @classmethod
+    def from_spec(
+            cls,
+            spec: CompiledSpec,
+            help_options: Sequence[str] = ('-h', '--help')
+    ) -> 'CompletionIndex':
+        options = [(help_options, False, None)]
+        options.extend((option.option_strings,
+                        option.kind in (STORE, APPEND) and option.nargs != 0,
+                        option.choices)
+                       for option in spec.options)
+        return cls._from_options(spec.fingerprint, options)
+
+    @classmethod
+    def _from_options(
+            cls,
+            fingerprint: str,
+            options: Iterable[Tuple[Sequence[str], bool, Optional[Iterable[Any]]]]
+    ) -> 'CompletionIndex':
+        # options are (option strings, whether it takes values, choices)
+        tree: Dict[str, Set[str]] = {'': set()}
+        values: Dict[str, List[str]] = dict()
+        option_strings: List[str] = list()
+        for strings, takes_values, option_choices in options:
+            option_strings.extend(strings)
+            if takes_values:
+                # choices with spaces cannot be completed by words
+                choices = [str(choice) for choice in option_choices or ()]
+                for option_string in strings:
+                    values[option_string] = [choice for choice in choices
+                                             if not re.search(r'\s', choice)]
+        for option_string in option_strings:
+            parent = ''
+            for node in _inner_nodes(option_string):
+                tree.setdefault(parent, set()).add(node)
+                tree.setdefault(node, set())
+                parent = node
+            tree[parent].add(option_string)
+
+        children: Dict[str, List[str]] = dict()
+        for node, node_children in tree.items():
+            compressed = set()
+            for child in node_children:
+                while len(tree.get(child, ())) == 1:
+                    child = next(iter(tree[child]))
+                compressed.add(child)
+            children[node] = sorted(compressed)
+        return cls(fingerprint, children, values)
+
+    def complete(self, current: str, previous: str = '') -> Tuple[List[str], bool]:
+        """Return the candidates and whether the current word is a value.
+
+        The same as the shell script, for python programs and checking.
+        """
+        if previous in self.values:
+            return [choice for choice in self.values[previous]
+                    if choice.startswith(current)], True
+        node = max((node for node in self.children if current.startswith(node)), key=len)
+        return [child for child in self.children[node] if child.startswith(current)], False
+
+    # files
+
+    def dumps(self) -> str:
+        lines = ['{}\t{}'.format(_HEADER, self.fingerprint)]
+        for node, children in sorted(self.children.items()):
+            lines.append('{}\t{}'.format(node, ' '.join(children)))
+        for option_string, choices in sorted(self.values.items()):
+            lines.append('{}{}\t{}'.format(_VALUE_MARK, option_string, ' '.join(choices)))
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def loads(cls, text: str) -> 'CompletionIndex':
+        lines = text.splitlines()
+        header, fingerprint = lines[0].split('\t')
+        if header != _HEADER:
+            raise ValueError('not a completion index of hiargparse. ')
+        children: Dict[str, List[str]] = dict()
+        values: Dict[str, List[str]] = dict()
+        for line in lines[1:]:
+            key, words = line.split('\t')
+            if key.startswith(_VALUE_MARK):
+                values[key[len(_VALUE_MARK):]] = words.split()
+            else:
+                children[key] = words.split()
+        return cls(fingerprint, children, values)
+
+    def write(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        temporary_path = path.with_name(path.name + '.tmp')
+        temporary_path.write_text(self.dumps(), encoding='utf-8')
+        temporary_path.replace(path)
+
+    @staticmethod
+    def read_fingerprint(path: Union[str, Path]) -> Optional[str]:
+        """Return the fingerprint of the index file, or None if it is not an index."""
+        try:
+            with open(str(path), encoding='utf-8') as f:
+                header, _, fingerprint = f.readline().rstrip('\n').partition('\t')
+        except (OSError, UnicodeDecodeError):
+            return None
+        return fingerprint if header == _HEADER else None
+
+
+def completion_script(prog: str, index_path: Union[str, Path], shell: str = 'bash') -> str:
+    """Return a bash (or zsh) script which completes the options of prog by the index file.
+
+    Source it from .bashrc (or .zshrc); it needs only awk.
+    """
+    if shell not in ('bash', 'zsh'):
+        raise ValueError('shell must be bash or zsh, not {}'.format(shell))
+    index = str(Path(index_path).resolve())
+    if "'" in index:
+        raise ValueError('the path of the index must not contain quotes: {}'.format(index))
+    return _BASH_TEMPLATE.format(
+        prog=prog, index=index, function=re.sub(r'\W', '_', prog),
+        awk=_AWK_PROGRAM.strip('\n'), preamble=_ZSH_PREAMBLE if shell == 'zsh' else '')
+
+
+def _inner_nodes(option_string: str) -> List[str]:
+    # '--Car-ftire-style' -> ['--Car-', '--Car-ftire-']
+    nodes = list()
+    position = option_string.find('-', 2)
+    while position != -1 and position != len(option_string) - 1:
+        nodes.append(option_string[:position + 1])
+        position = option_string.find('-', position + 1)
+    return nodes
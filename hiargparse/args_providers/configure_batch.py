@@ -0,0 +1,82 @@
+import mmap
+from argparse import ArgumentParser as OriginalAP
+from pathlib import Path
+from typing import Union, Sequence, List, Iterator, Any, TYPE_CHECKING
+from hiargparse import Namespace
+from hiargparse.file_protocols import dict_readers
+from hiargparse.sources import OptionTable
+
+# avoid cyclic importing
+if TYPE_CHECKING:
+    from .args_provider import ArgsProvider
+
+
+class ConfigureBatch:
+    """Namespaces lazily read from a multi-document configure file.
+
+    Use ArgsProvider.read_configure_batch to make it.
+    The file is memory-mapped, and only the offsets of the documents are indexed;
+    each document is parsed when it is accessed, e.g. batch[n] seeks to the n-th one.
+    The arguments are registered to the parser only once for all the documents.
+    Close it (or use it with a with statement) when you finished.
+    """
+
+    def __init__(
+            self,
+            provider: 'ArgsProvider',
+            path: Union[str, Path],
+            reader: dict_readers.AbstractDictReader,
+            parser: OriginalAP,
+            table: OptionTable,
+            offsets: Sequence[int] = None
+    ) -> None:
+        self._provider = provider
+        self._reader = reader
+        self._parser = parser
+        self._table = table
+        with open(str(path), 'rb') as f:
+            try:
+                self._data: Any = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # an empty file cannot be mapped
+                self._data = f.read()
+        if offsets is None:
+            offsets = list(reader.iter_document_offsets(self._data))
+        self._offsets: List[int] = list(offsets)
+
+    @property
+    def offsets(self) -> List[int]:
+        """The offsets where the documents begin; pass it next time to skip indexing."""
+        return list(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> Namespace:
+        if index < 0:
+            index += len(self._offsets)
+        if not 0 <= index < len(self._offsets):
+            raise IndexError('document index out of range')
+        begin = self._offsets[index]
+        if index + 1 < len(self._offsets):
+            end = self._offsets[index + 1]
+        else:
+            end = len(self._data)
+        with memoryview(self._data) as view:
+            with view[begin:end] as document:
+                contents = self._reader.read_document(document)
+        return self._provider._parse_with_table(contents.items(), self._table, self._parser)
+
+    def __iter__(self) -> Iterator[Namespace]:
+        for index in range(len(self._offsets)):
+            yield self[index]
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self) -> 'ConfigureBatch':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
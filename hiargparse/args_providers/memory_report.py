@@ -0,0 +1,185 @@
+import gc
+import sys
+import tracemalloc
+from typing import Dict, Tuple, Sequence, Any, Set, List, TYPE_CHECKING
+from hiargparse import ArgumentParser, Namespace
+from hiargparse.hierarchy import long_key_to_parents_and_key
+from hiargparse.miscs import instrument, DirtyAccessToArgparse
+
+# avoid cyclic importing
+if TYPE_CHECKING:
+    from .args_provider import ArgsProvider
+
+
+class MemoryReport:
+    """Retained memory of a registered parser and its parsed Namespace.
+
+    Bytes are broken down by the dest path of the child providers
+    ('' for the root) and by the category:
+        actions: argparse actions and argument groups (help texts excluded),
+        help_text: the help strings of the actions,
+        parser_overhead: the rest of the parser (measured at the root),
+        namespace_values: the parsed values (excluding the defaults shared with the actions),
+        namespace_overhead: the Namespaces holding the values (dual storage, keys, ...).
+    The totals of the parser and the Namespace are measured by tracemalloc;
+    the breakdown inside them is measured per registration phase or estimated by sizes,
+    and the unattributed rest is counted in the overhead of the root.
+    """
+
+    CATEGORIES = ('actions', 'help_text', 'parser_overhead',
+                  'namespace_values', 'namespace_overhead')
+
+    def __init__(self) -> None:
+        self.bytes: Dict[Tuple[str, str], int] = dict()
+
+    def add(self, path: str, category: str, size: int) -> None:
+        assert category in self.CATEGORIES
+        self.bytes[path, category] = self.bytes.get((path, category), 0) + size
+
+    def total(self, category: str = None) -> int:
+        """Sum up the bytes (of the category if given)."""
+        return sum(size for (_, size_category), size in self.bytes.items()
+                   if category is None or size_category == category)
+
+    def by_path(self, category: str = None) -> Dict[str, int]:
+        result: Dict[str, int] = dict()
+        for (path, size_category), size in self.bytes.items():
+            if category is None or size_category == category:
+                result[path] = result.get(path, 0) + size
+        return result
+
+    def exceeded_budgets(self, budgets: Dict[str, int]) -> List[str]:
+        """Return messages about the budgets exceeded.
+
+        budgets maps categories (or 'total') to the maximum bytes.
+        """
+        messages = list()
+        for category, budget in budgets.items():
+            size = self.total(None if category == 'total' else category)
+            if size > budget:
+                messages.append('{}: {} bytes exceeds the budget {} bytes'
+                                .format(category, size, budget))
+        return messages
+
+    def as_dict(self) -> Dict[str, Dict[str, int]]:
+        """{path: {category: bytes}}, which can be dumped as json."""
+        result: Dict[str, Dict[str, int]] = dict()
+        for (path, category), size in self.bytes.items():
+            result.setdefault(path, dict())[category] = size
+        return result
+
+    def format(self) -> str:
+        """Format the report as a table of paths and categories in KiB."""
+        lines = ['{:<30}'.format('path') + ''.join('{:>20}'.format(category)
+                                                   for category in self.CATEGORIES)]
+        rows = self.as_dict()
+        rows['*'] = {category: self.total(category) for category in self.CATEGORIES}
+        for path, sizes in sorted(rows.items()):
+            lines.append('{:<30}'.format(path) + ''.join(
+                '{:>20.1f}'.format(sizes.get(category, 0) / 1024)
+                for category in self.CATEGORIES))
+        return '\n'.join(lines)
+
+
+def measure_memory(
+        provider: 'ArgsProvider',
+        args: Sequence[str] = ()
+) -> MemoryReport:
+    """Register the provider to a new parser, parse args, and report the retained memory.
+
+    tracemalloc is started (and stopped at last) if it is not tracing.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        report = MemoryReport()
+        gc.collect()
+        begin = tracemalloc.get_traced_memory()[0]
+        with instrument(trace_memory=True) as timings:
+            parser = ArgumentParser()
+            provider.add_arguments_to_parser(parser)
+        gc.collect()
+        parser_bytes = tracemalloc.get_traced_memory()[0] - begin
+        # the child ArgsProviders are built while registering and freed after that
+        resolved_bytes = timings.total('provider_resolution').counts.get('allocated_bytes', 0)
+        _report_parser(report, parser, parser_bytes + max(resolved_bytes, 0),
+                       timings.by_path('registration'))
+
+        gc.collect()
+        begin = tracemalloc.get_traced_memory()[0]
+        namespace = parser.parse_args(list(args))
+        gc.collect()
+        namespace_bytes = tracemalloc.get_traced_memory()[0] - begin
+        _report_namespace(report, parser, namespace, namespace_bytes)
+        return report
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def _dest_path(dest: str) -> str:
+    parents, _ = long_key_to_parents_and_key(dest)
+    return '.'.join(parents)
+
+
+def _report_parser(
+        report: MemoryReport,
+        parser: ArgumentParser,
+        parser_bytes: int,
+        registrations: Dict[str, Any]
+) -> None:
+    help_bytes: Dict[str, int] = dict()
+    for action in DirtyAccessToArgparse.get_actions(parser):
+        if isinstance(action.help, str):
+            path = _dest_path(action.dest)
+            help_bytes[path] = help_bytes.get(path, 0) + sys.getsizeof(action.help)
+    attributed = 0
+    for path, stats in registrations.items():
+        registered = max(stats.counts.get('allocated_bytes', 0), 0)
+        help_size = min(help_bytes.get(path, 0), registered)
+        report.add(path, 'help_text', help_size)
+        report.add(path, 'actions', registered - help_size)
+        attributed += registered
+    report.add('', 'parser_overhead', max(parser_bytes - attributed, 0))
+
+
+def _report_namespace(
+        report: MemoryReport,
+        parser: ArgumentParser,
+        namespace: Namespace,
+        namespace_bytes: int
+) -> None:
+    # the defaults are shared with the actions
+    seen: Set[int] = {id(value) for action in DirtyAccessToArgparse.get_actions(parser)
+                      for value in (action.default, action.const)}
+    attributed = 0
+    children: List[Tuple[str, Namespace]] = [('', namespace)]
+    while children:
+        path, child = children.pop()
+        overhead = sum(sys.getsizeof(obj) for obj in (
+            child, child.__dict__, child._sequential_data, child._hierarchical_data))
+        overhead += sum(sys.getsizeof(key) for key in child._sequential_data)
+        values = 0
+        for key, value in child._hierarchical_data.items():
+            if isinstance(value, Namespace):
+                children.append(('{}.{}'.format(path, key) if path else key, value))
+            else:
+                values += _deep_sizeof(value, seen)
+        report.add(path, 'namespace_overhead', overhead)
+        report.add(path, 'namespace_values', values)
+        attributed += overhead + values
+    report.add('', 'namespace_overhead', max(namespace_bytes - attributed, 0))
+
+
+def _deep_sizeof(value: Any, seen: Set[int]) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in value)
+    elif isinstance(value, dict):
+        size += sum(_deep_sizeof(key, seen) + _deep_sizeof(item, seen)
+                    for key, item in value.items())
+    return size
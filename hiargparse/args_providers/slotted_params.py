@@ -0,0 +1,125 @@
+import argparse
+import keyword
+from typing import Any, Dict, List, Tuple, Type, Iterable
+from hiargparse import Namespace
+from hiargparse.hierarchy import long_key_to_parents_and_key
+from hiargparse.miscs import unwrap_type
+
+
+class SlottedParams:
+    """The base of the classes made by ArgsProvider.make_params_class.
+
+    Each class has __slots__ of the arguments and the child providers
+    (whose values are instances of the classes of the children),
+    so the attributes are read at the speed of plain slots.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _child_classes: Dict[str, Type['SlottedParams']] = dict()
+
+    @classmethod
+    def from_namespace(cls: Any, namespace: Namespace) -> Any:
+        """Convert a parsed Namespace (of the same provider tree)."""
+        if cls is SlottedParams:
+            raise TypeError('SlottedParams has no fields; '
+                            'use a class made by ArgsProvider.make_params_class. ')
+        return cls._from_hierarchical(namespace._hierarchical_data)
+
+    @classmethod
+    def _from_hierarchical(cls: Any, data: Dict[str, Any]) -> Any:
+        # replaced with a generated function for each class made by make_params_class
+        raise TypeError('{} is not made by ArgsProvider.make_params_class. '.format(cls.__name__))
+
+    def _asdict(self) -> Dict[str, Any]:
+        """Convert self to an hierarchical dict like Namespace._asdict."""
+        result = dict()
+        for field in self._fields:
+            value = getattr(self, field)
+            if isinstance(value, SlottedParams):
+                value = value._asdict()
+            result[field] = value
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self._fields)
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(type(self).__name__, ', '.join(
+            '{}={!r}'.format(field, getattr(self, field)) for field in self._fields))
+
+
+class _Node:
+    def __init__(self) -> None:
+        self.annotations: Dict[str, Any] = dict()
+        self.children: Dict[str, '_Node'] = dict()
+
+    def get_child(self, names: List[str]) -> '_Node':
+        node = self
+        for name in names:
+            node = node.children.setdefault(name, _Node())
+        return node
+
+
+def make_params_class(
+        actions: Iterable[argparse.Action],
+        propagation_targets: Iterable[Tuple[str, str]],
+        name: str = 'Params'
+) -> Type[SlottedParams]:
+    """Make the slotted classes from the registered actions and (source, target) propagations."""
+    root = _Node()
+    annotations: Dict[str, Any] = dict()
+    for action in actions:
+        if isinstance(action, argparse._HelpAction) or action.default == argparse.SUPPRESS:
+            continue
+        parents, key = long_key_to_parents_and_key(action.dest)
+        annotations[action.dest] = root.get_child(parents).annotations[key] = _annotation(action)
+    for source, target in propagation_targets:
+        parents, key = long_key_to_parents_and_key(target)
+        root.get_child(parents).annotations[key] = annotations.get(source, Any)
+    return _make_class(root, name)
+
+
+def _annotation(action: argparse.Action) -> Any:
+    if isinstance(action, argparse._CountAction):
+        return int
+    if action.nargs == 0:
+        value = action.const
+        return Any if value is None else type(value)
+    type_ = unwrap_type(action.type)
+    if not isinstance(type_, type):
+        type_ = Any if action.default is None else type(action.default)
+    if isinstance(action, argparse._AppendAction) or action.nargs not in (None, '?'):
+        return List[type_]
+    return type_
+
+
+def _make_class(node: _Node, name: str) -> Type[SlottedParams]:
+    fields = tuple(node.annotations) + tuple(child for child in node.children
+                                              if child not in node.annotations)
+    for field in fields:
+        if not field.isidentifier() or keyword.iskeyword(field) or hasattr(SlottedParams, field):
+            raise ValueError('{} cannot be an attribute of {}. '.format(field, name))
+    child_classes = {child: _make_class(child_node, '{}_{}'.format(name, child))
+                     for child, child_node in node.children.items()}
+    annotations = dict(node.annotations)
+    annotations.update(child_classes)
+    cls = type(name, (SlottedParams,), dict(
+        __slots__=fields, __annotations__=annotations,
+        _fields=fields, _child_classes=child_classes))
+
+    # straight-line code like namedtuple, to convert without loops
+    lines = ['def _from_hierarchical(cls, data):', '    self = new(cls)']
+    for field in fields:
+        if field in child_classes:
+            lines.append('    self.{0} = children[{0!r}]._from_hierarchical('
+                         'data[{0!r}]._hierarchical_data)'.format(field))
+        else:
+            lines.append('    self.{0} = data[{0!r}]'.format(field))
+    lines.append('    return self')
+    scope: Dict[str, Any] = dict(new=object.__new__, children=child_classes)
+    exec('\n'.join(lines), scope)
+    cls._from_hierarchical = classmethod(scope['_from_hierarchical'])  # type: ignore
+    return cls
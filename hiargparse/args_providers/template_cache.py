@@ -0,0 +1,125 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Union, Optional, Tuple, Any
+from hiargparse.miscs import stable_repr
+
+
+Template = Union[str, bytes]
+
+
+class TemplateCache:
+    """Cache of the rendered configure templates.
+
+    Templates are keyed by the provider-tree fingerprint (ArgsProvider.fingerprint)
+    and the writer key (AbstractDictWriter.template_key).
+    Up to maxsize templates are kept in-process (the least recently used ones are dropped),
+    and they are also stored in the directory if given,
+    so that other processes can read them instead of rendering.
+    Files in the directory are never removed by the cache.
+
+    The fingerprint is a best effort (see ArgsProvider.fingerprint):
+    do not share a cache among trees whose types or defaults
+    differ only in what the fingerprint cannot see.
+
+    Args:
+        directory: a directory to store the templates. It is made if it does not exist.
+        maxsize: the number of the templates kept in-process.
+    """
+
+    def __init__(
+            self,
+            directory: Union[str, Path] = None,
+            maxsize: int = 128
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError('maxsize must be positive, not {}'.format(maxsize))
+        self._directory = None if directory is None else Path(directory)
+        self.maxsize = maxsize
+        self._templates: 'OrderedDict[Tuple[str, Tuple[Any, ...]], Template]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+            self,
+            fingerprint: str,
+            writer_key: Tuple[Any, ...],
+            binary: bool
+    ) -> Optional[Template]:
+        """Return the cached template, or None if it is not cached."""
+        key = (fingerprint, writer_key)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+        if template is None and self._directory is not None:
+            try:
+                data = self._path(key).read_bytes()
+            except OSError:
+                pass
+            else:
+                template = data if binary else data.decode('utf-8')
+                self._keep(key, template)
+        with self._lock:
+            if template is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return template
+
+    def put(
+            self,
+            fingerprint: str,
+            writer_key: Tuple[Any, ...],
+            template: Template
+    ) -> None:
+        key = (fingerprint, writer_key)
+        self._keep(key, template)
+        if self._directory is not None:
+            data = template if isinstance(template, bytes) else template.encode('utf-8')
+            try:
+                self._write_atomically(self._path(key), data)
+            except OSError:
+                # the cache is just an optimization
+                pass
+
+    def clear(self) -> None:
+        """Clear the in-process templates (files in the directory are left)."""
+        with self._lock:
+            self._templates.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """The number of the templates kept in-process."""
+        with self._lock:
+            return len(self._templates)
+
+    def _keep(self, key: Tuple[str, Tuple[Any, ...]], template: Template) -> None:
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+
+    def _path(self, key: Tuple[str, Tuple[Any, ...]]) -> Path:
+        assert self._directory is not None
+        digest = hashlib.sha1(stable_repr(key).encode('utf-8')).hexdigest()
+        return self._directory / '{}.template'.format(digest)
+
+    @staticmethod
+    def _write_atomically(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # readers in other processes never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=str(path.parent))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, str(path))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
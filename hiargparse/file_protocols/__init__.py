@@ -1,2 +1,2 @@
-from . import dict_readers, dict_writers
+from . import binary_format, dict_readers, dict_writers
 from .configure_file_type import ConfigureFileType
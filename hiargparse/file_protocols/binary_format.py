@@ -0,0 +1,49 @@
+"""A compact binary format for machine-generated configure files.
+
+A file consists of a header (magic bytes and a format version)
+followed by a nested dict serialized with marshal.
+Values that marshal does not support are stored as their str,
+which is all that the readers pass to argparse anyway.
+"""
+import marshal
+from collections.abc import Mapping as MappingClass
+from typing import Any, Dict, Mapping
+
+
+MAGIC = b'HIARGPB'
+VERSION = 1
+HEADER = MAGIC + bytes([VERSION])
+_MARSHAL_VERSION = 4
+_MARSHALABLE_TYPES = (str, bytes, int, float, complex, bool, type(None))
+
+
+def dumps(contents: Mapping[str, Any]) -> bytes:
+    """Serialize a nested dict."""
+    return HEADER + marshal.dumps(_to_marshalable(contents), _MARSHAL_VERSION)
+
+
+def loads(data: Any) -> Dict[str, Any]:
+    """Deserialize a nested dict from bytes-like data (bytes, mmap, memoryview, ...)."""
+    with memoryview(data) as view:
+        header = bytes(view[:len(HEADER)])
+        if header[:len(MAGIC)] != MAGIC:
+            raise ValueError('not a hiargparse binary configure file.')
+        if header[len(MAGIC):] != bytes([VERSION]):
+            raise ValueError('unsupported binary configure file version {} (supports {}).'
+                             .format(list(header[len(MAGIC):]), VERSION))
+        with view[len(HEADER):] as body:
+            contents = marshal.loads(body)
+    if not isinstance(contents, dict):
+        raise ValueError('broken binary configure file.')
+    return contents
+
+
+def _to_marshalable(value: Any) -> Any:
+    if isinstance(value, _MARSHALABLE_TYPES):
+        return value
+    elif isinstance(value, MappingClass):
+        return {str(key): _to_marshalable(val) for key, val in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [_to_marshalable(val) for val in value]
+    else:
+        return str(value)
@@ -7,12 +7,18 @@ class ConfigureFileType(enum.Enum):
 
     toml = enum.auto()
     yaml = enum.auto()
+    json = enum.auto()
+    binary = enum.auto()
 
     def get_reader(self) -> dict_readers.AbstractDictReader:
         if self is ConfigureFileType.toml:
             return dict_readers.TOMLReader()
         elif self is ConfigureFileType.yaml:
             return dict_readers.YAMLReader()
+        elif self is ConfigureFileType.json:
+            return dict_readers.JSONReader()
+        elif self is ConfigureFileType.binary:
+            return dict_readers.BinaryReader()
         else:
             raise ValueError('{} has no reader.'.format(self))
 
@@ -21,5 +27,9 @@ class ConfigureFileType(enum.Enum):
             return dict_writers.TOMLWriter()
         elif self is ConfigureFileType.yaml:
             return dict_writers.YAMLWriter()
+        elif self is ConfigureFileType.json:
+            return dict_writers.JSONWriter()
+        elif self is ConfigureFileType.binary:
+            return dict_writers.BinaryWriter()
         else:
             raise ValueError('{} has no writer.'.format(self))
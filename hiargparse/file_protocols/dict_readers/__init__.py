@@ -1,3 +1,7 @@
+from .binary_source import ReadableSource
+from .include_resolver import IncludeCache, IncludeCycleError
 from .abstract_dict_reader import AbstractDictReader
 from .yaml_reader import YAMLReader
 from .toml_reader import TOMLReader
+from .json_reader import JSONReader
+from .binary_reader import BinaryReader
@@ -1,8 +1,68 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Tuple, BinaryIO, Union
+from hiargparse.miscs import if_none_then
+from .binary_source import ReadableSource, open_binary_source, read_text
+from .normalize_dict import normalized_dict
+from .include_resolver import IncludeCache, resolve_include_items, source_path
 
 
 class AbstractDictReader(ABC):
     @abstractmethod
     def to_normalized_dict(self, input_documents: str) -> Dict[str, Any]:
         raise NotImplementedError()
+
+    def read_normalized_dict(
+            self,
+            source: ReadableSource,
+            include_cache: IncludeCache = None
+    ) -> Dict[str, Any]:
+        """Read a path or a binary file object and return its normalized dict."""
+        return dict(self.iter_normalized_items(source, include_cache))
+
+    def iter_normalized_items(
+            self,
+            source: ReadableSource,
+            include_cache: IncludeCache = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """Read a path or a binary file object and yield its normalized items.
+
+        The same key may be yielded more than once; the last one wins.
+        Include directives are resolved (see include_resolver);
+        pass the same include_cache to share parsed files among several reads.
+        """
+        include_cache = if_none_then(include_cache, IncludeCache())
+        with open_binary_source(source) as stream:
+            items = self._iter_normalized_items_from_stream(stream)
+            yield from resolve_include_items(items, source_path(source), self, include_cache)
+
+    def read_document(self, data: Union[bytes, memoryview]) -> Dict[str, Any]:
+        """Parse one whole document in the buffer and return its normalized dict.
+
+        Include directives are not resolved.
+        """
+        nested = self._read_nested_dict_from_bytes(data)
+        # e.g. an empty yaml document
+        return normalized_dict(nested) if nested is not None else dict()
+
+    def iter_document_offsets(self, data: bytes) -> Iterator[int]:
+        """Yield the offsets where the documents in a multi-document buffer begin.
+
+        data is bytes or anything with find (e.g. mmap).
+        """
+        raise NotImplementedError('{} does not support multi-document files. '
+                                  .format(type(self).__name__))
+
+    def _iter_normalized_items_from_stream(
+            self,
+            stream: BinaryIO
+    ) -> Iterator[Tuple[str, Any]]:
+        # fallback for the backends which can parse only a whole str
+        yield from self.to_normalized_dict(read_text(stream)).items()
+
+    def _read_nested_dict_from_bytes(self, data: Union[bytes, memoryview]) -> Dict[str, Any]:
+        """Parse a whole file into a nested dict (used for included files)."""
+        return self._to_nested_dict(str(data, 'utf-8'))
+
+    def _to_nested_dict(self, input_documents: str) -> Dict[str, Any]:
+        raise NotImplementedError('{} does not support include directives. '
+                                  .format(type(self).__name__))
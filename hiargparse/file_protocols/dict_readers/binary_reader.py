@@ -0,0 +1,34 @@
+from .abstract_dict_reader import AbstractDictReader
+from typing import Dict, Any, Iterator, Tuple, BinaryIO
+import mmap
+from hiargparse.file_protocols import binary_format
+from .normalize_dict import iter_normalized_items
+
+
+class BinaryReader(AbstractDictReader):
+    """Reader for hiargparse.file_protocols.binary_format.
+
+    Binary files cannot be passed as str;
+    use read_normalized_dict or iter_normalized_items instead.
+    """
+
+    def to_normalized_dict(self, input_documents: str) -> Dict[str, Any]:
+        raise TypeError('{} cannot read str documents; '
+                        'use read_normalized_dict with a path or a binary file object. '
+                        .format(type(self).__name__))
+
+    def _iter_normalized_items_from_stream(
+            self,
+            stream: BinaryIO
+    ) -> Iterator[Tuple[str, Any]]:
+        if isinstance(stream, mmap.mmap):
+            # no copy of the mapped file is made
+            with memoryview(stream) as view:
+                with view[stream.tell():] as rest:
+                    nested = binary_format.loads(rest)
+        else:
+            nested = binary_format.loads(stream.read())
+        yield from iter_normalized_items(nested)
+
+    def _read_nested_dict_from_bytes(self, data: bytes) -> Dict[str, Any]:
+        return binary_format.loads(data)
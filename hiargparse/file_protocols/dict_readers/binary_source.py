@@ -0,0 +1,55 @@
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Union, BinaryIO, Iterator
+
+
+ReadableSource = Union[str, Path, BinaryIO]
+
+
+@contextmanager
+def open_binary_source(source: ReadableSource) -> Iterator[BinaryIO]:
+    """Open the given path or binary file object as a readable binary stream.
+
+    The file is memory-mapped if possible,
+    so that its contents are paged in by the OS instead of being copied onto the heap.
+    A given file object is read from its current position and is not closed.
+    """
+    if isinstance(source, (str, Path)):
+        with open(str(source), 'rb') as f:
+            with _mapped(f) as stream:
+                yield stream
+    else:
+        with _mapped(source) as stream:
+            yield stream
+
+
+def read_text(stream: BinaryIO, encoding: str = 'utf-8') -> str:
+    """Decode the rest of the stream.
+
+    A memory-mapped stream is decoded directly from its buffer
+    without any intermediate bytes copy.
+    """
+    if isinstance(stream, mmap.mmap):
+        with memoryview(stream) as view:
+            with view[stream.tell():] as rest:
+                return str(rest, encoding)
+    return stream.read().decode(encoding)
+
+
+@contextmanager
+def _mapped(f: BinaryIO) -> Iterator[BinaryIO]:
+    try:
+        position = f.tell()
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # in-memory streams, pipes, empty files, ...
+        # (io.UnsupportedOperation is a subclass of both OSError and ValueError)
+        yield f
+        return
+    try:
+        mapped.seek(position)
+        # mmap has all the reading methods we need
+        yield mapped  # type: ignore
+    finally:
+        mapped.close()
@@ -0,0 +1,147 @@
+"""Include directives for configure files.
+
+A configure file may have a top-level key '__include__'
+with a path (or a list of paths) relative to the including file:
+
+    __include__: [base.yaml, gpu.yaml]
+    Son:
+      hoge: 3
+
+The included files are merged in order (latter ones win),
+and the including file overwrites them.
+Includes are resolved only when reading files, not str documents.
+"""
+import hashlib
+import os
+import threading
+from pathlib import Path
+from collections.abc import Mapping as MappingClass
+from typing import Any, Dict, Iterable, Iterator, Tuple, List, Optional, Mapping, TYPE_CHECKING
+from .binary_source import ReadableSource
+from .normalize_dict import iter_normalized_items
+
+# avoid cyclic importing
+if TYPE_CHECKING:
+    from .abstract_dict_reader import AbstractDictReader
+
+
+INCLUDE_KEY = '__include__'
+_normalized_include_key = '--' + INCLUDE_KEY
+
+
+class IncludeCycleError(ValueError):
+    """An error from cyclic include directives."""
+    pass
+
+
+class IncludeCache:
+    """Parsed files shared within one resolution.
+
+    Files are keyed by their contents,
+    so a file included from several files (diamond-shaped includes)
+    or copied to several paths is parsed only once.
+    Cached dicts must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self._parsed: Dict[Tuple[type, bytes], Dict[str, Any]] = dict()
+        self._lock = threading.Lock()
+
+    def load(self, path: str, reader: 'AbstractDictReader') -> Dict[str, Any]:
+        with open(path, 'rb') as f:
+            data = f.read()
+        key = (type(reader), hashlib.sha1(data).digest())
+        with self._lock:
+            parsed = self._parsed.get(key)
+        if parsed is None:
+            parsed = reader._read_nested_dict_from_bytes(data)
+            if parsed is None:
+                # e.g. an empty yaml document
+                parsed = dict()
+            elif not isinstance(parsed, MappingClass):
+                raise ValueError('included file {} must be a mapping, not {}. '
+                                 .format(path, type(parsed).__name__))
+            with self._lock:
+                parsed = self._parsed.setdefault(key, parsed)
+        return parsed
+
+
+def source_path(source: ReadableSource) -> Optional[str]:
+    """Return the real path of the source if known."""
+    if isinstance(source, (str, Path)):
+        return os.path.realpath(str(source))
+    name = getattr(source, 'name', None)
+    if isinstance(name, str) and os.path.isfile(name):
+        return os.path.realpath(name)
+    return None
+
+
+def resolve_include_items(
+        items: Iterable[Tuple[str, Any]],
+        path: Optional[str],
+        reader: 'AbstractDictReader',
+        cache: IncludeCache
+) -> Iterator[Tuple[str, Any]]:
+    """Expand the include directive in normalized items.
+
+    The items of the including file are passed through as they are,
+    and the included ones are yielded at the directive
+    except for keys that have already been yielded.
+    """
+    yielded_keys = set()
+    for key, val in items:
+        if key != _normalized_include_key:
+            yielded_keys.add(key)
+            yield key, val
+            continue
+        including_paths = () if path is None else (path,)
+        included = _merge_included(val, _base_directory(path), reader, cache, including_paths)
+        for new_key, new_val in iter_normalized_items(included):
+            if new_key not in yielded_keys:
+                yield new_key, new_val
+
+
+def merge_nested_dicts(base: Mapping[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
+    """Deep-merge two nested dicts without modifying them."""
+    merged = dict(base)
+    for key, val in override.items():
+        base_val = merged.get(key)
+        if isinstance(val, MappingClass) and isinstance(base_val, MappingClass):
+            merged[key] = merge_nested_dicts(base_val, val)
+        else:
+            merged[key] = val
+    return merged
+
+
+def _merge_included(
+        includes: Any,
+        base_directory: str,
+        reader: 'AbstractDictReader',
+        cache: IncludeCache,
+        including_paths: Tuple[str, ...]
+) -> Dict[str, Any]:
+    if isinstance(includes, str):
+        includes = [includes]
+    merged: Dict[str, Any] = dict()
+    for include in includes:
+        path = os.path.realpath(os.path.join(base_directory, include))
+        if path in including_paths:
+            chain: List[str] = list(including_paths) + [path]
+            raise IncludeCycleError('cyclic include: {}'.format(' -> '.join(chain)))
+        contents = cache.load(path, reader)
+        if INCLUDE_KEY in contents:
+            contents = dict(contents)
+            nested_includes = contents.pop(INCLUDE_KEY)
+            contents = merge_nested_dicts(
+                _merge_included(nested_includes, os.path.dirname(path), reader, cache,
+                                including_paths + (path,)),
+                contents
+            )
+        merged = merge_nested_dicts(merged, contents)
+    return merged
+
+
+def _base_directory(path: Optional[str]) -> str:
+    if path is None:
+        return os.getcwd()
+    return os.path.dirname(path)
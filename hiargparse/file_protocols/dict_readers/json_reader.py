@@ -0,0 +1,33 @@
+from .abstract_dict_reader import AbstractDictReader
+from typing import Dict, Any, Iterator, Tuple, BinaryIO
+import json
+from .binary_source import read_text
+from .normalize_dict import normalized_dict, iter_normalized_items
+
+
+class JSONReader(AbstractDictReader):
+    def to_normalized_dict(self, input_documents: str) -> Dict[str, Any]:
+        nested = self._to_nested_dict(input_documents)
+        return normalized_dict(nested)
+
+    def _iter_normalized_items_from_stream(
+            self,
+            stream: BinaryIO
+    ) -> Iterator[Tuple[str, Any]]:
+        nested = self._to_nested_dict(read_text(stream))
+        yield from iter_normalized_items(nested)
+
+    def _to_nested_dict(self, input_documents: str) -> Dict[str, Any]:
+        return json.loads(input_documents)
+
+    def iter_document_offsets(self, data: bytes) -> Iterator[int]:
+        """Each non-blank line is a document (JSON Lines)."""
+        position = 0
+        size = len(data)
+        while position < size:
+            end = data.find(b'\n', position)
+            if end == -1:
+                end = size
+            if data[position:end].strip():
+                yield position
+            position = end + 1
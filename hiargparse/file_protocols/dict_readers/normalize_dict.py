@@ -1,4 +1,4 @@
-from typing import Callable, Mapping, MutableMapping, Any
+from typing import Callable, Mapping, MutableMapping, Any, Iterator, Tuple, Dict, List
 from collections.abc import Mapping as MappingClass
 
 
@@ -21,3 +21,38 @@ def normalize_dict(
         else:
             new_assign_key = concat_child(parent_key, key)
             target[new_assign_key] = val
+
+
+def normalized_dict(contents: Mapping[str, Any]) -> Dict[str, Any]:
+    """Flatten a nested dict into {'--parent-child': value} in a single pass.
+
+    Same as normalize_dict followed by added_double_hyphen.
+    """
+    return dict(iter_normalized_items(contents))
+
+
+def iter_normalized_items(
+        contents: Mapping[str, Any],
+        parent_key: str = ''
+) -> Iterator[Tuple[str, Any]]:
+    """Lazily yield the items that normalize_dict and added_double_hyphen would make.
+
+    The tree is walked iteratively and each final key is made only once
+    from its parent key.
+    """
+    stack: List[Tuple[str, Iterator[Tuple[str, Any]]]] = [(parent_key, iter(contents.items()))]
+    while stack:
+        parent_key, items = stack[-1]
+        for key, val in items:
+            if not parent_key:
+                new_key = key
+            elif not key:
+                new_key = parent_key
+            else:
+                new_key = parent_key + '-' + key
+            if type(val) is dict or isinstance(val, MappingClass):
+                stack.append((new_key, iter(val.items())))
+                break
+            yield '--' + new_key, val
+        else:
+            stack.pop()
@@ -1,8 +1,8 @@
 from .abstract_dict_reader import AbstractDictReader
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Tuple, BinaryIO
 import importlib.util
-from .normalize_dict import normalize_dict
-from .added_double_hyphen import added_double_hyphen
+from .binary_source import read_text
+from .normalize_dict import normalized_dict, iter_normalized_items
 
 # deferred erroring for toml package
 # (to work correctly without toml if you don't use toml at all)
@@ -27,9 +27,16 @@ class TOMLReader(AbstractDictReader):
 
     def to_normalized_dict(self, input_documents: str) -> Dict[str, Any]:
         nested = self._to_nested_dict(input_documents)
-        target: Dict[str, Any] = dict()
-        normalize_dict(nested, target, '')
-        return added_double_hyphen(target)
+        return normalized_dict(nested)
+
+    def _iter_normalized_items_from_stream(
+            self,
+            stream: BinaryIO
+    ) -> Iterator[Tuple[str, Any]]:
+        # toml can parse only a whole str,
+        # but we can at least skip the bytes copy and the flat dict
+        nested = self._to_nested_dict(read_text(stream))
+        yield from iter_normalized_items(nested)
 
     def _to_nested_dict(self, input_documents: str) -> Dict[str, Any]:
         return toml.loads(input_documents)
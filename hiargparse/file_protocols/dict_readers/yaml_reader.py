@@ -1,8 +1,8 @@
 from .abstract_dict_reader import AbstractDictReader
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Tuple, BinaryIO, List, Set
+from collections.abc import Mapping as MappingClass
 import importlib.util
-from .normalize_dict import normalize_dict
-from .added_double_hyphen import added_double_hyphen
+from .normalize_dict import normalized_dict, iter_normalized_items, concat_with_hyphen
 
 # deferred erroring for yaml package
 # (to work correctly without yaml if you don't use yaml at all)
@@ -11,6 +11,7 @@ if importlib.util.find_spec(name='yaml') is None:
 else:
     import yaml
     _yaml_exist = True
+    _yaml_merge_tag = 'tag:yaml.org,2002:merge'
 
 
 class YAMLReader(AbstractDictReader):
@@ -27,9 +28,98 @@ class YAMLReader(AbstractDictReader):
 
     def to_normalized_dict(self, input_documents: str) -> Dict[str, Any]:
         nested = self._to_nested_dict(input_documents)
-        target: Dict[str, Any] = dict()
-        normalize_dict(nested, target, '')
-        return added_double_hyphen(target)
+        return normalized_dict(nested)
 
     def _to_nested_dict(self, input_documents: str) -> Dict[str, Any]:
         return yaml.safe_load(input_documents)
+
+    def iter_document_offsets(self, data: bytes) -> Iterator[int]:
+        """Each document begins with a '---' line (the first one may not).
+
+        '---' must not appear at the beginning of a line in the values,
+        which holds for the files written by hiargparse.
+        """
+        marker = b'\n---'
+        if data[:3] == b'---':
+            position = 0
+        else:
+            position = data.find(marker) + 1  # 0 if not found
+            head = data[:position] if position else data
+            if head.strip():
+                # the first document without the marker
+                yield 0
+            if not position:
+                return
+        while True:
+            yield position
+            position = data.find(marker, position) + 1
+            if not position:
+                return
+
+    def _iter_normalized_items_from_stream(
+            self,
+            stream: BinaryIO
+    ) -> Iterator[Tuple[str, Any]]:
+        """Walk through the parser events and construct only one value at a time.
+
+        The stream is read chunk by chunk,
+        so the whole document is never held in memory.
+        """
+        loader = yaml.SafeLoader(stream)
+        try:
+            yield from self._iter_normalized_items_from_loader(loader)
+        finally:
+            loader.dispose()
+
+    def _iter_normalized_items_from_loader(
+            self,
+            loader: 'yaml.SafeLoader'
+    ) -> Iterator[Tuple[str, Any]]:
+        loader.get_event()  # stream start
+        if loader.check_event(yaml.StreamEndEvent):
+            # empty stream
+            return
+        loader.get_event()  # document start
+        if not loader.check_event(yaml.MappingStartEvent):
+            # an empty document or a weird one; do it in the normal way
+            root = loader.construct_document(loader.compose_node(None, None))
+            if root is not None:
+                yield from iter_normalized_items(root)
+            return
+        loader.get_event()  # root mapping start
+        parent_keys: List[str] = ['']
+        # remember yielded keys to give merged values lower priorities
+        yielded_keys: Set[str] = set()
+        while parent_keys:
+            if loader.check_event(yaml.MappingEndEvent):
+                loader.get_event()
+                parent_keys.pop()
+                continue
+            key_node = loader.compose_node(None, None)
+            parent_key = parent_keys[-1]
+            event = loader.peek_event()
+            if isinstance(event, yaml.MappingStartEvent) and event.anchor is None \
+               and key_node.tag != _yaml_merge_tag:
+                # step into the child mapping without constructing it
+                loader.get_event()
+                key = loader.construct_document(key_node)
+                parent_keys.append(concat_with_hyphen(parent_key, key))
+                continue
+            value = loader.construct_document(loader.compose_node(None, None))
+            if key_node.tag == _yaml_merge_tag:
+                # merge key ('<<'); explicit keys always take precedence
+                merged = value if isinstance(value, list) else [value]
+                for mapping in reversed(merged):
+                    for new_key, new_val in iter_normalized_items(mapping, parent_key):
+                        if new_key not in yielded_keys:
+                            yield new_key, new_val
+                continue
+            key = loader.construct_document(key_node)
+            if isinstance(value, MappingClass):
+                # anchored mapping
+                items = iter_normalized_items(value, concat_with_hyphen(parent_key, key))
+            else:
+                items = iter([('--' + concat_with_hyphen(parent_key, key), value)])
+            for new_key, new_val in items:
+                yielded_keys.add(new_key)
+                yield new_key, new_val
@@ -1,5 +1,13 @@
+from .binary_target import WritableTarget, open_binary_target
 from .abstract_dict_writer import AbstractDictWriter
 from .null_writer import NullWriter
 from .raw_writer import RawWriter
 from .toml_writer import TOMLWriter
 from .yaml_writer import YAMLWriter
+from .nested_dict_writer import NestedDictWriter
+from .json_writer import JSONWriter
+from .binary_writer import BinaryWriter
+from .key_index_writer import KeyIndexWriter
+from .text_output import TextOutput
+from .values_writer import ValuesWriter
+from .recording_writer import RecordingWriter
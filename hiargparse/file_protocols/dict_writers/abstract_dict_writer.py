@@ -1,11 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Union, Sequence, Any, List
+from typing import Union, Sequence, Any, List, TextIO, Optional, Tuple
 from contextlib import contextmanager
 from argparse import Action
 from hiargparse.miscs import DirtyAccessToArgparse
+from .text_output import TextOutput
 
 
 class AbstractDictWriter(ABC):
+    # True if the output is bytes (see write_out_bytes)
+    binary: bool = False
+
+    def __init__(self) -> None:
+        # kept in memory until redirected to the file given by stream_to
+        self._output = TextOutput()
+
     @abstractmethod
     def begin_section(self, name: str) -> None:
         raise NotImplementedError()
@@ -31,10 +39,47 @@ class AbstractDictWriter(ABC):
     ) -> None:
         raise NotImplementedError
 
+    def add_actual_value(
+            self,
+            name: str,
+            value: Any
+    ) -> None:
+        """Write an actual value (not a metavar) so that the reader can read it back."""
+        raise NotImplementedError('{} cannot write actual values. '.format(type(self).__name__))
+
     @abstractmethod
     def write_out(self) -> str:
         raise NotImplementedError()
 
+    def write_out_bytes(self) -> bytes:
+        """write_out for binary files."""
+        return self.write_out().encode('utf-8')
+
+    def template_key(self) -> Optional[Tuple[Any, ...]]:
+        """Return a key which identifies the writer class and its options.
+
+        Writers with the same key must render the same template for the same provider tree.
+        None (the default) means that the templates of this writer are not cached.
+        """
+        return None
+
+    def stream_to(self, file: TextIO) -> None:
+        """Write the output to the given text file object instead of returning it.
+
+        Call this before adding anything and call finish() at last.
+        Writers that cannot stream write everything at finish().
+        """
+        self._output.redirect(file)
+
+    def finish(self) -> None:
+        """Finish writing to the file given by stream_to()."""
+        self._end_root_section()
+        self._output.flush()
+
+    def _end_root_section(self) -> None:
+        # writers that cannot stream write everything at last
+        self._output.write(self.write_out())
+
     @contextmanager
     def make_section(self, name: str) -> Any:
         """call begin_section and ensure to call end_section later.
@@ -0,0 +1,19 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Union, BinaryIO, Iterator
+
+
+WritableTarget = Union[str, Path, BinaryIO]
+
+
+@contextmanager
+def open_binary_target(target: WritableTarget) -> Iterator[BinaryIO]:
+    """Open the given path or binary file object as a writable binary stream.
+
+    A given file object is not closed.
+    """
+    if isinstance(target, (str, Path)):
+        with open(str(target), 'wb') as f:
+            yield f
+    else:
+        yield target
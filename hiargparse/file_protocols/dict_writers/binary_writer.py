@@ -0,0 +1,22 @@
+from .nested_dict_writer import NestedDictWriter
+from typing import Optional, Tuple, Any
+from hiargparse.file_protocols import binary_format
+
+
+class BinaryWriter(NestedDictWriter):
+    """Writer for hiargparse.file_protocols.binary_format.
+
+    The result is bytes; use write_out_bytes instead of write_out.
+    """
+
+    binary = True
+
+    def template_key(self) -> Optional[Tuple[Any, ...]]:
+        return (type(self).__module__, type(self).__qualname__)
+
+    def write_out(self) -> str:
+        raise TypeError('{} writes bytes; use write_out_bytes instead. '
+                        .format(type(self).__name__))
+
+    def write_out_bytes(self) -> bytes:
+        return binary_format.dumps(self._root)
@@ -0,0 +1,29 @@
+from .nested_dict_writer import NestedDictWriter
+import json
+from typing import Optional, Tuple, Any
+
+
+class JSONWriter(NestedDictWriter):
+    """Writer for json.
+
+    Actual values that json does not support are written as their str.
+    If indent_size is None, the whole document is written in one line (JSON Lines).
+    """
+
+    def __init__(
+            self,
+            indent_size: Optional[int] = 2
+    ) -> None:
+        super().__init__()
+        self._indent_size = indent_size
+
+    def template_key(self) -> Optional[Tuple[Any, ...]]:
+        return (type(self).__module__, type(self).__qualname__, self._indent_size)
+
+    def write_out(self) -> str:
+        return json.dumps(self._root, indent=self._indent_size, default=str) + '\n'
+
+    def _end_root_section(self) -> None:
+        # json.dump writes chunk by chunk
+        json.dump(self._root, self._output, indent=self._indent_size, default=str)
+        self._output.write('\n')
@@ -0,0 +1,64 @@
+from .abstract_dict_writer import AbstractDictWriter
+from argparse import Action
+from typing import Union, Sequence, Dict, List, Any
+
+
+class KeyIndexWriter(AbstractDictWriter):
+    """A writer that writes nothing but an index for the readers.
+
+    The index maps the normalized keys that the readers make from
+    the written sections (like '--Son-GrandSon-piyo') to the dests of the arguments,
+    so that read keys are looked up without any string matching.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.index: Dict[str, str] = dict()
+        self._section_keys: List[str] = ['--']
+
+    def begin_section(self, name: str) -> None:
+        self._section_keys.append(self._child_key(name))
+
+    def end_section(self) -> None:
+        self._section_keys.pop()
+
+    def add_comment(
+            self,
+            comment: str
+    ) -> None:
+        pass
+
+    def add_value(
+            self,
+            name: str,
+            values: Union[str, Sequence[str]],
+            comment: str,
+            comment_outs: bool
+    ) -> None:
+        pass
+
+    def add_actual_value(
+            self,
+            name: str,
+            value: Any
+    ) -> None:
+        pass
+
+    def add_argument(
+            self,
+            action: Action,
+            dest: str,
+            comment_outs: bool
+    ) -> None:
+        # skip the expansion of the help text
+        self.index[self._child_key(dest)] = action.dest
+
+    def write_out(self) -> str:
+        return ''
+
+    def _child_key(self, name: str) -> str:
+        # same as dict_readers.normalize_dict
+        parent_key = self._section_keys[-1]
+        if parent_key == '--' or not name:
+            return parent_key + name
+        return parent_key + '-' + name
@@ -0,0 +1,63 @@
+from .abstract_dict_writer import AbstractDictWriter
+from abc import abstractmethod
+from typing import Union, Sequence, Dict, Any, List
+
+
+class NestedDictWriter(AbstractDictWriter):
+    """A base class for writers that serialize a whole nested dict at once.
+
+    Formats like JSON have no comments,
+    so commented-out values are written as null (skipped by the readers)
+    and comments are dropped.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._root: Dict[str, Any] = dict()
+        self._sections: List[Dict[str, Any]] = [self._root]
+
+    def begin_section(self, name: str) -> None:
+        section: Dict[str, Any] = dict()
+        self._sections[-1][name] = section
+        self._sections.append(section)
+
+    def end_section(self) -> None:
+        self._sections.pop()
+
+    def add_comment(
+            self,
+            comment: str
+    ) -> None:
+        pass
+
+    def add_value(
+            self,
+            name: str,
+            values: Union[str, Sequence[str]],
+            comment: str,
+            comment_outs: bool
+    ) -> None:
+        value: Any
+        if comment_outs:
+            value = None
+        elif isinstance(values, str):
+            value = values
+        elif not values:
+            # nargs == 0
+            value = True
+        else:
+            value = list(values)
+        self._sections[-1][name] = value
+
+    def add_actual_value(
+            self,
+            name: str,
+            value: Any
+    ) -> None:
+        if isinstance(value, tuple):
+            value = list(value)
+        self._sections[-1][name] = value
+
+    @abstractmethod
+    def write_out(self) -> str:
+        raise NotImplementedError()
@@ -1,12 +1,12 @@
 from .abstract_dict_writer import AbstractDictWriter
-from typing import Union, Sequence
+from typing import Union, Sequence, Any
 
 
 class NullWriter(AbstractDictWriter):
     def __init__(
             self
     ) -> None:
-        pass
+        super().__init__()
 
     def begin_section(self, name: str) -> None:
         pass
@@ -29,5 +29,12 @@ class NullWriter(AbstractDictWriter):
     ) -> None:
         pass
 
+    def add_actual_value(
+            self,
+            name: str,
+            value: Any
+    ) -> None:
+        pass
+
     def write_out(self) -> str:
         return ''
@@ -1,5 +1,5 @@
 from .abstract_dict_writer import AbstractDictWriter
-from typing import Union, Sequence, List
+from typing import Union, Sequence, List, Any, Optional, Tuple
 
 
 class RawWriter(AbstractDictWriter):
@@ -7,8 +7,8 @@ class RawWriter(AbstractDictWriter):
             self,
             indent_size: int = 2
     ) -> None:
+        super().__init__()
         self._indent_size = indent_size
-        self._texts = ''
         self._indent_level = 0
         self._section_names: List[str] = list()
 
@@ -54,9 +54,19 @@ class RawWriter(AbstractDictWriter):
             self._add_line('{} = {}'.format(name, values))
         self._add_line()
 
+    def add_actual_value(
+            self,
+            name: str,
+            value: Any
+    ) -> None:
+        self._add_line('{} = {!r}'.format(name, value))
+
+    def template_key(self) -> Optional[Tuple[Any, ...]]:
+        return (type(self).__module__, type(self).__qualname__, self._indent_size)
+
     def write_out(self) -> str:
-        self._end_root_section()
-        return self._texts
+        self.finish()
+        return self._output.getvalue()
 
     def _indent(self) -> None:
         self._indent_level += 1
@@ -72,4 +82,4 @@ class RawWriter(AbstractDictWriter):
             new_line = '\n'
         else:
             new_line = '{}{}\n'.format(self._line_header(), line)
-        self._texts += new_line
+        self._output.write(new_line)
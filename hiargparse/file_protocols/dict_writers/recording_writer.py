@@ -0,0 +1,62 @@
+from .abstract_dict_writer import AbstractDictWriter
+from argparse import Action
+from typing import Union, Sequence, Any, List, Tuple
+
+
+class RecordingWriter(AbstractDictWriter):
+    """Record the sections and the arguments to replay them to other writers.
+
+    Registering arguments is much slower than writing them,
+    so record them once and replay them to as many writers as you want,
+    e.g. one writer per document of a batch.
+    All the replayed documents have the same key ordering.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._events: List[Tuple[str, Tuple[Any, ...]]] = list()
+
+    def begin_section(self, name: str) -> None:
+        self._events.append(('begin_section', (name, )))
+
+    def end_section(self) -> None:
+        self._events.append(('end_section', ()))
+
+    def add_comment(
+            self,
+            comment: str
+    ) -> None:
+        self._events.append(('add_comment', (comment, )))
+
+    def add_value(
+            self,
+            name: str,
+            values: Union[str, Sequence[str]],
+            comment: str,
+            comment_outs: bool
+    ) -> None:
+        self._events.append(('add_value', (name, values, comment, comment_outs)))
+
+    def add_actual_value(
+            self,
+            name: str,
+            value: Any
+    ) -> None:
+        self._events.append(('add_actual_value', (name, value)))
+
+    def add_argument(
+            self,
+            action: Action,
+            dest: str,
+            comment_outs: bool
+    ) -> None:
+        # help texts are expanded (if needed) by the replayed writers
+        self._events.append(('add_argument', (action, dest, comment_outs)))
+
+    def replay(self, writer: AbstractDictWriter) -> None:
+        """Call the recorded methods of the writer in the same order."""
+        for method_name, args in self._events:
+            getattr(writer, method_name)(*args)
+
+    def write_out(self) -> str:
+        return ''
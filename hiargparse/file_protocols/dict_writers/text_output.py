@@ -0,0 +1,39 @@
+from typing import List, Optional, TextIO
+
+
+class TextOutput:
+    """Buffered text output for the dict writers.
+
+    Texts are kept as a list of chunks until redirected to a file object;
+    after that, they are written to the file every buffer_size characters.
+    Either way the cost is linear in the size of the output.
+    """
+
+    def __init__(self, buffer_size: int = 1 << 16) -> None:
+        self._buffer_size = buffer_size
+        self._chunks: List[str] = list()
+        self._size = 0
+        self._file: Optional[TextIO] = None
+
+    def write(self, text: str) -> None:
+        self._chunks.append(text)
+        if self._file is not None:
+            self._size += len(text)
+            if self._size >= self._buffer_size:
+                self.flush()
+
+    def redirect(self, file: TextIO) -> None:
+        """Write the kept and the following texts to the file."""
+        self._file = file
+        self.flush()
+
+    def flush(self) -> None:
+        if self._file is None or not self._chunks:
+            return
+        self._file.write(''.join(self._chunks))
+        self._chunks = list()
+        self._size = 0
+
+    def getvalue(self) -> str:
+        """Return the kept texts (empty if redirected)."""
+        return ''.join(self._chunks)
@@ -1,5 +1,7 @@
 from .abstract_dict_writer import AbstractDictWriter
-from typing import Union, Sequence, List
+from typing import Union, Sequence, List, Any, Optional, Tuple
+import json
+import math
 
 
 class TOMLWriter(AbstractDictWriter):
@@ -7,8 +9,8 @@ class TOMLWriter(AbstractDictWriter):
             self,
             indent_size: int = 2
     ) -> None:
+        super().__init__()
         self._indent_size = indent_size
-        self._texts = ''
         self._indent_level = 0
         self._section_names: List[str] = list()
 
@@ -50,9 +52,22 @@ class TOMLWriter(AbstractDictWriter):
             self._add_line('{} = {}'.format(name, values))
         self._add_line()
 
+    def add_actual_value(
+            self,
+            name: str,
+            value: Any
+    ) -> None:
+        if value is None:
+            # toml has no null; leave it default
+            return
+        self._add_line('{} = {}'.format(name, format_toml_value(value)))
+
+    def template_key(self) -> Optional[Tuple[Any, ...]]:
+        return (type(self).__module__, type(self).__qualname__, self._indent_size)
+
     def write_out(self) -> str:
-        self._end_root_section()
-        return self._texts
+        self.finish()
+        return self._output.getvalue()
 
     def _indent(self) -> None:
         self._indent_level += 1
@@ -68,4 +83,24 @@ class TOMLWriter(AbstractDictWriter):
             new_line = '\n'
         else:
             new_line = '{}{}\n'.format(self._line_header(), line)
-        self._texts += new_line
+        self._output.write(new_line)
+
+
+def format_toml_value(value: Any) -> str:
+    """Format a value as a toml inline value."""
+    if value is True:
+        return 'true'
+    elif value is False:
+        return 'false'
+    elif isinstance(value, int):
+        return str(value)
+    elif isinstance(value, float):
+        if math.isnan(value):
+            return 'nan'
+        elif math.isinf(value):
+            return 'inf' if value > 0 else '-inf'
+        return repr(value)
+    elif isinstance(value, (list, tuple)):
+        return '[{}]'.format(', '.join([format_toml_value(val) for val in value]))
+    # others are read back as str and converted by argparse
+    return json.dumps(str(value), ensure_ascii=False)
@@ -0,0 +1,152 @@
+from .abstract_dict_writer import AbstractDictWriter
+from hiargparse.miscs import DirtyAccessToArgparse
+from argparse import Action
+from typing import Union, Sequence, TextIO, Any, List, TYPE_CHECKING
+
+# avoid cyclic importing
+if TYPE_CHECKING:
+    from hiargparse.alternatives import Namespace
+
+
+class ValuesWriter(AbstractDictWriter):
+    """Wrap a writer to write the actual values in a Namespace instead of the metavars.
+
+    The sections are the same as the templates,
+    so the result can be read back by the matching reader.
+    Help texts are not expanded nor written.
+    If sparse, only the values which differ from their defaults are written;
+    the reader fills in the rest from the defaults.
+    Sections are begun lazily, so that sections without any values are omitted.
+    Bools of the arguments taking values are written as the tokens
+    which their types read back (e.g. 'True' and '' for bool),
+    the values of count and append actions are written as they are
+    (the readers repeat the options), and append_const actions are refused
+    unless they have their defaults.
+    """
+
+    def __init__(
+            self,
+            writer: AbstractDictWriter,
+            namespace: 'Namespace',
+            sparse: bool = False
+    ) -> None:
+        super().__init__()
+        self._writer = writer
+        self._namespace = namespace
+        self._sparse = sparse
+        self.binary = writer.binary
+        self._pending_sections: List[str] = list()
+
+    def begin_section(self, name: str) -> None:
+        self._pending_sections.append(name)
+
+    def end_section(self) -> None:
+        if self._pending_sections:
+            self._pending_sections.pop()
+        else:
+            self._writer.end_section()
+
+    def _begin_pending_sections(self) -> None:
+        for name in self._pending_sections:
+            self._writer.begin_section(name)
+        self._pending_sections.clear()
+
+    def add_comment(
+            self,
+            comment: str
+    ) -> None:
+        self._begin_pending_sections()
+        self._writer.add_comment(comment)
+
+    def add_value(
+            self,
+            name: str,
+            values: Union[str, Sequence[str]],
+            comment: str,
+            comment_outs: bool
+    ) -> None:
+        self._begin_pending_sections()
+        self._writer.add_value(name, values, comment, comment_outs)
+
+    def add_actual_value(
+            self,
+            name: str,
+            value: Any
+    ) -> None:
+        self._begin_pending_sections()
+        self._writer.add_actual_value(name, value)
+
+    def add_argument(
+            self,
+            action: Action,
+            dest: str,
+            comment_outs: bool
+    ) -> None:
+        try:
+            value = self._namespace[action.dest]
+        except AttributeError:
+            # not in the namespace; leave it default
+            return
+        if self._sparse and self._is_default(action, value):
+            return
+        if isinstance(action, DirtyAccessToArgparse.AppendConstAction):
+            if value is not None and not self._is_default(action, value):
+                raise ValueError('{} is an append_const action, whose values cannot be written. '
+                                 .format(action.dest))
+            return
+        if isinstance(action, DirtyAccessToArgparse.CountAction):
+            # the readers repeat the option (see sources.normalized_items_to_args)
+            self.add_actual_value(dest, value)
+            return
+        if action.nargs == 0:
+            # the readers treat true as 'the option is given'
+            if value == action.const:
+                self.add_actual_value(dest, True)
+            return
+        self.add_actual_value(dest, self._to_tokens(action, value))
+
+    @classmethod
+    def _to_tokens(cls, action: Action, value: Any) -> Any:
+        # the readers give bools as 'the option is given' (without a token),
+        # so the bools of the actions taking values are written as tokens
+        if isinstance(value, (list, tuple)):
+            return [cls._to_tokens(action, element) for element in value]
+        if not isinstance(value, bool):
+            return value
+        # bool('False') is True; only '' gives False
+        candidates = [str(value)] if value else [str(value), '']
+        for token in candidates:
+            try:
+                if callable(action.type) and action.type(token) is value:
+                    return token
+            except (TypeError, ValueError):
+                pass
+        raise ValueError('{} cannot be written as a token that the type of {} reads back. '
+                         .format(value, action.dest))
+
+    @staticmethod
+    def _is_default(action: Action, value: Any) -> bool:
+        default = action.default
+        # argparse converts str defaults with the type
+        if isinstance(default, str) and callable(action.type):
+            try:
+                default = action.type(default)
+            except (TypeError, ValueError):
+                return False
+        try:
+            return bool(value == default)
+        except Exception:
+            # e.g. arrays which do not compare to a bool
+            return False
+
+    def write_out(self) -> str:
+        return self._writer.write_out()
+
+    def write_out_bytes(self) -> bytes:
+        return self._writer.write_out_bytes()
+
+    def stream_to(self, file: TextIO) -> None:
+        self._writer.stream_to(file)
+
+    def finish(self) -> None:
+        self._writer.finish()
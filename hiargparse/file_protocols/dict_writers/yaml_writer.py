@@ -1,5 +1,7 @@
 from .abstract_dict_writer import AbstractDictWriter
-from typing import Union, Sequence
+from typing import Union, Sequence, Any, Optional, Tuple
+import json
+import math
 
 
 class YAMLWriter(AbstractDictWriter):
@@ -7,8 +9,8 @@ class YAMLWriter(AbstractDictWriter):
             self,
             indent_size: int = 2
     ) -> None:
+        super().__init__()
         self._indent_size = indent_size
-        self._texts = ''
         self._indent_level = 0
 
         self._begin_root_section()
@@ -55,9 +57,19 @@ class YAMLWriter(AbstractDictWriter):
             self._dedent()
         self._add_line()
 
+    def add_actual_value(
+            self,
+            name: str,
+            value: Any
+    ) -> None:
+        self._add_line('{}: {}'.format(name, format_yaml_value(value)))
+
+    def template_key(self) -> Optional[Tuple[Any, ...]]:
+        return (type(self).__module__, type(self).__qualname__, self._indent_size)
+
     def write_out(self) -> str:
-        self._end_root_section()
-        return self._texts
+        self.finish()
+        return self._output.getvalue()
 
     def _indent(self) -> None:
         self._indent_level += 1
@@ -73,4 +85,26 @@ class YAMLWriter(AbstractDictWriter):
             new_line = '\n'
         else:
             new_line = '{}{}\n'.format(self._line_header(), line)
-        self._texts += new_line
+        self._output.write(new_line)
+
+
+def format_yaml_value(value: Any) -> str:
+    """Format a value as a yaml flow node."""
+    if value is None:
+        return 'null'
+    elif value is True:
+        return 'true'
+    elif value is False:
+        return 'false'
+    elif isinstance(value, int):
+        return str(value)
+    elif isinstance(value, float):
+        if math.isnan(value):
+            return '.nan'
+        elif math.isinf(value):
+            return '.inf' if value > 0 else '-.inf'
+        return repr(value)
+    elif isinstance(value, (list, tuple)):
+        return '[{}]'.format(', '.join([format_yaml_value(val) for val in value]))
+    # others are read back as str and converted by argparse
+    return json.dumps(str(value), ensure_ascii=False)
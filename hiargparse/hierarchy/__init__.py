@@ -1,2 +1,3 @@
 from .hierarchy import parents_and_key_to_long_key, pop_highest_parent_name, iter_parents, long_key_to_parents_and_key, is_hierarchical_key
+from .hierarchy import long_key_to_dotted_key
 from .format_parent_names import format_parent_names, format_parent_names_and_key
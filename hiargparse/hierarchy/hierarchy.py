@@ -36,7 +36,7 @@ def iter_parents(name: str) -> Generator[Tuple[str, str], None, None]:
         if parent is not None:
             yield parent, remains
         else:
-            raise StopIteration()
+            return
 
 
 def long_key_to_parents_and_key(name: str) -> Tuple[List[str], str]:
@@ -49,3 +49,9 @@ def long_key_to_parents_and_key(name: str) -> Tuple[List[str], str]:
 
 def is_hierarchical_key(name: str) -> bool:
     return pop_highest_parent_name(name)[0] is not None
+
+
+def long_key_to_dotted_key(name: str) -> str:
+    """Human-readable key like 'Son.GS.huga'."""
+    parents, key = long_key_to_parents_and_key(name)
+    return '.'.join(parents + [key])
@@ -1,2 +1,6 @@
 from .if_none_then import if_none_then
 from .dirty_accesses import DirtyAccessToArgparse
+from .stable_repr import stable_repr
+from .instrumentation import instrument, InstrumentationReport
+from .memoized_type import MemoizedType, TypeCacheInfo, unwrap_type, type_cache_info
+from .suggestion_index import SuggestionIndex
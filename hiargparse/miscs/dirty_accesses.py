@@ -1,28 +1,61 @@
 import argparse
-from typing import List, Tuple
+import threading
+from typing import Any, Dict, List, Tuple
 
 
 class DirtyAccessToArgparse:
     """Treats all non-public accesses to argparse."""
 
     ArgumentGroup = argparse._ArgumentGroup
+    # the actions which accumulate their occurrences
+    CountAction = argparse._CountAction
+    AppendAction = argparse._AppendAction
+    AppendConstAction = argparse._AppendConstAction
+    # new in python 3.8; isinstance(action, ()) is always False
+    ExtendAction: Any = getattr(argparse, '_ExtendAction', ())
 
-    help_instance = argparse.HelpFormatter(prog='')
+    # formatters are not meant to be shared; keep one per thread
+    _local = threading.local()
+
+    @staticmethod
+    def get_help_instance() -> argparse.HelpFormatter:
+        local = DirtyAccessToArgparse._local
+        try:
+            return local.help_instance
+        except AttributeError:
+            local.help_instance = argparse.HelpFormatter(prog='')
+            return local.help_instance
+
+    @staticmethod
+    def get_actions(parser: argparse.ArgumentParser) -> List[argparse.Action]:
+        actions: List[argparse.Action] = parser._actions  # type: ignore
+        return actions
+
+    @staticmethod
+    def get_option_string_actions(parser: argparse.ArgumentParser) -> Dict[str, argparse.Action]:
+        option_string_actions: Dict[str, argparse.Action] = (parser  # type: ignore
+                                                             ._option_string_actions)
+        return option_string_actions
 
     @staticmethod
     def expand_help_text_from_action(action: argparse.Action) -> str:
-        help_text: str = DirtyAccessToArgparse.help_instance._expand_help(action)  # type: ignore
+        help_instance = DirtyAccessToArgparse.get_help_instance()
+        help_text: str = help_instance._expand_help(action)  # type: ignore
         return help_text
 
     @staticmethod
     def get_metavar_from_optional_action(action: argparse.Action) -> List[str]:
-
-        default_metavar: str = (DirtyAccessToArgparse  # type: ignore
-                                .help_instance
+        help_instance = DirtyAccessToArgparse.get_help_instance()
+        default_metavar: str = (help_instance  # type: ignore
                                 ._get_default_metavar_for_optional(action))
         metavar_size = 1
-        metavars: Tuple[str, ...] = (DirtyAccessToArgparse  # type: ignore
-                                     .help_instance
+        metavars: Tuple[str, ...] = (help_instance  # type: ignore
                                      ._metavar_formatter(action, default_metavar)
                                      (metavar_size))
         return list(metavars)
+
+    @staticmethod
+    def get_value(parser: argparse.ArgumentParser, action: argparse.Action, arg_string: str) -> Any:
+        """Convert a token with the type of the action as argparse.ArgumentParser does."""
+        value = argparse.ArgumentParser._get_value(parser, action, arg_string)  # type: ignore
+        return value
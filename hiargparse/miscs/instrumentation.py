@@ -0,0 +1,185 @@
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, Tuple, Iterator, Optional, Any, List
+
+
+# (phase, path, seconds, counts)
+PhaseCallback = Callable[[str, str, float, Dict[str, int]], None]
+
+# the phases reported by hiargparse
+PHASES = ('provider_resolution', 'registration', 'parsing', 'type_conversion',
+          'propagation', 'deferred_actions')
+
+_local = threading.local()
+
+
+class PhaseStats:
+    """Accumulated wall time, calls and counts of a phase at a path."""
+
+    __slots__ = ('seconds', 'calls', 'counts')
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.calls = 0
+        self.counts: Dict[str, int] = dict()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(seconds=self.seconds, calls=self.calls, counts=dict(self.counts))
+
+
+class InstrumentationReport:
+    """Per-phase timings collected while instrument() is active.
+
+    The phases are
+        provider_resolution: getting the ArgsProviders of the child providers,
+        registration: adding the arguments to the parser,
+        parsing: parsing the tokens by argparse (type_conversion is a part of it),
+        type_conversion: converting the values with the types of the arguments,
+        propagation: copying the propagated values (a part of deferred_actions),
+        deferred_actions: actions registered to ArgumentParser after parsing.
+    Each phase is broken down by the path of the dests of the child providers
+    ('' for the root, 'Car.front_tire' for a grandchild).
+    If trace_memory and tracemalloc is tracing, the phases also count
+    'allocated_bytes', the growth of the traced memory during them
+    (except type_conversion).
+    """
+
+    def __init__(self, callback: PhaseCallback = None, trace_memory: bool = False) -> None:
+        self.stats: Dict[Tuple[str, str], PhaseStats] = dict()
+        self.trace_memory = trace_memory
+        self._callback = callback
+
+    def add(self, phase: str, path: str, seconds: float, counts: Dict[str, int]) -> None:
+        stats = self.stats.get((phase, path))
+        if stats is None:
+            stats = self.stats[phase, path] = PhaseStats()
+        stats.seconds += seconds
+        stats.calls += 1
+        for name, count in counts.items():
+            stats.counts[name] = stats.counts.get(name, 0) + count
+        if self._callback is not None:
+            self._callback(phase, path, seconds, counts)
+
+    def total(self, phase: str) -> PhaseStats:
+        """Sum up the phase over all the paths."""
+        total = PhaseStats()
+        for (stats_phase, _), stats in self.stats.items():
+            if stats_phase != phase:
+                continue
+            total.seconds += stats.seconds
+            total.calls += stats.calls
+            for name, count in stats.counts.items():
+                total.counts[name] = total.counts.get(name, 0) + count
+        return total
+
+    def by_path(self, phase: str) -> Dict[str, PhaseStats]:
+        return {path: stats for (stats_phase, path), stats in self.stats.items()
+                if stats_phase == phase}
+
+    def as_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """{phase: {path: {seconds, calls, counts}}}, which can be dumped as json."""
+        result: Dict[str, Dict[str, Dict[str, Any]]] = dict()
+        for (phase, path), stats in self.stats.items():
+            result.setdefault(phase, dict())[path] = stats.as_dict()
+        return result
+
+    def format(self, by_path: bool = False) -> str:
+        """Format the report as a table."""
+        lines = ['{:<20} {:<30} {:>10} {:>7}  {}'.format('phase', 'path', 'time [ms]',
+                                                         'calls', 'counts')]
+        for phase in PHASES:
+            rows: List[Tuple[str, PhaseStats]]
+            if by_path:
+                rows = sorted(self.by_path(phase).items())
+            else:
+                rows = [('*', self.total(phase))]
+            for path, stats in rows:
+                if not stats.calls:
+                    continue
+                counts = ', '.join('{}={}'.format(name, count)
+                                   for name, count in sorted(stats.counts.items()))
+                lines.append('{:<20} {:<30} {:>10.3f} {:>7}  {}'.format(
+                    phase, path, stats.seconds * 1e3, stats.calls, counts))
+        return '\n'.join(lines)
+
+
+class _Phase:
+    __slots__ = ('_report', '_phase', '_path', '_counts', '_begin', '_begin_memory')
+
+    def __init__(self, report: InstrumentationReport, phase: str, path: str) -> None:
+        self._report = report
+        self._phase = phase
+        self._path = path
+        self._counts: Dict[str, int] = dict()
+
+    def count(self, name: str, number: int = 1) -> None:
+        self._counts[name] = self._counts.get(name, 0) + number
+
+    def __enter__(self) -> '_Phase':
+        self._begin_memory = None
+        if self._report.trace_memory and tracemalloc.is_tracing():
+            self._begin_memory = tracemalloc.get_traced_memory()[0]
+        self._begin = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        seconds = time.perf_counter() - self._begin
+        if self._begin_memory is not None:
+            self.count('allocated_bytes', tracemalloc.get_traced_memory()[0] - self._begin_memory)
+        self._report.add(self._phase, self._path, seconds, self._counts)
+
+
+class _NullPhase:
+    """Do nothing; used while instrument() is not active."""
+
+    def count(self, name: str, number: int = 1) -> None:
+        pass
+
+    def __enter__(self) -> '_NullPhase':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_null_phase = _NullPhase()
+
+
+@contextmanager
+def instrument(
+        callback: PhaseCallback = None,
+        trace_memory: bool = False
+) -> Iterator[InstrumentationReport]:
+    """Collect the phase timings of hiargparse in this thread.
+
+    usage:
+        with instrument() as report:
+            params = parser.parse_args()
+        print(report.format(by_path=True))
+
+    The callback (if given) is called at the end of each phase
+    with (phase, path, seconds, counts).
+    See InstrumentationReport for trace_memory.
+    While no instrument() is active, the cost is a thread-local lookup per phase.
+    """
+    report = InstrumentationReport(callback, trace_memory)
+    previous = current_report()
+    _local.report = report
+    try:
+        yield report
+    finally:
+        _local.report = previous
+
+
+def current_report() -> Optional[InstrumentationReport]:
+    return getattr(_local, 'report', None)
+
+
+def phase(name: str, path: str = '') -> Any:
+    """Return a context manager to measure the phase (do nothing if not instrumented)."""
+    report = getattr(_local, 'report', None)
+    if report is None:
+        return _null_phase
+    return _Phase(report, name, path)
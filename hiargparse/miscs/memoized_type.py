@@ -0,0 +1,81 @@
+import argparse
+import threading
+from collections import OrderedDict
+from typing import Callable, Any, Dict, NamedTuple
+from .dirty_accesses import DirtyAccessToArgparse
+
+
+class TypeCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class MemoizedType:
+    """Wrap a type of arguments to memoize its conversions by a bounded LRU.
+
+    The conversions are keyed by the input strings, so the type must be pure:
+    the same string always gives the same value, without any side effects.
+    The values are shared among the conversions; do not mutate them.
+    Failed conversions are not cached.
+    It looks like the wrapped type for argparse (its __name__ is used in messages),
+    and the wrapped type is available as __wrapped__.
+    """
+
+    def __init__(self, type_: Callable[[str], Any], maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError('maxsize must be positive, not {}'.format(maxsize))
+        self.__wrapped__ = type_
+        self.__name__ = getattr(type_, '__name__', repr(type_))
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, string: Any) -> Any:
+        if not isinstance(string, str):
+            return self.__wrapped__(string)
+        with self._lock:
+            try:
+                value = self._cache[string]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._cache.move_to_end(string)
+                self.hits += 1
+                return value
+        # convert out of the lock; a slow type does not block the others
+        value = self.__wrapped__(string)
+        with self._lock:
+            self._cache[string] = value
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return value
+
+    def __repr__(self) -> str:
+        return '{}({!r}, maxsize={})'.format(type(self).__name__, self.__wrapped__, self.maxsize)
+
+    def cache_info(self) -> TypeCacheInfo:
+        with self._lock:
+            return TypeCacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+
+def unwrap_type(type_: Any) -> Any:
+    """Return the type wrapped by MemoizedType (or the given type as is)."""
+    if isinstance(type_, MemoizedType):
+        return type_.__wrapped__
+    return type_
+
+
+def type_cache_info(parser: argparse.ArgumentParser) -> Dict[str, TypeCacheInfo]:
+    """Collect the statistics of the memoized types in the parser by their dests."""
+    return {action.dest: action.type.cache_info()
+            for action in DirtyAccessToArgparse.get_actions(parser)
+            if isinstance(action.type, MemoizedType)}
@@ -0,0 +1,44 @@
+import hashlib
+from types import CodeType
+from typing import Any
+
+
+def stable_repr(value: Any) -> str:
+    """Return a repr of the value which is the same among processes if possible.
+
+    Classes and functions are represented by their import paths
+    (functions also by a digest of their code) instead of their addresses,
+    and the items of dicts and sets are sorted.
+    Other objects fall back to repr, which may contain their addresses.
+    The values captured by closures (and the defaults of functions) are not included,
+    so closures made by one function have the same repr.
+    """
+    if value is None or isinstance(value, (str, int, float)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return '{}[{}]'.format(type(value).__name__, ', '.join(stable_repr(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return '{}{{{}}}'.format(type(value).__name__,
+                                 ', '.join(sorted(stable_repr(v) for v in value)))
+    if isinstance(value, dict):
+        items = sorted('{}: {}'.format(stable_repr(k), stable_repr(v)) for k, v in value.items())
+        return '{{{}}}'.format(', '.join(items))
+    if hasattr(value, '__qualname__') and hasattr(value, '__module__'):
+        path = '{}.{}'.format(value.__module__, value.__qualname__)
+        code = getattr(value, '__code__', None)
+        if code is not None:
+            # lambdas and redefined functions share their names
+            path += '@{}'.format(_code_digest(code))
+        return path
+    return repr(value)
+
+
+def _code_digest(code: CodeType) -> str:
+    digest = hashlib.sha1(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            # nested functions; their reprs contain addresses
+            digest.update(_code_digest(const).encode('utf-8'))
+        else:
+            digest.update(repr(const).encode('utf-8'))
+    return digest.hexdigest()[:12]
@@ -0,0 +1,127 @@
+import bisect
+import re
+import threading
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Iterable, List, Dict, Optional, Tuple
+
+_negative_number = re.compile(r'^-\d+$|^-\d*\.\d+$')
+
+
+class SuggestionIndex:
+    """Find the option strings close to a misspelled one.
+
+    The option strings are sorted, so the options under a hierarchical prefix
+    like '--Car-ftire-' are a range of them.
+    A word is searched in the range of its longest known prefix first,
+    and then in those of the shorter prefixes (up to all the options) if nothing is close.
+    Small ranges are scanned, and large ones are narrowed by a trigram index
+    (built at the first use) before ranking by difflib.
+    """
+
+    # ranges up to this size are ranked without the trigram index
+    scan_limit = 256
+    # the number of the trigram candidates ranked by difflib
+    candidate_limit = 32
+
+    def __init__(self, option_strings: Iterable[str]) -> None:
+        self._options = sorted(set(option_strings))
+        self._trigrams: Optional[Dict[str, List[int]]] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+    def suggest(self, word: str, limit: int = 3, cutoff: float = 0.6) -> List[str]:
+        """Return up to limit option strings similar to word, the closest first."""
+        word = word.split('=', 1)[0]
+        searched: Tuple[int, int] = (0, 0)
+        for prefix in reversed(_hierarchical_prefixes(word)):
+            low, high = self._range(prefix)
+            if high - low == 0 or (low, high) == searched:
+                continue
+            searched = (low, high)
+            matches = self._suggest_in(word, low, high, limit, cutoff)
+            if matches:
+                return matches
+        return []
+
+    def format_unrecognized(self, arguments: List[str]) -> str:
+        """Format the message of argparse about unrecognized arguments with suggestions."""
+        message = 'unrecognized arguments: {}'.format(' '.join(arguments))
+        for argument in arguments:
+            if not argument.startswith('-') or _negative_number.match(argument):
+                continue
+            suggestions = self.suggest(argument)
+            if suggestions:
+                message += '\n  {}: did you mean {}?'.format(argument.split('=', 1)[0],
+                                                             ' or '.join(suggestions))
+        return message
+
+    # protected
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        low = bisect.bisect_left(self._options, prefix)
+        high = bisect.bisect_left(self._options, prefix + '\U0010ffff', low)
+        return low, high
+
+    def _suggest_in(
+            self,
+            word: str,
+            low: int,
+            high: int,
+            limit: int,
+            cutoff: float
+    ) -> List[str]:
+        if high - low <= self.scan_limit:
+            candidates = self._options[low:high]
+        else:
+            counts: Counter = Counter()
+            trigrams = self._get_trigrams()
+            for trigram in _trigrams(word):
+                postings = trigrams.get(trigram)
+                if postings is None:
+                    continue
+                # the postings are sorted, so those in the range are a slice
+                begin = bisect.bisect_left(postings, low)
+                end = bisect.bisect_left(postings, high, begin)
+                counts.update(postings[begin:end])
+            candidates = [self._options[index]
+                          for index, _ in counts.most_common(self.candidate_limit)]
+
+        # the same as difflib.get_close_matches
+        scored = list()
+        matcher = SequenceMatcher()
+        matcher.set_seq2(word)
+        for candidate in candidates:
+            matcher.set_seq1(candidate)
+            if matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff:
+                ratio = matcher.ratio()
+                if ratio >= cutoff:
+                    scored.append((ratio, candidate))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [candidate for _, candidate in scored[:limit]]
+
+    def _get_trigrams(self) -> Dict[str, List[int]]:
+        with self._lock:
+            if self._trigrams is None:
+                trigrams: Dict[str, List[int]] = dict()
+                for index, option_string in enumerate(self._options):
+                    for trigram in _trigrams(option_string):
+                        trigrams.setdefault(trigram, []).append(index)
+                self._trigrams = trigrams
+            return self._trigrams
+
+
+def _trigrams(word: str) -> Iterable[str]:
+    return {word[index:index + 3] for index in range(len(word) - 2)}
+
+
+def _hierarchical_prefixes(word: str) -> List[str]:
+    # '--Car-ftire-style' -> ['', '--Car-', '--Car-ftire-']
+    prefixes = ['']
+    position = word.find('-', 2)
+    while position != -1:
+        prefixes.append(word[:position + 1])
+        position = word.find('-', position + 1)
+    return prefixes
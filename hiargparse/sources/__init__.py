@@ -0,0 +1,9 @@
+from .option_table import OptionTable
+from .normalized_args import normalized_items_to_args, Repetition
+from .abstract_source import AbstractSource
+from .file_source import FileSource
+from .mapping_source import MappingSource
+from .argv_source import ArgvSource
+from .environ_source import EnvironSource
+from .concurrent_loading import load_items_concurrently, load_items_asynchronously
+from .config_watcher import ConfigWatcher
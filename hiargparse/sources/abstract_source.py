@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Iterator, Tuple, Any
+from .option_table import OptionTable
+
+
+class AbstractSource(ABC):
+    """A source of option values for ArgsProvider.resolve.
+
+    Attributes:
+        name: used to tell where each value came from.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    @abstractmethod
+    def iter_items(self, table: OptionTable) -> Iterator[Tuple[str, Any]]:
+        """Yield (option string, value) pairs like the normalized dicts.
+
+        A value None means that it is not given.
+        Unknown option strings are passed through and reported by argparse.
+        """
+        raise NotImplementedError()
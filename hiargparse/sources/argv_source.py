@@ -0,0 +1,95 @@
+import re
+import sys
+from typing import Iterator, Tuple, Any, Sequence, List, Optional, Dict
+from .abstract_source import AbstractSource
+from .option_table import OptionTable
+from .normalized_args import Repetition, COUNT, EXTEND
+
+
+_negative_number_matcher = re.compile(r'^-\d+$|^-\d*\.\d+$')
+
+
+class ArgvSource(AbstractSource):
+    """Values from command-line arguments.
+
+    Each option and the arguments following it are merged as one value,
+    so that the option can be overwritten by the other sources.
+    The occurrences of count, append and extend options are accumulated
+    as argparse does, and the result overrides the other sources as a whole.
+    Positional arguments and unknown options are passed through to argparse.
+
+    Args:
+        argv: defaults to sys.argv[1:].
+    """
+
+    def __init__(
+            self,
+            argv: Sequence[str] = None,
+            name: str = 'argv'
+    ) -> None:
+        super().__init__(name)
+        self.argv = argv
+
+    def iter_items(self, table: OptionTable) -> Iterator[Tuple[str, Any]]:
+        occurrences: Dict[str, List[List[str]]] = dict()
+        for key, values in self._iter_occurrences(table):
+            canonical_key = None if key == '--' else table.canonical_key(key)
+            if canonical_key in table.repetitions:
+                occurrences.setdefault(canonical_key, []).append(values)
+            else:
+                yield key, values
+        for canonical_key, repeated_values in occurrences.items():
+            repetition = table.repetitions[canonical_key]
+            if repetition.kind == COUNT:
+                # the count takes no arguments; pass the others through
+                for values in repeated_values:
+                    for value in values:
+                        yield value, []
+            yield canonical_key, _accumulate(repetition, repeated_values)
+
+    def _iter_occurrences(self, table: OptionTable) -> Iterator[Tuple[str, List[str]]]:
+        argv = sys.argv[1:] if self.argv is None else list(self.argv)
+        key: Optional[str] = None
+        values: List[str] = []
+        for index, token in enumerate(argv):
+            if token == '--':
+                # everything after '--' is positional
+                if key is not None:
+                    yield key, values
+                yield token, argv[index + 1:]
+                return
+            if not self._is_option(token):
+                if key is None:
+                    # a positional or an unknown argument
+                    yield token, []
+                else:
+                    values.append(token)
+                continue
+            if key is not None:
+                yield key, values
+            if token in table:
+                key, values = token, []
+            else:
+                # --key=value style or unknown ones
+                key, separator, explicit_value = token.partition('=')
+                values = [explicit_value] if separator else []
+        if key is not None:
+            yield key, values
+
+    @staticmethod
+    def _is_option(token: str) -> bool:
+        return (token.startswith('-') and token != '-'
+                and _negative_number_matcher.match(token) is None)
+
+
+def _accumulate(repetition: Repetition, repeated_values: List[List[str]]) -> Any:
+    # the accumulated value like the normalized dicts (see normalized_items_to_args)
+    default = repetition.default
+    if repetition.kind == COUNT:
+        return (0 if default is None else default) + len(repeated_values)
+    accumulated = list(default) if isinstance(default, (list, tuple)) else []
+    if repetition.kind == EXTEND:
+        accumulated.extend(value for values in repeated_values for value in values)
+    else:
+        accumulated.extend(repeated_values)
+    return accumulated
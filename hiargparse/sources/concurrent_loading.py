@@ -0,0 +1,52 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence, List, Tuple, Any
+from .abstract_source import AbstractSource
+from .option_table import OptionTable
+
+
+LoadedItems = List[Tuple[str, Any]]
+
+# asyncio.get_running_loop is new in python 3.7;
+# get_event_loop returns the same loop in coroutines
+_get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+def load_items_concurrently(
+        sources: Sequence[AbstractSource],
+        table: OptionTable,
+        max_workers: int = None
+) -> List[LoadedItems]:
+    """Read and parse all the sources on a thread pool.
+
+    The results are in the same order as the sources.
+    If some sources fail, the error of the first one (in the given order) is raised.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_load_items, source, table) for source in sources]
+        return [future.result() for future in futures]
+
+
+async def load_items_asynchronously(
+        sources: Sequence[AbstractSource],
+        table: OptionTable,
+        max_workers: int = None
+) -> List[LoadedItems]:
+    """An asyncio variant of load_items_concurrently.
+
+    The default executor of the loop is used unless max_workers is given.
+    """
+    loop = _get_running_loop()
+    executor = None if max_workers is None else ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [loop.run_in_executor(executor, _load_items, source, table)
+                   for source in sources]
+        return list(await asyncio.gather(*futures))
+    finally:
+        # waiting for the threads here would block the loop
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def _load_items(source: AbstractSource, table: OptionTable) -> LoadedItems:
+    return list(source.iter_items(table))
@@ -0,0 +1,182 @@
+import argparse
+import os
+import threading
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
+from hiargparse.alternatives import ArgumentParser, Namespace
+from hiargparse.hierarchy import long_key_to_dotted_key
+from hiargparse.file_protocols import dict_writers
+from .file_source import FileSource
+from .normalized_args import normalized_items_to_args
+from .option_table import OptionTable
+
+# avoid cyclic importing
+if TYPE_CHECKING:
+    from hiargparse.args_providers import ArgsProvider
+
+
+ChangeCallback = Callable[[List[str]], None]
+ErrorCallback = Callable[[Exception], None]
+_FileStamp = Tuple[int, int]
+
+
+class _RaisingArgumentParser(ArgumentParser):
+    """Raise instead of exiting the long-running process."""
+
+    def error(self, message: str) -> None:  # type: ignore
+        raise argparse.ArgumentError(None, message)
+
+
+class ConfigWatcher:
+    """Watch configure files and apply their changes to a live Namespace.
+
+    Files are polled with os.stat.
+    Only a changed file is parsed again, its normalized dict is compared
+    with the previous one, and only the changed values
+    (and the values propagated from them) are written to the namespace.
+    Callbacks receive the changed dests like ['Son.hoge', 'Son.GS.huga'].
+
+    Args:
+        provider: the ArgsProvider which made the namespace.
+        namespace: the live parameters to be updated in place.
+        sources: file sources with paths, from the lowest priority to the highest one.
+        interval: polling interval in seconds used by start().
+    """
+
+    def __init__(
+            self,
+            provider: 'ArgsProvider',
+            namespace: Namespace,
+            sources: Sequence[FileSource],
+            interval: float = 1.0
+    ) -> None:
+        self._provider = provider
+        self._namespace = namespace
+        self._sources = list(sources)
+        self._interval = interval
+        self._parser = _RaisingArgumentParser()
+        indexer = dict_writers.KeyIndexWriter()
+        provider.add_arguments_to_parser(self._parser, indexer)
+        self._table = OptionTable.from_parser(self._parser, key_index=indexer.index)
+        self._callbacks: List[ChangeCallback] = []
+        self._error_callbacks: List[ErrorCallback] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stamps: List[Optional[_FileStamp]] = []
+        self._contents: List[Dict[str, Any]] = []
+        for source in self._sources:
+            self._stamps.append(self._get_stamp(source))
+            self._contents.append(self._load(source))
+
+    def add_callback(self, callback: ChangeCallback) -> None:
+        """Register a function called with the changed dests after each update.
+
+        It is called out of the lock, so it may call poll (or wait for another thread).
+        """
+        self._callbacks.append(callback)
+
+    def add_error_callback(self, callback: ErrorCallback) -> None:
+        """Register a function called with errors in the background thread.
+
+        Without any error callbacks, the errors are warned.
+        """
+        self._error_callbacks.append(callback)
+
+    def poll(self) -> List[str]:
+        """Check all the files once and apply their changes.
+
+        Returns the changed dests.
+        If a file is broken, the error is raised and nothing is applied.
+        """
+        with self._lock:
+            stamps = list(self._stamps)
+            all_contents = list(self._contents)
+            changed_keys: Set[str] = set()
+            for index, source in enumerate(self._sources):
+                stamp = self._get_stamp(source)
+                if stamp is None or stamp == stamps[index]:
+                    # not changed, or deleted (maybe temporarily while saving)
+                    continue
+                new_contents = self._load(source)
+                old_contents = all_contents[index]
+                for key in old_contents.keys() | new_contents.keys():
+                    if old_contents.get(key) != new_contents.get(key):
+                        changed_keys.add(key)
+                all_contents[index] = new_contents
+                stamps[index] = stamp
+            changed_dests = self._apply(changed_keys, all_contents) if changed_keys else []
+            # commit only after all the files are successfully applied
+            self._stamps = stamps
+            self._contents = all_contents
+            callbacks = list(self._callbacks)
+        # call out of the lock; callbacks may poll again or block
+        if changed_dests:
+            for callback in callbacks:
+                callback(list(changed_dests))
+        return changed_dests
+
+    def start(self) -> None:
+        """Start polling in a daemon thread."""
+        if self._thread is not None:
+            raise RuntimeError('{} is already started.'.format(type(self).__name__))
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    # protected methods
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            try:
+                self.poll()
+            except Exception as exc:
+                if not self._error_callbacks:
+                    warnings.warn('{} failed to reload: {}'.format(type(self).__name__, exc))
+                for callback in self._error_callbacks:
+                    callback(exc)
+
+    def _apply(self, changed_keys: Set[str], all_contents: List[Dict[str, Any]]) -> List[str]:
+        # the effective value of a key is given by the last file that has it
+        effective_contents: Dict[str, Any] = dict()
+        for key in changed_keys:
+            for contents in reversed(all_contents):
+                if contents.get(key) is not None:
+                    effective_contents[key] = contents[key]
+                    break
+        # the other (including removed) keys are parsed as defaults
+        parsed = self._parser.parse_args(normalized_items_to_args(effective_contents.items(),
+                                                                  self._table.repetitions))
+        changed_dests = {self._table.get_action(key).dest for key in changed_keys}
+        for dest in changed_dests:
+            self._namespace[dest] = parsed[dest]
+        targets = self._provider.apply_propagations(self._namespace, only_from=changed_dests)
+        # unique, keeping the order
+        dests = dict.fromkeys(sorted(changed_dests) + targets)
+        return [long_key_to_dotted_key(dest) for dest in dests]
+
+    def _load(self, source: FileSource) -> Dict[str, Any]:
+        contents: Dict[str, Any] = dict()
+        for key, val in source.iter_items(self._table):
+            canonical_key = self._table.canonical_key(key)
+            if canonical_key is None:
+                raise argparse.ArgumentError(None, 'unrecognized argument {} in {}'
+                                             .format(key, source.name))
+            contents[canonical_key] = val
+        return contents
+
+    @staticmethod
+    def _get_stamp(source: FileSource) -> Optional[_FileStamp]:
+        try:
+            stat = os.stat(str(source.source))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
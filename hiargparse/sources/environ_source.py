@@ -0,0 +1,64 @@
+import os
+import shlex
+from typing import Iterator, Tuple, Any, Mapping, Optional
+from .abstract_source import AbstractSource
+from .option_table import OptionTable
+
+
+_true_strings = {'1', 'true', 'yes', 'on'}
+_false_strings = {'0', 'false', 'no', 'off', ''}
+
+
+class EnvironSource(AbstractSource):
+    """Values from environment variables.
+
+    Every option has its variable name made from its option string;
+    see OptionTable.environment_index.
+    The environment is scanned only once with a precomputed index,
+    so it costs O(len(environ)) regardless of the number of options.
+    Values are converted as follows:
+        options with nargs=0 (like store_true): one of 1/true/yes/on or 0/false/no/off/(empty)
+        options taking a single value: as it is
+        options taking multiple values: split like shell words
+
+    Args:
+        prefix: prepended to all the variable names, e.g. 'APP_'.
+        environ: defaults to os.environ.
+    """
+
+    def __init__(
+            self,
+            prefix: str = '',
+            environ: Mapping[str, str] = None,
+            name: str = 'environment'
+    ) -> None:
+        super().__init__(name)
+        self.prefix = prefix
+        self.environ = environ
+
+    def iter_items(self, table: OptionTable) -> Iterator[Tuple[str, Any]]:
+        index = table.environment_index(self.prefix)
+        environ = os.environ if self.environ is None else self.environ
+        for variable_name, value in environ.items():
+            canonical_key = index.get(variable_name)
+            if canonical_key is None:
+                continue
+            yield canonical_key, self._convert(variable_name, value,
+                                               table.get_action(canonical_key).nargs)
+
+    @staticmethod
+    def _convert(variable_name: str, value: str, nargs: Any) -> Optional[Any]:
+        if nargs == 0:
+            lowered = value.strip().lower()
+            if lowered in _true_strings:
+                return True
+            elif lowered in _false_strings:
+                # not given
+                return None
+            raise ValueError('environment variable {}={} must be one of {}. '
+                             .format(variable_name, value,
+                                     ', '.join(sorted(_true_strings | _false_strings - {''}))))
+        elif nargs is None or nargs == '?':
+            return value
+        else:
+            return shlex.split(value)
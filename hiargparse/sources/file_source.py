@@ -0,0 +1,38 @@
+from pathlib import Path
+from typing import Iterator, Tuple, Any, Union
+from hiargparse.file_protocols import dict_readers, ConfigureFileType
+from .abstract_source import AbstractSource
+from .option_table import OptionTable
+
+
+class FileSource(AbstractSource):
+    """Values from a configure file of any ConfigureFileType.
+
+    Args:
+        source: a path or a binary file object.
+        reader: a reader or a ConfigureFileType to read the file.
+        name: defaults to 'file:<path>'.
+        include_cache: share it among sources to parse each included file only once.
+    """
+
+    def __init__(
+            self,
+            source: dict_readers.ReadableSource,
+            reader: Union[dict_readers.AbstractDictReader, ConfigureFileType],
+            name: str = None,
+            include_cache: dict_readers.IncludeCache = None
+    ) -> None:
+        if name is None:
+            if isinstance(source, (str, Path)):
+                name = 'file:{}'.format(source)
+            else:
+                name = 'file:{}'.format(getattr(source, 'name', '<file>'))
+        super().__init__(name)
+        if isinstance(reader, ConfigureFileType):
+            reader = reader.get_reader()
+        self.source = source
+        self.reader = reader
+        self.include_cache = include_cache
+
+    def iter_items(self, table: OptionTable) -> Iterator[Tuple[str, Any]]:
+        return self.reader.iter_normalized_items(self.source, self.include_cache)
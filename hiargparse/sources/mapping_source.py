@@ -0,0 +1,22 @@
+from typing import Iterator, Tuple, Any, Mapping
+from hiargparse.file_protocols.dict_readers.normalize_dict import iter_normalized_items
+from .abstract_source import AbstractSource
+from .option_table import OptionTable
+
+
+class MappingSource(AbstractSource):
+    """Values from a nested dict shaped like the configure files.
+
+    Typically used for application-level defaults.
+    """
+
+    def __init__(
+            self,
+            contents: Mapping[str, Any],
+            name: str = 'mapping'
+    ) -> None:
+        super().__init__(name)
+        self.contents = contents
+
+    def iter_items(self, table: OptionTable) -> Iterator[Tuple[str, Any]]:
+        return iter_normalized_items(self.contents)
@@ -0,0 +1,75 @@
+from typing import Iterable, Tuple, Any, List, Mapping, NamedTuple
+
+# the kinds of Repetition
+COUNT = 'count'
+APPEND = 'append'
+EXTEND = 'extend'
+
+
+class Repetition(NamedTuple):
+    """How an option accumulates its occurrences (see normalized_items_to_args).
+
+    kind is COUNT, APPEND or EXTEND; default is that of the action,
+    from which argparse begins to accumulate.
+    """
+    kind: str
+    default: Any
+
+
+def normalized_items_to_args(
+        contents: Iterable[Tuple[str, Any]],
+        repetitions: Mapping[str, Repetition] = None
+) -> List[str]:
+    """Convert normalized (key, value) pairs to arguments for argparse.
+
+    The values of the keys in repetitions (see OptionTable.repetitions)
+    are the accumulated ones, and they are given as repeated options, e.g.
+        count:  ('--v', 2) -> ['--v', '--v']
+        append: ('--many', [1, 2]) -> ['--many', '1', '--many', '2']
+    ValueError is raised if argparse cannot accumulate the value from the default.
+    """
+    args: List[str] = []
+    for key, val in contents:
+        if val is None:
+            continue
+        if repetitions is not None and key in repetitions and val is not True:
+            _repeat(args, key, val, repetitions[key])
+            continue
+        args.append(key)
+        if val is True or val is False:
+            # maybe nargs = 0
+            pass
+        elif isinstance(val, (list, tuple)):
+            for v in val:
+                args.append(str(v))
+        else:
+            args.append(str(val))
+    return args
+
+
+def _repeat(args: List[str], key: str, val: Any, repetition: Repetition) -> None:
+    default = repetition.default
+    if repetition.kind == COUNT:
+        begin = 0 if default is None else default
+        if not isinstance(val, int) or isinstance(val, bool) or val < begin:
+            raise ValueError('{} counts from {}, so it cannot be {!r}. '.format(key, begin, val))
+        args.extend([key] * (val - begin))
+        return
+    values = list(val) if isinstance(val, (list, tuple)) else [val]
+    if isinstance(default, (list, tuple)) and default:
+        # argparse appends to (a copy of) the default
+        if values[:len(default)] != list(default):
+            raise ValueError('{} appends to the default {!r}, so it cannot be {!r}. '
+                             .format(key, default, val))
+        values = values[len(default):]
+    if repetition.kind == EXTEND:
+        if values:
+            args.append(key)
+            args.extend(str(v) for v in values)
+        return
+    for value in values:
+        args.append(key)
+        if isinstance(value, (list, tuple)):
+            args.extend(str(v) for v in value)
+        else:
+            args.append(str(value))
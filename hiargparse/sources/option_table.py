@@ -0,0 +1,141 @@
+import argparse
+import bisect
+import re
+import warnings
+from typing import Dict, List, Iterable, Iterator, Optional, Mapping
+from hiargparse.miscs import DirtyAccessToArgparse
+from .normalized_args import Repetition, COUNT, APPEND, EXTEND
+
+_non_word_matcher = re.compile(r'\W')
+
+
+class OptionTable:
+    """An index of the optional arguments registered to a parser.
+
+    Every option string (including aliases) is mapped to its canonical key,
+    which is the first option string of the action.
+    If key_index (from dict_writers.KeyIndexWriter) is given,
+    the normalized keys that the dict readers make are also mapped.
+
+    Attributes:
+        repetitions: the Repetitions of the count, append and extend actions
+                     by their canonical keys (for normalized_items_to_args).
+    """
+
+    def __init__(
+            self,
+            actions: Iterable[argparse.Action],
+            allow_abbrev: bool = True,
+            key_index: Mapping[str, str] = None
+    ) -> None:
+        self._canonical_keys: Dict[str, str] = dict()
+        self._actions: Dict[str, argparse.Action] = dict()
+        self.repetitions: Dict[str, Repetition] = dict()
+        canonical_keys_by_dest: Dict[str, str] = dict()
+        for action in actions:
+            if not action.option_strings:
+                continue
+            canonical_key = action.option_strings[0]
+            self._actions[canonical_key] = action
+            repetition = _repetition(action)
+            if repetition is not None:
+                self.repetitions[canonical_key] = repetition
+            canonical_keys_by_dest[action.dest] = canonical_key
+            for option_string in action.option_strings:
+                self._canonical_keys[option_string] = canonical_key
+        if key_index is not None:
+            for normalized_key, dest in key_index.items():
+                if normalized_key not in self._canonical_keys and dest in canonical_keys_by_dest:
+                    self._canonical_keys[normalized_key] = canonical_keys_by_dest[dest]
+        self._allow_abbrev = allow_abbrev
+        self._sorted_long_options = sorted(option_string for option_string in self._canonical_keys
+                                           if option_string.startswith('--'))
+        self._environment_indices: Dict[str, Dict[str, str]] = dict()
+
+    @classmethod
+    def from_parser(
+            cls,
+            parser: argparse.ArgumentParser,
+            key_index: Mapping[str, str] = None
+    ) -> 'OptionTable':
+        return cls(DirtyAccessToArgparse.get_actions(parser),
+                   allow_abbrev=parser.allow_abbrev, key_index=key_index)
+
+    def canonical_key(self, option_string: str) -> Optional[str]:
+        """Return the canonical key of the option string, or None if it is unknown.
+
+        Unique abbreviations of long options are accepted as argparse does.
+        """
+        try:
+            return self._canonical_keys[option_string]
+        except KeyError:
+            pass
+        if not self._allow_abbrev or not option_string.startswith('--'):
+            return None
+        # all the options starting with option_string are adjacent in the sorted list
+        begin = bisect.bisect_left(self._sorted_long_options, option_string)
+        candidates = set()
+        for option in self._sorted_long_options[begin:]:
+            if not option.startswith(option_string):
+                break
+            candidates.add(self._canonical_keys[option])
+        if len(candidates) != 1:
+            return None
+        return candidates.pop()
+
+    def environment_index(self, prefix: str = '') -> Dict[str, str]:
+        """Return a dict from environment variable names to the canonical keys.
+
+        A name is made from the same prefix chain as the option string,
+        e.g. '--Son-GrandSon-piyo' with prefix 'APP_' is 'APP_SON_GRANDSON_PIYO'.
+        The index is built only once per prefix.
+        """
+        try:
+            return self._environment_indices[prefix]
+        except KeyError:
+            pass
+        index: Dict[str, str] = dict()
+        conflicts: Dict[str, List[str]] = dict()
+        for canonical_key in self._actions:
+            if not canonical_key.startswith('--'):
+                continue
+            name = prefix + _non_word_matcher.sub('_', canonical_key[2:]).upper()
+            if name in index:
+                conflicts.setdefault(name, [index[name]]).append(canonical_key)
+            else:
+                index[name] = canonical_key
+        if conflicts:
+            # avoid cyclic importing
+            from hiargparse.args_providers import ConflictWarning
+            for name, canonical_keys in conflicts.items():
+                del index[name]
+                warnings.warn(ConflictWarning(
+                    'options {} share the environment variable name {}; '
+                    'it is ignored. '.format(', '.join(canonical_keys), name)
+                ))
+        self._environment_indices[prefix] = index
+        return index
+
+    def get_action(self, canonical_key: str) -> argparse.Action:
+        return self._actions[canonical_key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the canonical keys."""
+        return iter(self._actions)
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def __contains__(self, option_string: object) -> bool:
+        return option_string in self._canonical_keys
+
+
+def _repetition(action: argparse.Action) -> Optional[Repetition]:
+    # ExtendAction is a subclass of AppendAction
+    if isinstance(action, DirtyAccessToArgparse.ExtendAction):
+        return Repetition(EXTEND, action.default)
+    if isinstance(action, DirtyAccessToArgparse.AppendAction):
+        return Repetition(APPEND, action.default)
+    if isinstance(action, DirtyAccessToArgparse.CountAction):
+        return Repetition(COUNT, action.default)
+    return None
@@ -58,7 +58,7 @@ setup(
     project_urls={
         'Source': 'https://github.com/KKawamura1/hiargparse/'
     },
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*', 'tests', 'tests.*']),
     install_requires=requirements,
     python_requires=python_requires,
 )
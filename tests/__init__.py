@@ -0,0 +1 @@
+"""Checks of hiargparse; run them by python -m unittest (or pytest) in the repository root."""
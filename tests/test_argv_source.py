@@ -0,0 +1,77 @@
+"""Checks that resolving an ArgvSource gives the same as parse_args."""
+import argparse
+import contextlib
+import io
+import unittest
+from typing import Any
+
+from hiargparse import ArgsProvider, Arg, ChildProvider, ArgumentParser, ArgvSource, MappingSource
+
+
+def _provider() -> ArgsProvider:
+    child = ArgsProvider(args=[Arg('hoge', 3), Arg('many', type=int, action='append')])
+    args = [
+        Arg('many', type=int, action='append', propagate=False),
+        Arg(['verbose', 'v'], action='count'),
+        Arg('more', [0], type=int, action='append'),
+        Arg('pair', type=int, nargs=2, action='append'),
+        Arg('numbers', [1], type=int, nargs='+'),
+        Arg('name', 'x'),
+    ]
+    if hasattr(argparse, '_ExtendAction'):
+        args.append(Arg('words', type=str, nargs='+', action='extend'))
+    return ArgsProvider(args=args, child_providers=[ChildProvider(provider=child, name='Son')])
+
+
+_ARGVS = [
+    [],
+    ['--many', '1', '--many', '2', '--verbose', '--verbose'],
+    ['--v', '--verbose', '--many=3', '--name', 'a', '--many', '4', '--name', 'b'],
+    ['--more', '1', '--more', '2', '--pair', '1', '2', '--pair', '3', '4'],
+    ['--numbers', '2', '3', '--numbers', '4', '--Son-many', '5', '--many', '6', '--Son-many', '7'],
+    ['--verb', '--verb', '--Son-hoge', '-1', '--Son-hoge', '2'],
+    ['--many', '1', '--', '--many', '2'],
+    ['--many', 'x'],
+    ['--verbose', 'positional'],
+]
+_EXTEND_ARGVS = [
+    ['--words', 'a', 'b', '--many', '1', '--words', 'c'],
+]
+
+
+def _result(parse: Any) -> Any:
+    try:
+        with contextlib.redirect_stderr(io.StringIO()):
+            return parse()._asdict()
+    except SystemExit:
+        return 'error'
+
+
+class ArgvSourceTest(unittest.TestCase):
+
+    def test_same_as_parse_args(self) -> None:
+        provider = _provider()
+        argvs = list(_ARGVS)
+        if hasattr(argparse, '_ExtendAction'):
+            argvs += _EXTEND_ARGVS
+        for argv in argvs:
+            with self.subTest(argv=argv):
+                parser = ArgumentParser()
+                provider.add_arguments_to_parser(parser)
+                expected = _result(lambda: parser.parse_args(argv))
+                resolved = _result(lambda: provider.resolve([ArgvSource(argv)]).namespace)
+                self.assertEqual(resolved, expected)
+
+    def test_override_between_sources(self) -> None:
+        provider = _provider()
+        base = MappingSource(dict(many=[1, 2], verbose=3, Son=dict(many=[4])))
+        resolution = provider.resolve([base, ArgvSource(['--many', '5', '--many', '6'])])
+        self.assertEqual(resolution.namespace.many, [5, 6])
+        self.assertEqual(resolution.namespace.verbose, 3)
+        self.assertEqual(resolution.namespace.Son.many, [4])
+        self.assertEqual(resolution.provenance['--many'], 'argv')
+        self.assertEqual(resolution.provenance['--verbose'], 'mapping')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+"""Checks of the shell completion index."""
+import tempfile
+import unittest
+from pathlib import Path
+
+from hiargparse import ArgsProvider, Arg, ChildProvider, CompletionIndex
+
+
+class CompletionIndexTest(unittest.TestCase):
+
+    def test_local_types(self) -> None:
+        # completion does not need the types, which may not be importable
+        def local_type(string: str) -> complex:
+            return complex(string)
+
+        child = ArgsProvider(args=[Arg('number', type=local_type),
+                                   Arg('unit', 'cm', choices=['cm', 'm'])])
+        provider = ArgsProvider(child_providers=[ChildProvider(provider=child, name='Car')])
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'index'
+            self.assertTrue(provider.is_stale_completion_index(path))
+            provider.write_completion_index(path)
+            self.assertFalse(provider.is_stale_completion_index(path))
+            index = CompletionIndex.loads(path.read_text(encoding='utf-8'))
+        self.assertEqual(index.complete('--C'), (['--Car-'], False))
+        self.assertEqual(index.complete('--Car-'), (['--Car-number', '--Car-unit'], False))
+        self.assertEqual(index.complete('', '--Car-unit'), (['cm', 'm'], True))
+        self.assertEqual(index.complete('', '--Car-number'), ([], True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""Checks of ConfigWatcher."""
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List
+
+from hiargparse import ArgsProvider, Arg, ArgumentParser, ConfigWatcher, FileSource
+from hiargparse import ConfigureFileType
+
+
+class ConfigWatcherTest(unittest.TestCase):
+
+    def test_callbacks_out_of_lock(self) -> None:
+        # a callback may poll again (or wait for another polling thread)
+        provider = ArgsProvider(args=[Arg('hoge', 1)])
+        parser = ArgumentParser()
+        provider.add_arguments_to_parser(parser)
+        namespace = parser.parse_args([])
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'config.json'
+            path.write_text('{"hoge": 1}', encoding='utf-8')
+            watcher = ConfigWatcher(provider, namespace,
+                                    [FileSource(path, ConfigureFileType.json)])
+            received: List[List[str]] = list()
+
+            def callback(dests: List[str]) -> None:
+                received.append(dests)
+                self.assertEqual(watcher.poll(), [])
+
+            watcher.add_callback(callback)
+            path.write_text('{"hoge": 2}', encoding='utf-8')
+            os.utime(str(path), ns=(0, 10 ** 9))
+            self.assertEqual(watcher.poll(), ['hoge'])
+        self.assertEqual(received, [['hoge']])
+        self.assertEqual(namespace.hoge, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
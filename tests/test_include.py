@@ -0,0 +1,76 @@
+"""Checks of the include directives of configure files."""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from hiargparse import ArgsProvider, Arg, ChildProvider, ConfigureFileType
+from hiargparse.file_protocols import dict_readers
+
+
+def _provider() -> ArgsProvider:
+    child = ArgsProvider(args=[Arg('hoge', 0), Arg('huga', 'a')])
+    return ArgsProvider(args=[Arg('piyo', 0.5)],
+                        child_providers=[ChildProvider(provider=child, name='Son')])
+
+
+class IncludeTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.reader = ConfigureFileType.yaml.get_reader()
+
+    def write(self, name: str, text: str) -> Path:
+        path = self.directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+        return path
+
+    def read(self, path: Path) -> dict:
+        return _provider().read_configure_file(path, self.reader)._asdict()
+
+    def test_empty_file(self) -> None:
+        self.write('empty.yaml', '')
+        path = self.write('main.yaml', '__include__: empty.yaml\npiyo: 1.5\n')
+        self.assertEqual(self.read(path), dict(piyo=1.5, Son=dict(hoge=0, huga='a')))
+
+    def test_not_mapping(self) -> None:
+        self.write('list.yaml', '- 1\n- 2\n')
+        path = self.write('main.yaml', '__include__: list.yaml\n')
+        with self.assertRaisesRegex(ValueError, 'list.yaml must be a mapping'):
+            self.read(path)
+
+    def test_cycle(self) -> None:
+        self.write('a.yaml', '__include__: b.yaml\n')
+        self.write('b.yaml', '__include__: a.yaml\n')
+        path = self.write('main.yaml', '__include__: a.yaml\n')
+        with self.assertRaises(dict_readers.IncludeCycleError):
+            self.read(path)
+        with self.assertRaises(dict_readers.IncludeCycleError):
+            self.read(self.write('self.yaml', '__include__: self.yaml\n'))
+
+    def test_diamond(self) -> None:
+        self.write('base.yaml', 'Son:\n  hoge: 1\n  huga: base\n')
+        self.write('left.yaml', '__include__: base.yaml\nSon:\n  hoge: 2\n')
+        self.write('right.yaml', '__include__: base.yaml\npiyo: 2.5\n')
+        path = self.write('main.yaml', '__include__: [left.yaml, right.yaml]\n')
+        loads = mock.patch.object(type(self.reader), '_read_nested_dict_from_bytes',
+                                  autospec=True,
+                                  side_effect=type(self.reader)._read_nested_dict_from_bytes)
+        with loads as load:
+            result = self.read(path)
+        # the latter include wins, and base.yaml is parsed only once
+        self.assertEqual(result, dict(piyo=2.5, Son=dict(hoge=1, huga='base')))
+        self.assertEqual(load.call_count, 3)
+
+    def test_nested_relative_paths(self) -> None:
+        self.write('common/base.yaml', 'Son:\n  huga: base\n')
+        self.write('configs/gpu/gpu.yaml', '__include__: ../../common/base.yaml\nSon:\n  hoge: 4\n')
+        path = self.write('configs/main.yaml', '__include__: gpu/gpu.yaml\npiyo: 3.5\n')
+        self.assertEqual(self.read(path), dict(piyo=3.5, Son=dict(hoge=4, huga='base')))
+
+
+if __name__ == '__main__':
+    unittest.main()
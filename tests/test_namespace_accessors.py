@@ -0,0 +1,78 @@
+"""Checks of Namespace._accessor and Namespace._setter."""
+import unittest
+
+from hiargparse import ArgsProvider, Arg, ChildProvider, ArgumentParser, Namespace
+from hiargparse.hierarchy import parents_and_key_to_long_key
+
+
+def _namespace() -> Namespace:
+    grandson = ArgsProvider(args=[Arg('huga', None, type=str), Arg('piyo', 0.99)])
+    son = ArgsProvider(args=[Arg('hoge', 42)],
+                       child_providers=[ChildProvider(provider=grandson, name='GrandSon', dest='GS')])
+    provider = ArgsProvider(args=[Arg('foo', 'bar')],
+                            child_providers=[ChildProvider(provider=son, name='Son')])
+    parser = ArgumentParser()
+    provider.add_arguments_to_parser(parser)
+    return parser.parse_args([])
+
+
+class AccessorTest(unittest.TestCase):
+
+    def test_get(self) -> None:
+        namespace = _namespace()
+        self.assertEqual(namespace._accessor('foo')(), 'bar')
+        accessor = namespace._accessor('Son.GS.piyo')
+        self.assertEqual(accessor(), 0.99)
+        namespace.Son.GS.piyo = 0.5
+        self.assertEqual(accessor(), 0.5)
+        self.assertIsInstance(namespace._accessor('Son.GS')(), Namespace)
+
+    def test_set(self) -> None:
+        namespace = _namespace()
+        setter = namespace._setter('Son.GS.piyo')
+        setter(0.3)
+        self.assertEqual(namespace.Son.GS.piyo, 0.3)
+        # the long keys of the ancestors are also written
+        self.assertEqual(namespace[parents_and_key_to_long_key(['Son', 'GS'], 'piyo')], 0.3)
+        self.assertEqual(namespace.Son[parents_and_key_to_long_key(['GS'], 'piyo')], 0.3)
+        self.assertEqual(namespace._asdict()['Son']['GS']['piyo'], 0.3)
+        self.assertEqual(namespace._accessor('Son.GS.piyo')(), 0.3)
+        with self.assertRaises(TypeError):
+            setter(Namespace())
+        with self.assertRaises(TypeError):
+            namespace._setter('Son.GS')
+
+    def test_missing_paths(self) -> None:
+        namespace = _namespace()
+        for path in ('nothing', 'Son.nothing', 'Nobody.hoge', 'foo.hoge', 'Son.GrandSon.piyo'):
+            with self.subTest(path=path):
+                with self.assertRaises(AttributeError):
+                    namespace._accessor(path)
+        for path in ('Nobody.hoge', 'foo.hoge'):
+            with self.subTest(path=path):
+                with self.assertRaises(AttributeError):
+                    namespace._setter(path)
+
+    def test_rebind_after_copy(self) -> None:
+        namespace = _namespace()
+        accessor = namespace._accessor('Son.GS.piyo')
+        setter = namespace._setter('Son.GS.piyo')
+        copied = namespace._copy()
+        # still bound to the original
+        setter(0.3)
+        self.assertEqual(accessor(), 0.3)
+        self.assertEqual(copied.Son.GS.piyo, 0.99)
+        # rebound to the copy
+        copied_accessor = accessor.rebind(copied)
+        copied_setter = setter.rebind(copied)
+        self.assertIs(copied_accessor.namespace, copied)
+        self.assertIs(copied_setter.namespace, copied)
+        copied_setter(0.1)
+        self.assertEqual(copied_accessor(), 0.1)
+        self.assertEqual(copied.Son.GS.piyo, 0.1)
+        self.assertEqual(accessor(), 0.3)
+        self.assertEqual(namespace.Son.GS.piyo, 0.3)
+
+
+if __name__ == '__main__':
+    unittest.main()
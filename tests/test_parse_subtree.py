@@ -0,0 +1,78 @@
+"""Checks that parse_subtree gives the same subtree as parse_args."""
+import unittest
+from typing import List
+
+from hiargparse import ArgsProvider, Arg, ChildProvider, ArgumentParser, ArgumentError
+
+
+def _provider() -> ArgsProvider:
+    grandson = ArgsProvider(args=[
+        Arg('huga', None, type=str),
+        Arg('piyo', 0.99),
+        Arg('many', type=int, action='append'),
+    ])
+    son = ArgsProvider(
+        args=[Arg('hoge', 42), Arg('piyo', 0.95, propagate=False)],
+        propagate_args=[Arg('huga', None, type=str)],
+        child_providers=[ChildProvider(provider=grandson, name='GrandSon', dest='GS')])
+    return ArgsProvider(args=[Arg('foo', 'bar'), Arg('num', 3)],
+                        child_providers=[ChildProvider(provider=son, name='Son')])
+
+
+_ARGVS: List[List[str]] = [
+    [],
+    ['--Son-huga', 'h', '--Son-GrandSon-piyo', '0.5'],
+    ['--foo', 'x', '--num', '-1', '--Son-hoge', '1', '--Son-GrandSon-many', '1',
+     '--Son-GrandSon-many', '2', '--Son-huga', 'h'],
+]
+
+
+class ParseSubtreeTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.provider = _provider()
+        self.parser = ArgumentParser()
+        self.provider.add_arguments_to_parser(self.parser)
+
+    def test_same_as_parse_args(self) -> None:
+        for argv in _ARGVS:
+            expected = self.parser.parse_args(argv)._asdict()
+            with self.subTest(argv=argv, path='Son.GS'):
+                result = self.provider.parse_subtree('Son.GS', argv)._asdict()
+                self.assertEqual(result['Son']['GS'], expected['Son']['GS'])
+            with self.subTest(argv=argv, path='Son'):
+                result = self.provider.parse_subtree('Son', argv)._asdict()
+                self.assertEqual(result, dict(Son=expected['Son']))
+            with self.subTest(argv=argv, path=''):
+                self.assertEqual(self.provider.parse_subtree('', argv)._asdict(), expected)
+
+    def test_bad_path(self) -> None:
+        for path in ('Nobody', 'Son.GrandSon', 'Son.GS.huga'):
+            with self.subTest(path=path):
+                with self.assertRaises(ArgumentError):
+                    self.provider.parse_subtree(path, [])
+
+    def test_propagation_from_ancestors(self) -> None:
+        # the source of the propagation is out of the subtree
+        result = self.provider.parse_subtree('Son.GS', ['--Son-huga', 'from-args'])
+        self.assertEqual(result.Son.GS.huga, 'from-args')
+        self.assertEqual(result.Son.huga, 'from-args')
+        result = self.provider.parse_subtree('Son.GS', [], contents=[('--Son-huga', 'from-contents')])
+        self.assertEqual(result.Son.GS.huga, 'from-contents')
+        # args override contents
+        result = self.provider.parse_subtree('Son.GS', ['--Son-huga', 'from-args'],
+                                             contents=[('--Son-huga', 'from-contents')])
+        self.assertEqual(result.Son.GS.huga, 'from-args')
+
+    def test_out_of_scope(self) -> None:
+        argv = ['--foo', 'x', '--num', '-1', '--Son-hoge', '1', '--Son-GrandSon-piyo', '0.5']
+        result = self.provider.parse_subtree('Son.GS', argv,
+                                             contents=[('--foo', 'y'), ('--Son-hoge', 2)])
+        self.assertEqual(result._asdict(), dict(Son=dict(huga=None, GS=dict(huga=None, piyo=0.5,
+                                                                            many=None))))
+        for key in ('foo', 'num'):
+            self.assertNotIn(key, result)
+
+
+if __name__ == '__main__':
+    unittest.main()
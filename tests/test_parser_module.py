@@ -0,0 +1,131 @@
+"""Differential checks of the parser modules generated by ArgsProvider.write_parser_module."""
+import argparse
+import contextlib
+import importlib.util
+import io
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, List, Sequence
+
+from hiargparse import ArgsProvider, Arg, ArgumentParser, ChildProvider
+from hiargparse.miscs import DirtyAccessToArgparse
+
+from benchmarks.synthetic_trees import TreeShape, make_provider
+
+
+def _actions_provider() -> ArgsProvider:
+    child = ArgsProvider(args=[Arg('level', 1, choices=[1, 2, 3]),
+                               Arg(['long-name', 'ln'], 0.5),
+                               Arg('pair', 'a', nargs=2)])
+    return ArgsProvider(
+        args=[Arg('mode', 'x', choices=['x', 'y', '-z']),
+              Arg('maybe', nargs='?', const='c', type=str),
+              Arg('many', type=int, action='append'),
+              Arg('verbose', action='count'),
+              Arg('flag', action='store_true'),
+              Arg('constant', action='store_const', const=5),
+              Arg('values', 1, nargs='+')],
+        propagate_args=[Arg('shared', 'root')],
+        child_providers=[ChildProvider(provider=child, name='child'),
+                         ChildProvider(provider=child, name='other')])
+
+
+def _token(action: argparse.Action, rng: random.Random) -> List[str]:
+    """Make the tokens of one option, sometimes invalid ones."""
+    option_string = rng.choice(action.option_strings)
+    if action.nargs == 0:
+        return [option_string]
+    if action.choices is not None and rng.random() < 0.8:
+        values = [str(rng.choice(list(action.choices)))]
+    elif action.type is int:
+        values = [str(rng.randint(-5, 5))]
+    elif action.type is float:
+        values = [rng.choice(['1.5', '-2', '.25', '3e2'])]
+    else:
+        values = [rng.choice(['word', 'two words', '-1', 'x=y'])]
+    if rng.random() < 0.05:
+        values = ['not-a-number']
+    if action.nargs == '?' and rng.random() < 0.3:
+        return [option_string]
+    if isinstance(action.nargs, int):
+        values = values * action.nargs
+    elif action.nargs == '+':
+        values = values * rng.randint(1, 3)
+    if len(values) == 1 and rng.random() < 0.2:
+        return ['{}={}'.format(option_string, values[0])]
+    return [option_string] + values
+
+
+def make_corpus(parser: ArgumentParser, number: int, seed: int = 0) -> List[List[str]]:
+    """Make argvs of random options, with a few unknown or abbreviated ones."""
+    rng = random.Random(seed)
+    actions = [action for action in DirtyAccessToArgparse.get_actions(parser)
+               if action.dest != 'help']
+    corpus: List[List[str]] = [[]]
+    for _ in range(number):
+        argv: List[str] = []
+        for _ in range(rng.randint(1, 6)):
+            argv += _token(rng.choice(actions), rng)
+        dice = rng.random()
+        if dice < 0.05:
+            argv.append('--unknown-option')
+        elif dice < 0.1:
+            argv.append(rng.choice(actions).option_strings[0][:-1])
+        corpus.append(argv)
+    return corpus
+
+
+def _parse(function: Any, argv: Sequence[str]) -> Any:
+    try:
+        with contextlib.redirect_stderr(io.StringIO()):
+            return function(list(argv))
+    except (SystemExit, argparse.ArgumentError):
+        return 'error'
+
+
+class ParserModuleTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def load_module(self, provider: ArgsProvider, name: str) -> Any:
+        path = Path(self._directory.name) / '{}.py'.format(name)
+        provider.write_parser_module(path)
+        spec = importlib.util.spec_from_file_location(name, str(path))
+        module = importlib.util.module_from_spec(spec)
+        assert spec.loader is not None
+        spec.loader.exec_module(module)  # type: ignore
+        return module
+
+    def check_corpus(self, provider: ArgsProvider, number: int) -> None:
+        parser = ArgumentParser()
+        provider.add_arguments_to_parser(parser)
+        module = self.load_module(provider, 'generated_parser')
+        self.assertFalse(provider.is_stale_parser_module(module))
+        for argv in make_corpus(parser, number):
+            with self.subTest(argv=argv):
+                self.assertEqual(_parse(parser.parse_args, argv),
+                                 _parse(module.parse_args, argv))
+
+    def test_actions(self) -> None:
+        self.check_corpus(_actions_provider(), 500)
+
+    def test_synthetic_tree(self) -> None:
+        self.check_corpus(make_provider(TreeShape(depth=2, fan_out=3,
+                                                  propagation_density=0.3)), 300)
+
+    def test_distinct_synthetic_tree(self) -> None:
+        self.check_corpus(make_provider(TreeShape(depth=2, fan_out=2, propagation_density=0.3,
+                                                  duplicate_children=False)), 300)
+
+    def test_staleness(self) -> None:
+        module = self.load_module(_actions_provider(), 'stale_parser')
+        changed = ArgsProvider(args=[Arg('mode', 'y')])
+        self.assertTrue(changed.is_stale_parser_module(module))
+
+
+if __name__ == '__main__':
+    unittest.main()
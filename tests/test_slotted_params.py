@@ -0,0 +1,75 @@
+"""Checks that the classes made by make_params_class mirror the parsed Namespace."""
+import unittest
+from typing import Any, List
+
+from hiargparse import ArgsProvider, Arg, ChildProvider, ArgumentParser, SlottedParams
+
+
+class GrandSon:
+    @classmethod
+    def get_args_provider(cls) -> ArgsProvider:
+        return ArgsProvider(args=[
+            Arg('huga', None, type=str),
+            Arg('piyo', 0.99),
+            Arg('many', type=int, action='append'),
+        ])
+
+
+def _provider() -> ArgsProvider:
+    son = ArgsProvider(
+        args=[
+            Arg('hoge', 42),
+            Arg('piyo', 0.95, propagate=False),
+            Arg('pair', type=int, nargs=2, action='append'),
+            Arg('numbers', [1], type=int, nargs='+'),
+        ],
+        propagate_args=[Arg('huga', None, type=str)],
+        child_providers=[ChildProvider(GrandSon, dest='GS')])
+    return ArgsProvider(args=[Arg('foo', 'bar'), Arg('verbose', action='count')],
+                        child_providers=[ChildProvider(provider=son, name='Son')])
+
+
+_ARGVS: List[List[str]] = [
+    [],
+    ['--foo', 'baz', '--verbose', '--verbose', '--Son-huga', 'propagated',
+     '--Son-pair', '1', '2', '--Son-pair', '3', '4', '--Son-numbers', '5', '6',
+     '--Son-GrandSon-piyo', '0.5', '--Son-GrandSon-many', '7', '--Son-GrandSon-many', '8'],
+]
+
+
+class SlottedParamsTest(unittest.TestCase):
+
+    def test_from_namespace(self) -> None:
+        provider = _provider()
+        parser = ArgumentParser()
+        provider.add_arguments_to_parser(parser)
+        Params = provider.make_params_class()
+        for argv in _ARGVS:
+            with self.subTest(argv=argv):
+                namespace = parser.parse_args(argv)
+                params: Any = Params.from_namespace(namespace)
+                self.assertEqual(params._asdict(), namespace._asdict())
+                self.assertEqual(params.Son.GS.huga, namespace.Son.GS.huga)
+                self.assertEqual(params.Son.GS.many, namespace.Son.GS.many)
+                self.assertEqual(params, Params.from_namespace(namespace))
+        params = Params.from_namespace(parser.parse_args(_ARGVS[1]))
+        self.assertEqual(params.Son.GS.huga, 'propagated')
+        self.assertEqual(params.Son.pair, [[1, 2], [3, 4]])
+        self.assertEqual(type(params.Son.GS).__name__, 'Params_Son_GS')
+        self.assertEqual(Params.__annotations__['verbose'], int)
+
+    def test_base_class(self) -> None:
+        parser = ArgumentParser()
+        _provider().add_arguments_to_parser(parser)
+        with self.assertRaises(TypeError):
+            SlottedParams.from_namespace(parser.parse_args([]))
+
+        class Handmade(SlottedParams):
+            __slots__ = ()
+
+        with self.assertRaisesRegex(TypeError, 'Handmade'):
+            Handmade.from_namespace(parser.parse_args([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,21 @@
+"""Checks of the suggestions for misspelled options."""
+import unittest
+
+from hiargparse import ArgumentParser
+
+
+class SuggestionIndexTest(unittest.TestCase):
+
+    def test_options_changed(self) -> None:
+        parser = ArgumentParser(add_help=False)
+        parser.add_argument('--alpha')
+        self.assertEqual(parser.get_suggestion_index().suggest('--alpah')[:1], ['--alpha'])
+        parser.add_argument('--gamma')
+        self.assertEqual(parser.get_suggestion_index().suggest('--gama')[:1], ['--gamma'])
+        group = parser.add_argument_group('group')
+        group.add_argument('--delta')
+        self.assertEqual(parser.get_suggestion_index().suggest('--detla')[:1], ['--delta'])
+
+
+if __name__ == '__main__':
+    unittest.main()
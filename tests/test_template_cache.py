@@ -0,0 +1,37 @@
+"""Checks of the (opt-in, bounded) template cache."""
+import unittest
+
+from hiargparse import ArgsProvider, Arg, ConfigureFileType, TemplateCache
+
+
+class TemplateCacheTest(unittest.TestCase):
+
+    def test_off_by_default(self) -> None:
+        self.assertIsNone(ArgsProvider.template_cache)
+        self.assertIsNone(ArgsProvider(args=[Arg('hoge', 0)]).template_cache)
+
+    def test_hit(self) -> None:
+        provider = ArgsProvider(args=[Arg('hoge', 0)])
+        provider.template_cache = TemplateCache()
+        writer = ConfigureFileType.yaml.get_writer
+        first = provider.write_out_configure_arguments(writer())
+        second = provider.write_out_configure_arguments(writer())
+        self.assertEqual(first, second)
+        self.assertEqual((provider.template_cache.hits, provider.template_cache.misses), (1, 1))
+
+    def test_least_recently_used(self) -> None:
+        cache = TemplateCache(maxsize=2)
+        cache.put('a', (), 'A')
+        cache.put('b', (), 'B')
+        self.assertEqual(cache.get('a', (), False), 'A')
+        cache.put('c', (), 'C')
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b', (), False))
+        self.assertEqual(cache.get('a', (), False), 'A')
+        self.assertEqual(cache.get('c', (), False), 'C')
+        with self.assertRaises(ValueError):
+            TemplateCache(maxsize=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Concurrent parsing and template writing with a shared provider and parser.
+
+Every result must be identical to the one computed in a single thread.
+"""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any
+
+from hiargparse import ArgumentParser, ArgsProvider, ConfigureFileType
+from hiargparse.miscs import DirtyAccessToArgparse
+
+from benchmarks.synthetic_trees import TreeShape, make_provider
+
+
+def make_argvs(option_strings: List[str], number: int) -> List[List[str]]:
+    """Make various argvs which set a few options to various values."""
+    argvs = list()
+    for index in range(number):
+        argv: List[str] = []
+        for offset in range(3):
+            option_string = option_strings[(index * 7 + offset * 13) % len(option_strings)]
+            argv += [option_string, str(index + offset)]
+        argvs.append(argv)
+    return argvs
+
+
+class ThreadSafetyTest(unittest.TestCase):
+    parses = 2000
+    writes = 60
+    workers = 32
+
+    def setUp(self) -> None:
+        self.provider = make_provider(TreeShape(depth=2, fan_out=3, args_per_node=6,
+                                                propagation_density=0.34))
+        self.parser = ArgumentParser()
+        self.provider.add_arguments_to_parser(self.parser)
+        option_strings = [action.option_strings[0]
+                          for action in DirtyAccessToArgparse.get_actions(self.parser)
+                          if action.dest != 'help']
+        self.argvs = make_argvs(option_strings, self.parses)
+        # the template cache would hide concurrent registrations
+        cache = ArgsProvider.template_cache
+        ArgsProvider.template_cache = None
+        self.addCleanup(setattr, ArgsProvider, 'template_cache', cache)
+
+    def test_concurrent_parses_and_writes(self) -> None:
+        # expected results in a single thread
+        expected = [self.parser.parse_args(argv)._asdict() for argv in self.argvs]
+        file_types = [ConfigureFileType.toml, ConfigureFileType.yaml, ConfigureFileType.json]
+        expected_templates: Dict[ConfigureFileType, str] = {
+            file_type: self.provider.write_out_configure_arguments(file_type.get_writer())
+            for file_type in file_types}
+
+        def parse(index: int) -> Any:
+            return self.parser.parse_args(self.argvs[index])._asdict()
+
+        def write(index: int) -> str:
+            # registers to fresh parsers and expands help texts concurrently
+            file_type = file_types[index % len(file_types)]
+            return self.provider.write_out_configure_arguments(file_type.get_writer())
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # map submits all at once, so the writes and the parses run together
+            write_iterator = executor.map(write, range(self.writes))
+            parse_iterator = executor.map(parse, range(self.parses))
+            write_results = list(write_iterator)
+            parse_results = list(parse_iterator)
+
+        for index, result in enumerate(parse_results):
+            self.assertEqual(result, expected[index], msg=self.argvs[index])
+        for index, template in enumerate(write_results):
+            self.assertEqual(template, expected_templates[file_types[index % len(file_types)]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Checks that the values written by ValuesWriter are read back."""
+import io
+import unittest
+from typing import List
+
+from hiargparse import ArgsProvider, Arg, ChildProvider, ArgumentParser, ConfigureFileType
+
+
+def _provider() -> ArgsProvider:
+    child = ArgsProvider(args=[
+        Arg('hoge', 3),
+        Arg('many', type=int, action='append'),
+        Arg('pair', type=int, nargs=2, action='append'),
+        Arg('more', [0], type=int, action='append'),
+    ])
+    return ArgsProvider(args=[
+        Arg('flag', False),
+        Arg('enabled', True),
+        Arg('store-true', action='store_true'),
+        Arg('store-false', action='store_false'),
+        Arg('verbose', action='count'),
+        Arg('numbers', [1], type=int, nargs='+'),
+        Arg('scale', 1.5),
+        Arg('name', 'x'),
+        Arg('optional', nargs='?', const='c'),
+    ], child_providers=[ChildProvider(provider=child, name='Son')])
+
+
+_ARGVS: List[List[str]] = [
+    [],
+    ['--flag', 'x', '--enabled', '', '--store-true', '--store-false',
+     '--verbose', '--verbose', '--numbers', '4', '5', '--scale', '-2.5',
+     '--name', 'y z', '--optional',
+     '--Son-hoge', '-1', '--Son-many', '1', '--Son-many', '2',
+     '--Son-pair', '1', '2', '--Son-pair', '3', '4', '--Son-more', '7'],
+    ['--verbose', '--Son-many', '5', '--optional', 'd'],
+]
+
+
+class ValuesWriterTest(unittest.TestCase):
+
+    def test_round_trip(self) -> None:
+        provider = _provider()
+        parser = ArgumentParser()
+        provider.add_arguments_to_parser(parser)
+        for argv in _ARGVS:
+            namespace = parser.parse_args(argv)
+            for file_type in ConfigureFileType:
+                for sparse in (False, True):
+                    with self.subTest(argv=argv, file_type=file_type, sparse=sparse):
+                        document = io.BytesIO()
+                        provider.write_configure_file(document, file_type.get_writer(),
+                                                      namespace=namespace, sparse=sparse)
+                        document.seek(0)
+                        read = provider.read_configure_file(document, file_type.get_reader())
+                        self.assertEqual(read._asdict(), namespace._asdict())
+
+    def test_bool_without_token(self) -> None:
+        # no token gives False
+        provider = ArgsProvider(args=[
+            Arg('flag', True, type=lambda string: string == 'yes' or None)])
+        parser = ArgumentParser()
+        provider.add_arguments_to_parser(parser)
+        namespace = parser.parse_args([])
+        namespace.flag = False
+        with self.assertRaisesRegex(ValueError, 'flag'):
+            provider.write_out_configure_arguments(ConfigureFileType.yaml.get_writer(), namespace)
+
+    def test_append_const(self) -> None:
+        provider = ArgsProvider(args=[Arg('mark', action='append_const', const=1)])
+        parser = ArgumentParser()
+        provider.add_arguments_to_parser(parser)
+        writer = ConfigureFileType.json.get_writer
+        provider.write_out_configure_arguments(writer(), parser.parse_args([]))
+        with self.assertRaisesRegex(ValueError, 'append_const'):
+            provider.write_out_configure_arguments(writer(), parser.parse_args(['--mark']))
+
+    def test_unreachable_values(self) -> None:
+        provider = ArgsProvider(args=[Arg('verbose', action='count'),
+                                      Arg('more', [0], type=int, action='append')])
+        reader = ConfigureFileType.json.get_reader()
+        with self.assertRaisesRegex(ValueError, 'verbose'):
+            provider.read_configure_arguments('{"verbose": -1}', reader)
+        with self.assertRaisesRegex(ValueError, 'more'):
+            provider.read_configure_arguments('{"more": [1]}', reader)
+
+
+if __name__ == '__main__':
+    unittest.main()